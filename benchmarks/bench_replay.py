@@ -0,0 +1,69 @@
+# bench_replay.py
+# Input-to-frame latency of the real editor, headless: a keystroke trace is
+# fed through a pipe and every key is timed until the frame that shows it.
+#
+#   python benchmarks/bench_replay.py                       # Synthetic session over a 10k-word post
+#   python benchmarks/bench_replay.py --words 100000 --memory
+#   python blim.py --record-keys session.jsonl              # Record a real session...
+#   python benchmarks/bench_replay.py --trace session.jsonl # ...and replay it
+#
+# Exits 1 when the median latency is over --budget (KEYSTROKE_BUDGET) or p99 is
+# over --spike-budget (SPIKE_BUDGET).
+# --memory replays the trace a second time under tracemalloc for the peak,
+# since tracing slows every allocation and would skew the latencies.
+
+import os
+import sys
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_markdown import synthetic_post
+from core.replay import KEYSTROKE_BUDGET, SPIKE_BUDGET, default_trace, load_trace, replay
+
+BROWSER_POSTS = 40  # Cached post titles, so the browser has something to walk through offline
+
+
+def make_editor(words):
+    from blim import BlimEditor
+    editor = BlimEditor(test_mode=True)
+    editor.blog_id = "bench"
+    for i in range(BROWSER_POSTS):
+        editor.post_store.put_summary("bench", {'id': str(i), 'title': f"Post {i}", 'status': 'LIVE',
+                                                'updated': f"2024-01-01T00:00:{i:02d}Z"})
+    editor.body_field.text = synthetic_post(words)
+    editor.memory.settle()  # As blim.py does once startup's warm-up has landed
+    return editor
+
+
+def run(words, steps, trace_memory=False):
+    from blim import build_application
+    editor = make_editor(words)
+    try:
+        return replay(lambda **io: build_application(editor, **io), steps, trace_memory=trace_memory)
+    finally:
+        editor.memory.restore()
+        editor.api.shutdown()
+        editor.spell_worker.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay keystrokes through Blim and time every frame.")
+    parser.add_argument("--words", type=int, default=10_000, help="Size of the post being edited")
+    parser.add_argument("--trace", metavar="JSONL", help="Recorded trace (blim.py --record-keys) instead of the synthetic one")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak memory (second, traced pass)")
+    parser.add_argument("--budget", type=float, default=KEYSTROKE_BUDGET * 1000, help="Median (p50) budget in ms")
+    parser.add_argument("--spike-budget", type=float, default=SPIKE_BUDGET * 1000, help="p99 budget in ms")
+    args = parser.parse_args()
+
+    steps = load_trace(args.trace) if args.trace else default_trace(synthetic_post(300))
+    print(f"Replaying {len(steps)} steps over a {args.words}-word post")
+    result = run(args.words, steps)
+    print(result.report())
+    if args.memory:
+        print(run(args.words, steps, trace_memory=True).report().splitlines()[-1])
+
+    stats = result.percentiles()
+    p50, p99 = stats["p50"] * 1000, stats["p99"] * 1000
+    ok = p50 <= args.budget and p99 <= args.spike_budget
+    print(f"p50 {p50:.2f} ms (budget {args.budget:.0f} ms), p99 {p99:.2f} ms (budget {args.spike_budget:.0f} ms): "
+          f"{'OK' if ok else 'OVER BUDGET'}")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,66 @@
+# bench_startup.py
+# Time to first keystroke, in fresh processes: blim.py is imported, the editor
+# and Application are built and the first frame is drawn headless, exactly the
+# phases --profile-startup reports.
+#
+#   python benchmarks/bench_startup.py              # 5 runs
+#   python benchmarks/bench_startup.py --runs 20 --budget 400
+#
+# Exits 1 when the median run is over --budget (STARTUP_BUDGET). The tests only
+# check the phases and a generous bound; this is where the real budget is held.
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def once():
+    """One cold start in this process; prints the startup marks as JSON."""
+    sys.path.append(ROOT)
+    import time
+    from blim import STARTUP_MARKS, BlimEditor, build_application  # First, so its imports are timed cold
+    from prompt_toolkit.input import create_pipe_input
+    from core.replay import headless_output
+    with create_pipe_input() as pipe:
+        editor = BlimEditor(test_mode=True)  # No config, token or dictionary from the user's setup
+        STARTUP_MARKS.append(("editor", time.perf_counter()))
+        app = build_application(editor, input=pipe, output=headless_output())
+        STARTUP_MARKS.append(("application", time.perf_counter()))
+        app.after_render += lambda _app: app.future.done() or app.exit()  # Quit once drawn
+        app.run()
+    editor.api.shutdown()
+    editor.spell_worker.shutdown()
+    print(json.dumps(STARTUP_MARKS))
+
+
+def run(runs):
+    """Returns the marks of every run, each from a new interpreter so imports are cold."""
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--once"], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time Blim's start-up to the first frame.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="Median budget in ms (default STARTUP_BUDGET)")
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.once:
+        once()
+        sys.exit(0)
+
+    sys.path.append(ROOT)
+    from blim import STARTUP_BUDGET, startup_report
+    budget = args.budget / 1000 if args.budget else STARTUP_BUDGET
+    results = sorted(run(args.runs), key=lambda marks: marks[-1][1] - marks[0][1])
+    median = results[len(results) // 2]
+    print(f"{args.runs} cold starts, best {(results[0][-1][1] - results[0][0][1]) * 1000:.1f} ms; median run:")
+    print(startup_report(median, budget=budget))
+    sys.exit(0 if median[-1][1] - median[0][1] <= budget else 1)
@@ -0,0 +1,183 @@
+# bench_suite.py
+# The editor's hot paths over synthetic English and Spanish posts, with JSON
+# baselines so a change can be checked for regressions instead of guessed at.
+#
+#   python benchmarks/bench_suite.py                         # 1k/10k/100k words, en + es
+#   python benchmarks/bench_suite.py --save baseline.json    # Record a baseline
+#   python benchmarks/bench_suite.py --compare baseline.json # Exit 1 if anything regressed
+#   python benchmarks/bench_suite.py --sizes 1000 --langs es --cases lex_document
+#   python benchmarks/bench_suite.py --compare baseline.json --threshold 2  # Noisy machine
+#
+# Timings are the best of several runs, in seconds. Baselines are machine
+# specific: record one before a change and compare against it after.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from prompt_toolkit.document import Document
+from bench_markdown import WORDS, synthetic_post
+
+WORDS_ES = ("el la de que en un una por con para escritor borrador entrada blog "
+            "terminal café mañana canción corazón también después montaña añoranza "
+            "publicación pequeño jardín otoño").split()
+CORPORA = {"en": WORDS + ["teh", "blimpy"], "es": WORDS_ES + ["qeu", "blimpy"]}  # A few misspellings
+SIZES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 1.25  # current / baseline above this is a regression
+THRESHOLDS = {
+    # Sub-millisecond calls are noisier
+    "keystroke": 1.5,
+    "get_status_text": 1.5,
+    "is_dirty": 1.5,
+}
+MIN_TIME = 0.2  # Keep repeating a case until this much time has been spent on it
+
+
+def best_of(func, setup=None, min_time=MIN_TIME, max_runs=50):
+    if setup:
+        setup()
+    func()  # Warm-up: the first call in a fresh process pays for imports and caches
+    best, spent, runs = float("inf"), 0.0, 0
+    while runs < 3 or (spent < min_time and runs < max_runs):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    return best
+
+
+def make_editor(lang, text):
+    from blim import BlimEditor
+    editor = BlimEditor(test_mode=True)
+    editor.lang = lang
+    editor._reload_dictionary()  # First use of a language compiles its index: keep it out of the timings
+    editor.body_field.text = text
+    return editor
+
+
+def bench_case(case, editor, text):
+    from blim import BlimLexer
+    document = Document(text)
+    lines = range(document.line_count)
+
+    if case == "lex_document":
+        editor.show_spelling_errors = False
+        lexer = BlimLexer(editor)
+        def run():
+            get_line = lexer.lex_document(document)
+            for i in lines: get_line(i)
+        return best_of(run, setup=lexer.clear_cache)
+    if case == "lex_document_spell":
+        editor.show_spelling_errors = True
+        lexer = BlimLexer(editor)
+        def run():
+            get_line = lexer.lex_document(document)
+            for i in lines: get_line(i)
+        def setup():
+            lexer.clear_cache()
+            editor.spell_verdicts = type(editor.spell_verdicts)()  # Cold verdicts too
+        return best_of(run, setup=setup)
+    if case == "parse_markdown":
+        return best_of(lambda: editor._parse_markdown(text))
+    if case == "clean_html_for_editor":
+        html = editor._parse_markdown(text)
+        return best_of(lambda: editor.clean_html_for_editor(html))
+    if case in ("keystroke", "get_status_text", "is_dirty"):
+        # One keystroke in the middle of the post, then the redraw that follows it.
+        # "keystroke" is the edit alone (text copy plus change handlers), the floor
+        # the per-frame checks are read against.
+        buffer, middle = editor.body_buffer, len(text) // 2
+        def keystroke():
+            buffer.text = buffer.text[:middle] + "x" + buffer.text[middle:]
+        if case == "keystroke":
+            return best_of(keystroke)
+        return best_of(getattr(editor, case), setup=keystroke)
+    if case == "run_spellcheck":
+        return best_of(editor.run_spellcheck)  # No event loop here, so the worker runs it inline
+    if case == "reload_dictionary":
+        return best_of(editor._reload_dictionary)
+    raise ValueError(f"unknown case {case}")
+
+
+CASES = ("lex_document", "lex_document_spell", "parse_markdown", "clean_html_for_editor",
+         "keystroke", "get_status_text", "is_dirty", "run_spellcheck", "reload_dictionary")
+
+
+def run_suite(sizes=SIZES, langs=tuple(CORPORA), cases=CASES, report=print):
+    results = {}
+    for lang in langs:
+        for size in sizes:
+            text = synthetic_post(size, vocabulary=CORPORA[lang])
+            editor = make_editor(lang, text)
+            for case in cases:
+                key = f"{case}/{lang}/{size}"
+                results[key] = bench_case(case, editor, text)
+                report(f"  {key:<36} {results[key] * 1000:10.3f} ms")
+            editor.api.shutdown()
+            editor.spell_worker.shutdown()
+    return results
+
+
+def compare(results, baseline, threshold=None):
+    """Returns [(key, ratio, threshold)] for every case slower than its threshold allows.
+
+    threshold (--threshold) loosens every case: each one is allowed the larger of
+    it and the case's own threshold from the baseline.
+    """
+    default = baseline.get("default_threshold", DEFAULT_THRESHOLD)
+    regressions = []
+    for key, seconds in results.items():
+        before = baseline.get("results", {}).get(key)
+        if not before:
+            continue
+        case = key.split("/")[0]
+        allowed = baseline.get("thresholds", {}).get(case, THRESHOLDS.get(case, default))
+        if threshold is not None:
+            allowed = max(threshold, allowed)
+        ratio = seconds / before
+        if ratio > allowed:
+            regressions.append((key, ratio, allowed))
+    return regressions
+
+
+def save_baseline(path, results):
+    data = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(),
+        "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "default_threshold": DEFAULT_THRESHOLD,
+        "thresholds": THRESHOLDS,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Blim's hot paths.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--langs", default=",".join(CORPORA))
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--save", metavar="JSON", help="Write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="Fail if slower than this baseline allows")
+    parser.add_argument("--threshold", type=float, help="Allow at least this ratio for every case")
+    args = parser.parse_args()
+
+    results = run_suite(sizes=[int(s) for s in args.sizes.split(",")], langs=args.langs.split(","),
+                        cases=args.cases.split(","))
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"baseline -> {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for key, ratio, threshold in regressions:
+            print(f"  REGRESSION {key}: {ratio:.2f}x baseline (allowed {threshold:.2f}x)")
+        print(f"{len(regressions)} regression(s) against {args.compare}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,52 @@
+# bench_tokenizer.py
+# Per-line cost of the single-pass inline tokenizer vs. the old five-regex scan.
+# Run with: python benchmarks/bench_tokenizer.py
+
+import os
+import re
+import sys
+import timeit
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.markdown import iter_inline_spans
+
+# The rules BlimLexer used before the tokenizer (one re.finditer pass each, then a sort)
+LEGACY_RULES = [
+    (r'\*\*.*?\*\*', 'class:md.bold'),
+    (r'(?<!\*)\*[^*].*?[^*]\*(?!\*)', 'class:md.italic'),
+    (r'~~.*?~~', 'class:md.strike'),
+    (r'\[.*?\]\(.*?\)', 'class:md.link'),
+    (r'`.*?`', 'class:md.code'),
+]
+
+SAMPLE_LINES = [
+    "Plain prose without any markup at all, just a sentence that goes on for a while.",
+    "Some **bold words** and *italic ones* with a [link](https://example.com) at the end.",
+    "A **bold [link](https://example.com) inside** plus ~~struck~~ and `code()` spans.",
+    "* a list item with *emphasis* and more **strong** text and **another** one",
+]
+
+
+def legacy_spans(line):
+    matches = []
+    for pattern, style in LEGACY_RULES:
+        for m in re.finditer(pattern, line):
+            matches.append((m.start(), m.end(), style))
+    matches.sort()
+    return matches
+
+
+def single_pass_spans(line):
+    return list(iter_inline_spans(line))
+
+
+def bench(func, number=20000):
+    per_call = min(timeit.repeat(lambda: [func(l) for l in SAMPLE_LINES], number=number, repeat=3))
+    return per_call / (number * len(SAMPLE_LINES)) * 1e6
+
+
+if __name__ == "__main__":
+    legacy = bench(legacy_spans)
+    single = bench(single_pass_spans)
+    print(f"legacy five-pass : {legacy:6.2f} µs/line")
+    print(f"single-pass      : {single:6.2f} µs/line")
+    print(f"speed-up         : {legacy / single:6.2f}x")
@@ -16,10 +16,13 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
-import os, sys, time, json, re, asyncio
+import os, sys, time
+STARTUP_MARKS = [("start", time.perf_counter())]  # (phase, perf_counter) for --profile-startup
+import json, re, asyncio
+from collections import OrderedDict
 from prompt_toolkit import Application
 from prompt_toolkit.enums import EditingMode
-from prompt_toolkit.layout import Layout, HSplit, VSplit, Window, ConditionalContainer, DynamicContainer
+from prompt_toolkit.layout import Layout, HSplit, VSplit, Window, ConditionalContainer, DynamicContainer, FormattedTextControl
 from prompt_toolkit.filters import Condition
 from prompt_toolkit.widgets import TextArea, Label
 from prompt_toolkit.key_binding import KeyBindings
@@ -30,6 +33,19 @@ from prompt_toolkit.application import get_app
 
 # Local imports from core/assets.py
 from core.assets import get_banner, HELP_TEXT, TRANSLATIONS, VERSION
+from core.markdown import iter_inline_spans, render_html, html_to_markdown
+from core.spelling import SpellWorker, VerdictCache, load_dictionary, find_misspelled
+from core.tracking import WordCounter, DirtyTracker, SavedFields
+from core.recovery import RecoveryJournal
+from core.api import ApiWorker, PAGE_SIZE, push_post, get_post, list_posts, replay_outbox, summarize
+from core.outbox import Outbox
+from core.bulk import OPERATIONS as BULK_OPERATIONS, plan_bulk, run_bulk
+from core.auth import load_credentials, build_service, needs_refresh, refresh_credentials
+from core.postcache import PostStore
+from core.prefetch import PostPrefetcher
+from core.perf import PerfMonitor
+from core.memory import MemoryGovernor
+STARTUP_MARKS.append(("imports", time.perf_counter()))
 
 # --- Style Definition ---
 blim_style = Style.from_dict({
@@ -67,75 +83,120 @@ ghost_style = Style.from_dict({
     'line-number.current': 'fg:#000000 bg:#000000',
 })
 
+# --- Post Browser ---
+BROWSER_ROWS = 12      # Posts visible at once in the browser window
+BROWSER_PREFETCH = 4   # Fetch the next page when the selection gets this close to the end
+
+# --- Startup ---
+# Seconds from process start to the first frame (= first keystroke accepted)
+STARTUP_BUDGET = 0.5
+
 # --- Lexer for Spell Checking plus markdown highlighting ---
+# Max number of lexed lines kept per lexer. Bounded so memory stays flat on long posts.
+LEXER_CACHE_SIZE = 2048
+WORD_PATTERN = re.compile(r'\w+')
+
 class BlimLexer(Lexer):
-    def __init__(self, editor):
+    def __init__(self, editor, cache_size=LEXER_CACHE_SIZE):
         self.editor = editor
-        self.md_rules = [
-            (r'\*\*.*?\*\*', 'class:md.bold'),
-            (r'(?<!\*)\*[^*].*?[^*]\*(?!\*)', 'class:md.italic'),
-            (r'~~.*?~~', 'class:md.strike'),      
-            (r'\[.*?\]\(.*?\)', 'class:md.link'), 
-            (r'`.*?`', 'class:md.code'),
-        ]
+        # Line-level LRU: (line text, spellcheck on, language, dictionary generation) -> fragments
+        self.cache_size = cache_size
+        self._line_cache = OrderedDict()
+        self.fragments_built = 0  # Running total of fragments lexed (cache misses), for :perf
+
+    def _cache_key(self, line_text):
+        spell_on = self.editor.show_spelling_errors and self.editor.spell is not None
+        if not spell_on:
+            return (line_text, False, None, 0)
+        return (line_text, True, self.editor.lang, self.editor.dictionary_generation)
+
+    def clear_cache(self):
+        self._line_cache.clear()
 
     def lex_document(self, document: Document):
+        cursor_row = document.cursor_position_row
+        if self.editor.show_spelling_errors and self.editor.spell is not None:
+            self._resolve_visible_words(document, cursor_row)
+
         def get_line(lineno):
             line_text = document.lines[lineno]
-            
-            # --- THE OPTIMIZED KILL-SWITCH ---
-            if not self.editor.show_spelling_errors or self.editor.spell is None:
-                # If it's a simple line (most lines), return it as one single object.
-                # This prevents the creation of thousands of fragment tuples in RAM.
-                if not any(char in line_text for char in ('#', '>', '*', '_', '`')):
-                    return [('', line_text)]
-                
-                # Otherwise, do the standard markdown processing
-                if line_text.startswith('#'): return [('class:md.header', line_text)]
-                if line_text.startswith('>'): return [('class:md.quote', line_text)]
-                
-                formatted_line = []
-                last_pos = 0
-                matches = []
-                for pattern, style in self.md_rules:
-                    for m in re.finditer(pattern, line_text):
-                        matches.append((m.start(), m.end(), style))
-                matches.sort()
-                for start, end, style in matches:
-                    if start > last_pos:
-                        formatted_line.append(('', line_text[last_pos:start]))
-                    formatted_line.append((style, line_text[start:end]))
-                    last_pos = end
-                if last_pos < len(line_text):
-                    formatted_line.append(('', line_text[last_pos:]))
-                return formatted_line
-
-            # --- NORMAL SPELLCHECK PATH (Only when Ctrl+D is ON) ---
-            line_start_index = document.translate_row_col_to_index(lineno, 0)
-            if line_text.startswith('#'): return [('class:md.header', line_text)]
-            if line_text.startswith('>'): return [('class:md.quote', line_text)]
-            formatted_line = []
-            last_pos = 0
-            matches = []
-            for pattern, style in self.md_rules:
-                for m in re.finditer(pattern, line_text):
-                    matches.append((m.start(), m.end(), style))
-            matches.sort()
-            for start, end, style in matches:
-                if start > last_pos:
-                    self._add_spellchecked_text(formatted_line, line_text[last_pos:start], 
-                                               line_start_index + last_pos, document.cursor_position)
-                formatted_line.append((style, line_text[start:end]))
-                last_pos = end
-            if last_pos < len(line_text):
-                self._add_spellchecked_text(formatted_line, line_text[last_pos:], 
-                                           line_start_index + last_pos, document.cursor_position)
-            return formatted_line
+            key = self._cache_key(line_text)
+
+            # The cursor line depends on where the user is typing (spellcheck skips the
+            # word under the cursor), so it is never served from or stored in the cache.
+            if key[1] and lineno == cursor_row:
+                line_start_index = document.translate_row_col_to_index(lineno, 0)
+                fragments = self._lex_line(line_text, line_start_index, document.cursor_position)
+                self.fragments_built += len(fragments)
+                return fragments
+
+            cache = self._line_cache
+            fragments = cache.get(key)
+            if fragments is not None:
+                cache.move_to_end(key)
+                return fragments
+
+            # Off the cursor line no word can be "being typed", so positions don't matter
+            fragments = self._lex_line(line_text, 0, -1)
+            self.fragments_built += len(fragments)
+            cache[key] = fragments
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+            return fragments
+        if self.editor.perf.enabled:
+            return self.editor.perf.timed_lexer(self, get_line)
         return get_line
 
+    def _resolve_visible_words(self, document, cursor_row):
+        # The cursor is always on screen, so every visible line lies within one
+        # screen height of it. Words of lines not lexed yet get one batch lookup.
+        try:
+            rows = get_app().output.get_size().rows
+        except Exception:
+            rows = 50
+        lines = document.lines
+        words = set()
+        for line_text in lines[max(0, cursor_row - rows):cursor_row + rows + 1]:
+            if self._cache_key(line_text) not in self._line_cache:
+                words.update(WORD_PATTERN.findall(line_text))
+        if words:
+            self.editor.spell_verdicts.resolve(self.editor.spell, words)
+
+    def _lex_line(self, line_text, line_start_index, cursor_pos):
+        spellcheck = self.editor.show_spelling_errors and self.editor.spell is not None
+
+        # --- THE OPTIMIZED KILL-SWITCH ---
+        # If it's a simple line (most lines), return it as one single object.
+        # This prevents the creation of thousands of fragment tuples in RAM.
+        if not spellcheck and not any(char in line_text for char in ('#', '>', '*', '_', '`')):
+            return [('', line_text)]
+
+        if line_text.startswith('#'): return [('class:md.header', line_text)]
+        if line_text.startswith('>'): return [('class:md.quote', line_text)]
+
+        # Single tokenizer pass shared by the plain and the spellcheck (Ctrl+D) paths
+        formatted_line = []
+        last_pos = 0
+        for start, end, style in iter_inline_spans(line_text):
+            if start > last_pos:
+                self._add_text(formatted_line, line_text[last_pos:start],
+                               line_start_index + last_pos, cursor_pos, spellcheck)
+            formatted_line.append((style, line_text[start:end]))
+            last_pos = end
+        if last_pos < len(line_text):
+            self._add_text(formatted_line, line_text[last_pos:],
+                           line_start_index + last_pos, cursor_pos, spellcheck)
+        return formatted_line
+
+    def _add_text(self, fragments, text, start_index, cursor_pos, spellcheck):
+        if spellcheck:
+            self._add_spellchecked_text(fragments, text, start_index, cursor_pos)
+        else:
+            fragments.append(('', text))
+
     def _add_spellchecked_text(self, fragments, text, start_index, cursor_pos):
         last_pos = 0
-        for match in re.finditer(r'\w+', text):
+        for match in WORD_PATTERN.finditer(text):
             word = match.group()
             word_start = start_index + match.start()
             word_end = start_index + match.end()
@@ -143,7 +204,7 @@ class BlimLexer(Lexer):
             if match.start() > last_pos:
                 fragments.append(('', text[last_pos:match.start()]))
             
-            is_unknown = self.editor.spell is not None and word.lower() not in self.editor.spell
+            is_unknown = self.editor.spell is not None and self.editor.spell_verdicts.is_unknown(self.editor.spell, word)
             is_being_typed = word_start <= cursor_pos <= word_end
 
             if self.editor.show_spelling_errors and is_unknown and not is_being_typed:
@@ -163,11 +224,12 @@ class BlimEditor:
         self._load_paths()
         self._load_config()
         self.waiting_for_publish_confirm = False
+        self.pending_bulk = None  # (op, args, posts) waiting for y/n in the command bar
+        self.bulk_progress = None  # (done, total) while a bulk operation runs
         
         # State
         self.current_post_id = None
         self.post_status = "NEW"
-        self.last_saved_content = ""
         self.is_warning_mode = False
         self.pending_action = None 
         self.show_help = False
@@ -180,6 +242,9 @@ class BlimEditor:
         self.spell = None 
         self.dictionary_loaded = False
         self.show_spelling_errors = False  
+        self.dictionary_generation = 0  # Bumped on every dictionary change; part of the lexer cache key
+        self.spell_worker = SpellWorker()  # Dictionary loads & full checks run off the UI loop
+        self.spell_verdicts = VerdictCache()  # Per-word known/unknown for the lexer
         
         # Just ensure the directory exists for test mode, but DO NOT load anything
         if self.test_mode:
@@ -203,8 +268,29 @@ class BlimEditor:
         # self.service = self.authenticate()
         self.service = None
         self.is_offline = False
+        self.credentials = None  # google-auth Credentials behind self.service
+        self._after_connect = []  # Continuations waiting for the "auth" job
+        self._consent_wanted = False  # One of them may open the OAuth browser flow
+        self.api = ApiWorker()  # Network calls never run on the UI loop
+        self.post_store = PostStore(":memory:" if self.test_mode else self.post_cache_path)
+        self.prefetcher = PostPrefetcher(self.api)  # Highlighted browser post and its neighbours
+        self._opening = None  # Post id of the last fetch_and_load(); older loads don't land
+        self._queued_save = None  # is_draft of a save requested while another was in flight
+        self._save_connecting = False  # A save_post() is waiting for _connect to authenticate
+        self.remote_status = None  # 'DRAFT' / 'LIVE' as Blogger has it, None for unsaved posts
+        self.saved_fields = SavedFields()  # Title/body/labels hashes as last saved, for partial saves
+        self._last_edit = None  # monotonic time of the last unsaved keystroke, for autosave
+        self.outbox = Outbox(None if self.test_mode else self.outbox_path)  # Saves waiting for a connection
+        self._local_key = None  # Outbox key of a new post saved while offline
         self.posts_list = []
         self.browser_index = 0
+        self.browser_offset = 0        # First post shown in the browser's scrolling window
+        self.next_page_token = None    # Blogger pageToken for the next page of posts
+        self.browser_has_more = False  # More pages exist beyond posts_list
+        self.recovery = None  # RecoveryJournal, see _recovery_journal()
+        self.memory = MemoryGovernor()  # Decides when to collect garbage (see core/memory.py)
+        self.perf = PerfMonitor(self.memory)  # Hooked into the app only while :perf is on
+        self.show_perf = False
 
         # UI & Layout 
         self._init_ui_components()
@@ -228,8 +314,11 @@ class BlimEditor:
         self.config_path = os.path.join(config_dir, 'config.json')
         self.secrets_path = os.path.join(config_dir, 'client_secrets.json')
         self.token_path = os.path.join(config_dir, 'token.json')
+        self.post_cache_path = os.path.join(config_dir, 'posts.db')
+        self.outbox_path = os.path.join(config_dir, 'outbox.json')
         self.recovery_path = os.path.join(config_dir, '.blim_recovery.json') 
         self.custom_dict_path = os.path.join(config_dir, 'custom_dictionary.txt')
+        self.dict_dir = os.path.join(config_dir, 'dicts')  # Compiled dictionary indexes (see core/dictionary.py)
 
     def _load_config(self):
         if not os.path.exists(self.config_path):
@@ -240,24 +329,45 @@ class BlimEditor:
             self.blog_id = str(config.get("blog_id")).strip()
             self.word_goal = config.get("word_goal", 500)
             self.lang = config.get("language", "es")
+            self.autosave_seconds = config.get("autosave_seconds", 30)  # Idle time before a draft autosaves; 0 disables
 
     def _t(self, key):
         return TRANSLATIONS.get(self.lang, TRANSLATIONS['en'])["ui"][key]
 
     def _reload_dictionary(self):
-        from spellchecker import SpellChecker #<-- Import here to reduce initial load time
-        import gc
-        self.spell = None
-        gc.collect()
-
-        # Load the main heavy dictionary
-        self.spell = SpellChecker(language=self.lang)
-        
-        # Load your custom words here
-        if os.path.exists(self.custom_dict_path):
-            self.spell.word_frequency.load_text_file(self.custom_dict_path)
-            
+        # Blocking load. Interactive code should use request_dictionary() instead.
+        self._drop_dictionary()
+        self.memory.release("dictionary reload")
+        self._install_dictionary(load_dictionary(self.lang, self.dict_dir, self.custom_dict_path))
+
+    def _install_dictionary(self, spell):
+        if spell is not self.spell:
+            self._drop_dictionary()
+        self.spell = spell
         self.dictionary_loaded = True
+        self.dictionary_generation += 1
+
+    def _drop_dictionary(self):
+        # Unmaps the old index files on the spell worker, after any check still reading them
+        spell, self.spell = self.spell, None
+        if spell is not None and hasattr(spell, "close"):
+            self.spell_worker.submit("unload", spell.close)
+
+    def request_dictionary(self):
+        # Loads the current language in the background, then checks the document
+        lang = self.lang
+        self._drop_dictionary()
+        self.last_spell_report = self._t("dict_loading")
+
+        def _done(result):
+            if isinstance(result, Exception):
+                self.last_spell_report = self._t("dict_error")
+            elif lang == self.lang and self.show_spelling_errors:
+                self._install_dictionary(result)
+                self.run_spellcheck()
+            self.spell_check()
+
+        self.spell_worker.submit("load", load_dictionary, lang, self.dict_dir, self.custom_dict_path, on_done=_done)
 
     def _init_ui_components(self):
         # UI Fields
@@ -276,6 +386,10 @@ class BlimEditor:
         )
         self.body_field.window.soft_wrap = True
         self.body_buffer = self.body_field.buffer  
+        self.word_counter = WordCounter(self.body_buffer)
+        self.dirty_tracker = DirtyTracker(self.body_buffer)  # Holds the last saved content's hash
+        for buffer in (self.title_field.buffer, self.tags_field.buffer, self.body_buffer):
+            buffer.on_text_changed += self._note_edit
 
         self.command_field = TextArea(
             height=1, 
@@ -285,11 +399,41 @@ class BlimEditor:
             accept_handler=self.handle_normal_input, 
             focus_on_click=True
         )
-        self.warning_field = TextArea(height=1, prompt=lambda: self._t("warning_prompt"), style='class:status-warn', multiline=False, accept_handler=self.handle_warning_input, focus_on_click=True)
-        
-        # Static Text Areas
-        self.help_field = TextArea(read_only=True, style='class:help-text')
-        self.browser_field = TextArea(read_only=True, style='class:help-text')
+        # Warning prompt, help and browser are built on first use (see properties below)
+        self._warning_field = self._warning_view = self._help_field = self._browser_field = None
+        self._perf_view = None
+        self._hidden_pane = Window(height=0)
+
+    # --- Rarely used panes, built on first use ---
+    @property
+    def warning_field(self):
+        if self._warning_field is None:
+            self._warning_field = TextArea(height=1, prompt=lambda: self._t("warning_prompt"), style='class:status-warn', multiline=False, accept_handler=self.handle_warning_input, focus_on_click=True)
+        return self._warning_field
+
+    @property
+    def help_field(self):
+        if self._help_field is None:
+            self._help_field = TextArea(read_only=True, style='class:help-text')
+            self._help_field.text = HELP_TEXT.get(self.lang, HELP_TEXT["en"]).strip()
+        return self._help_field
+
+    @property
+    def browser_field(self):
+        if self._browser_field is None:
+            self._browser_field = TextArea(read_only=True, style='class:help-text')
+        return self._browser_field
+
+    def _perf_row(self):
+        if self._perf_view is None:
+            self._perf_view = Window(FormattedTextControl(lambda: "\n".join(self.perf.overlay_lines())),
+                                     height=4, style='class:status-bar')
+        return self._perf_view
+
+    def _warning_row(self):
+        if self._warning_view is None:
+            self._warning_view = VSplit([Window(), self.warning_field, Window()], height=1)
+        return self._warning_view
 
     def _init_layout(self):
         # Rows
@@ -301,7 +445,6 @@ class BlimEditor:
         
         status_bar_view = VSplit([Window(), Label(text=self.get_status_text, style='class:status-bar'), Window()], height=1)
         command_view = VSplit([Window(), self.command_field, Window()], height=1)
-        warning_view = VSplit([Window(), self.warning_field, Window()], height=1)
 
         # Visibility Logic
         self.header_row = DynamicContainer(lambda: self.header_bar if self.is_ui_visible() else Window(height=1))
@@ -322,8 +465,8 @@ class BlimEditor:
                 ]), 
                 filter=Condition(lambda: not self.show_help and not self.show_browser)
             ),
-            ConditionalContainer(content=self.help_field, filter=Condition(lambda: self.show_help)),
-            ConditionalContainer(content=self.browser_field, filter=Condition(lambda: self.show_browser)),
+            DynamicContainer(lambda: self.help_field if self.show_help else self._hidden_pane),
+            DynamicContainer(lambda: self.browser_field if self.show_browser else self._hidden_pane),
         ], width=85) 
 
         # Container Assembly
@@ -339,8 +482,10 @@ class BlimEditor:
                 main_stack, 
                 Window(), 
             ]),
+            # :perf overlay
+            DynamicContainer(lambda: self._perf_row() if self.show_perf else self._hidden_pane),
             # Command Bar
-            DynamicContainer(lambda: warning_view if self.is_warning_mode else command_view),
+            DynamicContainer(lambda: self._warning_row() if self.is_warning_mode else command_view),
             # Status Bar
             ConditionalContainer(
                 content=self.status_row,
@@ -356,45 +501,41 @@ class BlimEditor:
         except:
             return True
     
-    def authenticate(self):
-        from googleapiclient.discovery import build #<-- Import here to reduce initial load time
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        from google.auth.exceptions import TransportError
+    def authenticate(self, interactive=True):
         if self.test_mode:
             self.is_offline = True
             return None
 
         self.is_offline = False 
         try:
-            creds = None
-            if os.path.exists(self.token_path):
-                creds = Credentials.from_authorized_user_file(self.token_path)
-            
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.secrets_path, 
-                        ['https://www.googleapis.com/auth/blogger']
-                    )
-                    creds = flow.run_local_server(port=0)
-                
-                with open(self.token_path, 'w') as token:
-                    token.write(creds.to_json())
-                    
-            return build('blogger', 'v3', credentials=creds)
-        except (TransportError, Exception):
+            creds = load_credentials(self.token_path, self.secrets_path, interactive=interactive)
+            if creds is None:
+                return None  # Nothing stored yet; the first save/browse runs the consent flow
+            self.credentials = creds
+            return build_service(creds)
+        except Exception:
             self.is_offline = True
             self.last_spell_report = self._t("offline")
             return None
 
+    def warm_up(self):
+        """Builds the Blogger client in the background right after startup, so the
+        first Ctrl+S / Ctrl+O doesn't pay for imports, token refresh and TLS setup."""
+        if self.test_mode or self.service is not None or self.api.is_busy("auth") or not os.path.exists(self.token_path):
+            return
+        self.api.submit("auth", self.authenticate, False, on_done=lambda result: self._connected(result, interactive=False))
+
+    def keep_credentials_fresh(self):
+        # Renew the token off the loop a few minutes before it expires
+        if self.service is None or self.api.is_busy("refresh") or not needs_refresh(self.credentials):
+            return
+        self.api.submit("refresh", refresh_credentials, self.credentials, self.token_path,
+                        on_done=lambda result: None)
+
     def get_status_text(self):
         t = TRANSLATIONS.get(self.lang, TRANSLATIONS['en'])['status']
         dirty = " *" if self.is_dirty() else ""
-        word_count = len(self.body_buffer.text.split())
+        word_count = self.word_counter.count
         result = []
 
         if word_count >= self.word_goal:
@@ -404,7 +545,7 @@ class BlimEditor:
         
         result.append(('', " | "))
 
-        read_min = max(1, round(word_count / self.reading_speed))
+        read_min = self.word_counter.reading_minutes(self.reading_speed)
         result.append(('', f" {read_min} {t.get('read', 'read')} "))
         
         if self.sprint_active:
@@ -425,25 +566,65 @@ class BlimEditor:
         if dirty:
             result.append(('class:status-dirty', dirty))
             
+        if any(not kind.startswith("prefetch:") and kind != "refresh" for kind in self.api.busy_kinds()):
+            result.append(('', " ⟳"))  # Blogger call in flight (background prefetch/refresh don't count)
+        if len(self.outbox):
+            result.append(('class:status-warn', f" ⇪{len(self.outbox)}"))  # Saves waiting to be sent
+        if self.bulk_progress:
+            result.append(('', " ⧉{}/{}".format(*self.bulk_progress)))
+
         result.append(('', f" | {self.last_spell_report} "))
         
         return result
 
-    def is_dirty(self): return self.body_buffer.text.strip() != self.last_saved_content.strip()
+    def is_dirty(self): return self.dirty_tracker.is_dirty()
+
+    def perf_command(self, args):
+        """:perf toggles the overlay, :perf mem adds tracemalloc, :perf dump [FILE] writes JSON."""
+        sub = args[0].lower() if args else ""
+        if sub == "dump":
+            path = args[1] if len(args) > 1 else os.path.join(self.base_path, 'config', time.strftime("perf-%Y%m%d-%H%M%S.json"))
+            try:
+                self.last_spell_report = self._t("perf_dumped").format(path=self.perf.dump(path))
+            except OSError as e:
+                self.last_spell_report = self._t("perf_error").format(error=e)
+            return
+        if sub == "mem":
+            self.show_perf = True
+            self.perf.enable(get_app(), self.api)
+            if self.perf.owns_memory_trace:
+                self.perf.trace_memory(False)
+                self.last_spell_report = self._t("perf_mem_off")
+            elif self.perf.memory_traced:  # python -X tracemalloc, a replay: shown, but not ours to stop
+                self.last_spell_report = self._t("perf_mem_external")
+            else:
+                self.perf.trace_memory(True)
+                self.last_spell_report = self._t("perf_mem_on")
+            return
+        self.show_perf = not self.show_perf
+        if self.show_perf:
+            self.perf.enable(get_app(), self.api)
+        else:
+            self.perf.disable()
+        self.last_spell_report = self._t("perf_on" if self.show_perf else "perf_off")
+
+    def _note_edit(self, _buffer=None):
+        self._last_edit = time.monotonic()
 
     def apply_language(self, lang_code):
         self.lang = lang_code
         t = TRANSLATIONS[self.lang]["ui"]
 
-        # Only reload if the user actually has the dictionary turned on!
-        if self.dictionary_loaded:
-            self._reload_dictionary()
+        # Only reload if the user actually has the dictionary turned on (or it is still loading)!
+        if self.dictionary_loaded or self.spell_worker.is_busy("load"):
+            self.request_dictionary()
 
         if self.post_status in ["[NEW]", "[NUEVO]", "NEW"]:
             self.post_status = t["new_post"]
 
         if self.show_browser: self.render_browser()
-        self.help_field.text = HELP_TEXT.get(self.lang, HELP_TEXT["en"]).strip()
+        if self._help_field is not None:
+            self._help_field.text = HELP_TEXT.get(self.lang, HELP_TEXT["en"]).strip()
             
         self.last_spell_report = t["lang_feedback"]
     
@@ -464,6 +645,16 @@ class BlimEditor:
             get_app().layout.focus(self.body_field)
             return
 
+        if self.pending_bulk is not None:
+            pending, self.pending_bulk = self.pending_bulk, None
+            if cmd == 'y':
+                self._start_bulk_run(*pending)
+            else:
+                self.last_spell_report = self._t("bulk_cancelled")
+            buffer.text = ""
+            get_app().layout.focus(self.body_field)
+            return
+
         # 2. Handle standard commands
         if not cmd:
             get_app().layout.focus(self.body_field); return
@@ -484,6 +675,20 @@ class BlimEditor:
         elif cmd == ':help': self.show_help, self.show_browser = True, False
         
         elif cmd == ':restore': self.load_recovery()
+        elif cmd == ':sync': self.retry_outbox(interactive=True)
+        elif cmd.split()[0] == ':perf': self.perf_command(buffer.text.strip().split()[1:])
+        elif cmd == ':mem': self.last_spell_report = self._t("mem_summary").format(summary=self.memory.summary())
+        
+        elif cmd.startswith(':') and cmd.split()[0][1:] in BULK_OPERATIONS:
+            # Label names keep their case; quotes allow spaces ("Road trips")
+            import shlex
+            try:
+                words = shlex.split(buffer.text.strip())
+            except ValueError:
+                words = []
+            self.request_bulk(cmd.split()[0][1:], words[1:])
+            buffer.text = ""
+            return
         
         elif cmd.startswith(':sprint'):
             parts = cmd.split()
@@ -509,7 +714,10 @@ class BlimEditor:
             if word_to_add:
                 with open(self.custom_dict_path, 'a', encoding='utf-8') as f:
                     f.write(word_to_add + "\n")
-                self.spell.word_frequency.load_words([word_to_add])
+                if self.spell:  # Still loading? The word is on disk and comes in with the load
+                    self.spell.load_words([word_to_add])
+                    self.spell_verdicts.mark_known([word_to_add])
+                    self.dictionary_generation += 1
                 self.last_spell_report = self._t('added_to_dict').format(word=word_to_add)
                 self.spell_check() 
         
@@ -526,7 +734,9 @@ class BlimEditor:
                 
                 if unknown:
                     # 3. Load into active session
-                    self.spell.word_frequency.load_words(unknown)
+                    self.spell.load_words(unknown)
+                    self.spell_verdicts.mark_known(unknown)
+                    self.dictionary_generation += 1
                     
                     # 4. Update the internal set and save to disk
                     self.custom_words.update(unknown)
@@ -536,11 +746,9 @@ class BlimEditor:
                     
                     self.last_spell_report = t["addall_success"].format(count=len(unknown))
                     
-                    # 5. MEMORY OPTIMIZATION: Clean up temporary sets immediately
+                    # 5. Temporary sets are dropped here; the memory governor collects when idle
                     del all_words
                     del unknown
-                    import gc
-                    gc.collect(0) 
                 else:
                     self.last_spell_report = t["addall_none"]
             else:
@@ -560,54 +768,170 @@ class BlimEditor:
     def start_new_post(self):
         self.title_field.text = self.body_buffer.text = self.tags_field.text = ""
         self.post_status = TRANSLATIONS[self.lang]["ui"]["new_post"]
-        self.current_post_id = None
+        self.current_post_id = self.remote_status = self._local_key = self._opening = None
+        self.saved_fields.clear()
         get_app().layout.focus(self.body_field)
 
     def _force_clear_all(self):
         self.start_new_post()
-        self.last_saved_content = ""
+        self.dirty_tracker.mark_saved("")
 
     def toggle_browser(self):
         self.show_browser = not self.show_browser
         self.show_help = False
         
         if self.show_browser:
+            self.browser_index = self.browser_offset = 0
             self.fetch_recent_posts()
             get_app().layout.focus(self.browser_field)
         else:
             # --- MEMORY CLEANUP START ---
             self.posts_list = []      # Clear the list of post metadata
-            self.browser_field.buffer.reset(Document(text=""))  # Clear the browser text area
-            import gc
-            gc.collect()              # Force immediate cleanup of UI fragments
+            self.next_page_token, self.browser_has_more = None, False
+            self.prefetcher.clear()
+            self._browser_field = None  # Dropped entirely; rebuilt on the next Ctrl+O
+            self.memory.release("browser closed")  # Collected once idle, not in this keystroke
             # --- MEMORY CLEANUP END ---
             get_app().layout.focus(self.body_field)
 
+    def _connect(self, then, interactive=True):
+        # Authenticates off the loop on first use, then continues on the loop with then().
+        # interactive=False only refreshes a stored token and never opens the consent flow.
+        if self.service is not None or self.is_offline:
+            then(); return
+        self._after_connect.append(then)
+        self._consent_wanted = self._consent_wanted or interactive
+        if self.api.is_busy("auth"):
+            return  # Already connecting (maybe the startup warm-up): then() runs when it lands
+        self.last_spell_report = self._t("connecting")
+        self.api.submit("auth", self.authenticate, interactive,
+                        on_done=lambda result: self._connected(result, interactive=interactive))
+
+    def _connected(self, result, interactive=True):
+        self.service = None if isinstance(result, Exception) else result
+        pending, self._after_connect = self._after_connect, []
+        if self.service is None and not interactive and not self.is_offline:
+            if pending and self._consent_wanted:  # No stored token, but a save/browse is waiting
+                self._after_connect = pending
+                self.api.submit("auth", self.authenticate, on_done=self._connected)
+            else:
+                self._consent_wanted = False  # Unattended callers give up until the next try
+            return
+        self._consent_wanted = False
+        if self.service is None: self.is_offline = True
+        for then in pending: then()
+        get_app().invalidate()
+
     def fetch_recent_posts(self):
-        if self.service is None and not self.is_offline:
-            self.service = self.authenticate()
+        # First paint never waits for the network: cached posts (or an empty frame) now,
+        # the first page from Blogger when it arrives
+        self.posts_list = self.post_store.list_posts(self.blog_id, limit=PAGE_SIZE)
+        self.next_page_token, self.browser_has_more = None, False
+        self.render_browser()
+        self._connect(lambda: self._fetch_posts_page(None))
+
+    def _fetch_posts_page(self, page_token):
         if self.is_offline or not self.service: return
-        try:
-            posts_data = self.service.posts().list(blogId=self.blog_id, maxResults=20, status=['LIVE', 'DRAFT'], view='AUTHOR').execute()
-            self.posts_list = [{'id': p['id'], 'title': p.get('title', '(Untitled)'), 'status': p.get('status', 'DRAFT')} for p in posts_data.get('items', [])]
+
+        def _done(result):
+            if isinstance(result, Exception):
+                # Closed meanwhile: don't rebuild the pane toggle_browser just dropped
+                if self.show_browser and not self.posts_list: self.browser_field.text = f"Fetch Error: {str(result)[:20]}"
+                return
+            items, next_token = result
+            for post in items:
+                self.post_store.put_summary(self.blog_id, post)
+            if not self.show_browser:
+                return
+            page = [summarize(p) for p in items]
+            # The first page replaces the cached preview; later pages extend the list
+            self.posts_list = page if page_token is None else self.posts_list + page
+            self.next_page_token, self.browser_has_more = next_token, bool(next_token)
+            self.browser_index = min(self.browser_index, max(0, len(self.posts_list) - 1))
             self.render_browser()
-        except Exception as e:
-            self.browser_field.text = f"Fetch Error: {str(e)[:20]}"
+            self._maybe_prefetch_page()
+            self._prefetch_selection()
+            get_app().invalidate()
+
+        self.api.submit("list", list_posts, self.service, self.blog_id, page_token, on_done=_done)
+
+    def _maybe_prefetch_page(self):
+        # Near the end of what's loaded? Get the next page while the user keeps scrolling
+        if (self.browser_has_more and not self.api.is_busy("list")
+                and self.browser_index >= len(self.posts_list) - BROWSER_PREFETCH):
+            self._fetch_posts_page(self.next_page_token)
+
+    def move_browser_selection(self, step):
+        count = len(self.posts_list)
+        if count == 0: return
+        target = self.browser_index + step
+        if 0 <= target < count:
+            self.browser_index = target
+        elif self.browser_has_more:
+            self.browser_index = max(0, min(target, count - 1))  # Wait at the end for the next page
+        elif abs(step) == 1:
+            self.browser_index = target % count  # Everything loaded: wrap around like before
+        else:
+            self.browser_index = max(0, min(target, count - 1))
+        self.render_browser()
+        self._maybe_prefetch_page()
+        self._prefetch_selection()
+
+    def _prefetch_selection(self):
+        # Selected post first, then the one below and the one above
+        if self.is_offline or not self.service or not self.posts_list: return
+        i = self.browser_index
+        neighbours = [i, i + 1, i - 1]
+        ids = [self.posts_list[n]['id'] for n in neighbours if 0 <= n < len(self.posts_list)]
+        self.prefetcher.update(ids, self._prefetch_job)
+
+    def _prefetch_job(self, post_id):
+        service, blog_id = self.service, self.blog_id
+        cached = self.post_store.get(blog_id, post_id)
+        if cached and cached['content'] is None: cached = None
+
+        def _job():
+            post = get_post(service, blog_id, post_id, etag=cached['etag'] if cached else None)
+            if post is None:  # 304: the stored copy is current
+                return cached, cached['markdown'] or self.clean_html_for_editor(cached['content'])
+            return post, self.clean_html_for_editor(post.get('content', ''))
+        return _job
+
+    def _cache_post(self, post, markdown=None):
+        # Keep a converted copy we already have when the etag hasn't moved
+        if markdown is None:
+            known = self.post_store.get(self.blog_id, post['id'])
+            if known and known['etag'] and known['etag'] == post.get('etag'):
+                markdown = known['markdown']
+        self.post_store.put(self.blog_id, post, markdown)
 
     def render_browser(self):
         t = TRANSLATIONS.get(self.lang, TRANSLATIONS['en'])["ui"]
         width = 76
+
+        # Keep the selection inside the scrolling window
+        if self.browser_index < self.browser_offset:
+            self.browser_offset = self.browser_index
+        elif self.browser_index >= self.browser_offset + BROWSER_ROWS:
+            self.browser_offset = self.browser_index - BROWSER_ROWS + 1
+
+        if self.api.is_busy("list") or not self.posts_list:
+            status_line = t["fetching"]
+        else:
+            more = "+" if self.browser_has_more else ""
+            status_line = f" {self.browser_index + 1}/{len(self.posts_list)}{more}"
         
         # Header (4 lines)
         lines = [
-            t["fetching"], 
+            status_line, 
             " ╔" + "═"*(width-2) + "╗", 
             f" ║{t['browser_title'].center(width-2)}║", 
             " ╠" + "═"*(width-2) + "╣"
         ]
         
-        # Show up to 12 posts
-        for i, post in enumerate(self.posts_list[:12]):
+        # Show the window of BROWSER_ROWS posts around the selection
+        window = self.posts_list[self.browser_offset:self.browser_offset + BROWSER_ROWS]
+        for i, post in enumerate(window, start=self.browser_offset):
             prefix = " › " if i == self.browser_index else "   "
             title = post.get('title', post.get('name', 'Untitled'))
             display_title = title[:60].ljust(60)
@@ -615,7 +939,7 @@ class BlimEditor:
             content = f" {prefix}[{status_char}] {display_title}".ljust(width-2)
             lines.append(f" ║{content}║")
             
-        while len(lines) < 16: 
+        while len(lines) < 4 + BROWSER_ROWS: 
             lines.append(" ║" + " "*(width-2) + "║")
             
         lines.append(" ╚" + "═"*(width-2) + "╝")
@@ -626,42 +950,109 @@ class BlimEditor:
         self.browser_field.buffer.reset(Document(text="\n".join(lines)))
         
         # This fixes the "Up Scroll" bug by forcing the view to follow selection
-        target_line = 4 + self.browser_index
+        target_line = 4 + self.browser_index - self.browser_offset
         new_pos = self.browser_field.buffer.document.translate_row_col_to_index(target_line, 0)
         self.browser_field.buffer.cursor_position = new_pos
 
     def fetch_and_load(self, post_id):
-        if self.service is None and not self.is_offline:
-            self.service = self.authenticate()
+        self._opening = post_id  # Set first: loads of any post opened before this one don't land
+        # Prefetched from the browser a moment ago? Open it right away, no revalidation
+        ready = self.prefetcher.take(post_id)
+        if ready:
+            self._cache_post(*ready)
+            self._apply_loaded_post(ready)
+            return
+
+        # Served from the local store immediately (also offline), revalidated in the background
+        cached = self.post_store.get(self.blog_id, post_id)
+        if cached and cached['content'] is None:
+            cached = None  # Only browser metadata so far, no body to show
+        if cached:
+            if cached['markdown'] is None:
+                cached['markdown'] = self.clean_html_for_editor(cached['content'] or '')
+                self.post_store.set_markdown(self.blog_id, cached['id'], cached['markdown'])
+            self._apply_loaded_post((cached, cached['markdown']))
+            self.last_spell_report = self._t("loaded_cached")
+        if self.prefetcher.is_pending(post_id):
+            # Its GET is already queued by the browser: take that one instead of sending another
+            if not cached: self.last_spell_report = self._t("loading_post")
+            self.prefetcher.when_ready(post_id, lambda result: self._prefetch_landed(post_id, result, cached))
+            return
+        self._connect(lambda: self._start_fetch_and_load(post_id, cached))
+
+    def _prefetch_landed(self, post_id, result, cached):
+        if result is None:  # Skipped or failed: fall back to a load of its own
+            if self._opening == post_id:
+                self._connect(lambda: self._start_fetch_and_load(post_id, cached))
+            return
+        if cached and result[0].get('etag') == cached['etag']:
+            return  # 304: the cached copy on screen is current
+        self._cache_post(*result)
+        self._land_loaded_post(post_id, result, cached)
+
+    def _start_fetch_and_load(self, post_id, cached=None):
         if self.is_offline or not self.service: return
-        try:
-            post = self.service.posts().get(blogId=self.blog_id, postId=post_id, view='AUTHOR').execute()
-            self.current_post_id, self.post_status = post['id'], post.get('status', 'LIVE')
-            
-            # Use reset() for all fields to ensure cache clearing
-            self.title_field.buffer.reset(Document(text=post.get('title', '')))
-            self.tags_field.buffer.reset(Document(text=", ".join(post.get('labels', []))))
-            
-            content = self.clean_html_for_editor(post.get('content', ''))
-            self.last_saved_content = content
-            
-            # This is the big one: clears the body_field render cache
-            self.body_field.buffer.reset(Document(text=content))
-            
-            import gc
-            gc.collect()  # Immediate cleanup after loading a post
-            
-        except: self.last_spell_report = self._t("load_error")
+        service, etag = self.service, cached['etag'] if cached else None
+        if not cached: self.last_spell_report = self._t("loading_post")
+
+        def _job():
+            post = get_post(service, self.blog_id, post_id, etag=etag)
+            if post is None: return None  # 304: the cached copy is current
+            return post, self.clean_html_for_editor(post.get('content', ''))
+
+        def _done(result):
+            if result is None: return
+            if isinstance(result, Exception):
+                if not cached: self.last_spell_report = self._t("load_error")
+                return
+            self._cache_post(*result)
+            self._land_loaded_post(post_id, result, cached)
+
+        # A newer load (another Enter) makes this one stale; only the last one lands
+        self.api.submit("load", _job, on_done=_done)
+
+    def _land_loaded_post(self, post_id, result, cached):
+        if self._opening != post_id:
+            return  # Another post was opened meanwhile
+        # Don't clobber edits made to the cached copy while we were revalidating
+        if cached is None or (self.current_post_id == post_id and not self.is_dirty()):
+            self._apply_loaded_post(result)
+        else:
+            self.last_spell_report = self._t("remote_newer")
+        get_app().invalidate()
+
+    def _apply_loaded_post(self, result):
+        post, content = result
+        self.current_post_id, self.post_status = post['id'], post.get('status', 'LIVE')
+        
+        # Use reset() for all fields to ensure cache clearing
+        self.title_field.buffer.reset(Document(text=post.get('title', '')))
+        self.tags_field.buffer.reset(Document(text=", ".join(post.get('labels', []))))
+        
+        self.dirty_tracker.mark_saved(content)
+        self.remote_status, self._local_key = post.get('status', 'LIVE'), None
+        self.saved_fields.mark(title=post.get('title', ''), body=content, labels=list(post.get('labels', [])))
+        
+        # This is the big one: clears the body_field render cache
+        self.body_field.buffer.reset(Document(text=content))
+        self.last_spell_report = self._t("ready").format(lang=self.lang.upper())
+        
+        self.memory.release("post loaded")  # The previous post's buffer and fragments
+        get_app().invalidate()
 
     def run_spellcheck(self):
         text = self.body_buffer.text.strip()
         if not text:
             self.last_spell_report = self._t("empty_doc")
             return
-        words = re.findall(r'\w+', text.lower())
-        misspelled = self.spell.unknown(words)
-        
-        if not misspelled:
+        if self.spell is None: return
+        self.last_spell_report = self._t("spell_checking")
+        self.spell_worker.submit("check", find_misspelled, self.spell, text, on_done=self._publish_spell_report)
+
+    def _publish_spell_report(self, misspelled):
+        if isinstance(misspelled, Exception):
+            self.last_spell_report = self._t("dict_error")
+        elif not misspelled:
             self.last_spell_report = self._t("no_errors").format(lang=self.lang.upper())
         else:
             err_list = ', '.join(list(misspelled)[:3])
@@ -669,64 +1060,224 @@ class BlimEditor:
             count=len(misspelled), 
             list=err_list
         )
+        self.spell_check()
     
     def clean_html_for_editor(self, html):
-        text = re.sub(r'<(p|div|h[1-6])[^>]*>', '', html)
-        text = re.sub(r'</(p|div|h[1-6])>', '\n\n', text)
-        text = re.sub(r'<br[^>]*>', '\n', text)
-        text = re.sub(r'<(b|strong)>(.*?)</\1>', r'**\2**', text)
-        text = re.sub(r'<(i|em)>(.*?)</\1>', r'*\2*', text)
-        text = re.sub(r'<a\s+[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', text)
-        return re.sub(r'<(?!img|/img)[^>]+>', '', text).strip()
+        # Linear html.parser pass; the inverse of _parse_markdown (see core/markdown.py)
+        return html_to_markdown(html)
 
     def _parse_markdown(self, md_text):
-        html = re.sub(r'^> (.*?)$', r'<blockquote>\1</blockquote>', md_text, flags=re.M)
-        html = re.sub(r'^---$', r'<hr />', html, flags=re.M)
-        html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.M)
-        html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.M)
-        html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.M)
-        
-        html = re.sub(r'^\* (.*?)$', r'<li>\1</li>', html, flags=re.M)
-        html = re.sub(r'((?:<li>.*?</li>\n?)+)', r'<ul>\1</ul>', html, flags=re.S)
-
-        html = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', html)
-        html = re.sub(r'\*(.*?)\*', r'<i>\1</i>', html)
-        html = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2">\1</a>', html)
-
-        processed_blocks = []
-        for block in html.split('\n\n'):
-            trimmed = block.strip()
-            if not trimmed: continue
-            if trimmed.startswith('<'):
-                processed_blocks.append(trimmed.replace('\n', '') if '<li>' in trimmed else trimmed)
-            else:
-                processed_blocks.append(f"<p>{trimmed.replace(chr(10), '<br />')}</p>")
-        return "".join(processed_blocks)
+        # Single pass block/inline compiler (see core/markdown.py)
+        return render_html(md_text)
 
     def save_post(self, is_draft=True):
-        if self.service is None and not self.is_offline:
-            self.service = self.authenticate()
-        if self.is_offline or not self.service:
-            self.last_spell_report = self._t("save_fail")
+        if self.api.is_busy("save") or self._save_connecting:
+            # Serialize: one follow-up save with the latest text (a pending publish wins)
+            self._queued_save = is_draft if self._queued_save is None else (self._queued_save and is_draft)
+            self.last_spell_report = self._t("save_queued")
+            return
+        self._save_connecting = True  # Waiting on _connect counts as in flight
+        self._connect(lambda: self._start_connected_save(is_draft))
+
+    def _start_connected_save(self, is_draft):
+        self._save_connecting = False
+        if not self._start_save(is_draft) and self._queued_save is not None:
+            # Nothing sent (unchanged, or into the outbox): no _finish_save will run the queued one
+            queued, self._queued_save = self._queued_save, None
+            self.save_post(is_draft=queued)
+
+    def _start_save(self, is_draft, auto=False):
+        text = self.body_buffer.text
+        labels = [t.strip() for t in self.tags_field.text.split(',') if t.strip()]
+        title, post_id, service = self.title_field.text, self.current_post_id, self.service
+        fields = {"title": title, "body": text, "labels": labels}
+
+        # Existing posts only send what changed since the last save; publishing
+        # something already live is a no-op, so that call is skipped as well
+        changed = self.saved_fields.changed(**fields) if post_id else list(fields)
+        is_draft = is_draft or (post_id is not None and self.remote_status == 'LIVE')
+        if post_id and not changed and is_draft:
+            if not auto: self.last_spell_report = self._t("save_unchanged")
             return False
 
-        content_html = self._parse_markdown(self.body_buffer.text)
-        labels = [t.strip() for t in self.tags_field.text.split(',') if t.strip()]
-        body = {"title": self.title_field.text, "content": content_html, "labels": labels}
-        
-        try:
-            if self.current_post_id:
-                self.service.posts().update(blogId=self.blog_id, postId=self.current_post_id, body=body).execute()
-                if not is_draft: self.service.posts().publish(blogId=self.blog_id, postId=self.current_post_id).execute()
-            else:
-                res = self.service.posts().insert(blogId=self.blog_id, body=body, isDraft=is_draft).execute()
-                self.current_post_id = res['id']
-            
-            self.last_saved_content = self.body_buffer.text
-            self.post_status = self._t("status_draft") if is_draft else self._t("status_live")
+        # Offline, or older saves of this post still queued: goes through the outbox
+        key = self._outbox_key()
+        if self.is_offline or not self.service or self.outbox.get(key):
+            self.outbox.put(key, post_id, title, text, labels, changed, is_draft)
+            self.last_spell_report = self._t("outbox_queued").format(count=len(self.outbox))
+            self._replay_outbox()
+            return False
+        if not auto: self.last_spell_report = self._t("saving")
+
+        def _job():
+            body = {}
+            if "title" in changed: body["title"] = title
+            if "body" in changed: body["content"] = self._parse_markdown(text)  # Skip the render when unchanged
+            if "labels" in changed: body["labels"] = labels
+            return push_post(service, self.blog_id, post_id, body, is_draft)
+
+        self.api.submit("save", _job, on_done=lambda result: self._finish_save(result, key, fields, is_draft, auto))
+        return True
+
+    def _finish_save(self, result, key, fields, is_draft, auto=False):
+        if isinstance(result, Exception):
+            self.last_spell_report = self._t("save_error").format(error=str(result)[:20])
+        elif key not in (self.current_post_id, self._local_key):
+            # :new or another post was opened while this save was in flight; it's stored, not shown
+            self._cache_post(result, fields["body"])
             self.last_spell_report = self._t("saved")
-        except Exception as e:
-            self.last_spell_report = self._t("save_error").format(error=str(e)[:20])
+        else:
+            self.current_post_id, self._local_key = result['id'], None
+            self.remote_status = result.get('status') or ('DRAFT' if is_draft else 'LIVE')
+            self._cache_post(result, fields["body"])
+            self.dirty_tracker.mark_saved(fields["body"])
+            self.saved_fields.mark(**fields)
+            self.post_status = self._t("status_draft") if self.remote_status == 'DRAFT' else self._t("status_live")
+            self.last_spell_report = self._t("autosaved") if auto else self._t("saved")
+        get_app().invalidate()
+
+        if self._queued_save is not None:
+            queued, self._queued_save = self._queued_save, None
+            self.save_post(is_draft=queued)
+
+    # --- Offline outbox ---
+    def _outbox_key(self):
+        if self.current_post_id:
+            return self.current_post_id
+        if self._local_key is None:
+            self._local_key = f"local-{time.time_ns()}"
+        return self._local_key
+
+    def retry_outbox(self, interactive=False):
+        """Reconnects if needed and replays queued saves (periodically, and on :sync)."""
+        if not len(self.outbox) or self.api.is_busy("auth") or self.api.is_busy("outbox"):
+            return
+        if self.is_offline:
+            # Unattended retries only refresh a stored token, never open the OAuth browser flow
+            if not interactive and not os.path.exists(self.token_path):
+                return
+            self.is_offline, self.service = False, None
+        self._connect(self._replay_outbox, interactive=interactive)
+
+    def _replay_outbox(self):
+        if self.is_offline or not self.service or not len(self.outbox) or self.api.is_busy("outbox"):
+            return
+        service, entries = self.service, self.outbox.pending()
+        self.api.submit("outbox", lambda: replay_outbox(service, self.blog_id, entries, self._parse_markdown),
+                        on_done=self._finish_outbox)
+
+    def _finish_outbox(self, results):
+        if isinstance(results, Exception):
+            self.last_spell_report = self._t("outbox_error").format(count=len(self.outbox))
+            get_app().invalidate()
+            return
+
+        failed = 0
+        for entry, post in results:
+            if isinstance(post, Exception) or post is None:
+                failed += 1
+                continue
+            self.outbox.done(entry, post['id'])
+            self._cache_post(post, entry["body"])
+            if entry["key"] in (self.current_post_id, self._local_key):
+                self.current_post_id, self._local_key = post['id'], None
+                self.remote_status = post.get('status') or ('DRAFT' if entry["is_draft"] else 'LIVE')
+                self.saved_fields.mark(title=entry["title"], body=entry["body"], labels=entry["labels"])
+                self.dirty_tracker.mark_saved(entry["body"])
+                self.post_status = self._t("status_draft") if self.remote_status == 'DRAFT' else self._t("status_live")
+
+        if failed:
+            self.last_spell_report = self._t("outbox_error").format(count=failed)
+        else:
+            self.last_spell_report = self._t("outbox_sent").format(count=len(results))
+            self._replay_outbox()  # Saves queued while this replay was in flight
+        get_app().invalidate()
+
+    # --- Bulk operations ---
+    def request_bulk(self, op, args):
+        """Plans :relabel OLD NEW, :republish LABEL or :revert LABEL, then asks y/n."""
+        if len(args) != (2 if op == "relabel" else 1):
+            self.last_spell_report = self._t("bulk_usage")
+            return
+        self._connect(lambda: self._start_bulk_plan(op, args))
+
+    def _start_bulk_plan(self, op, args):
+        if self.is_offline or not self.service:
+            self.last_spell_report = self._t("offline")
+            return
+        if self.api.is_busy("bulk"):
+            self.last_spell_report = self._t("bulk_busy")
+            return
+        service = self.service
+        self.last_spell_report = self._t("bulk_planning")
+
+        def _done(targets):
+            if isinstance(targets, Exception):
+                self.last_spell_report = self._t("bulk_error").format(error=str(targets)[:30])
+            elif not targets:
+                self.last_spell_report = self._t("bulk_none")
+            else:
+                self.pending_bulk = (op, args, targets)
+                self.command_field.text = ""
+                self.last_spell_report = self._t("bulk_confirm").format(op=op, count=len(targets))
+                get_app().layout.focus(self.command_field)
+            get_app().invalidate()
+
+        self.api.submit("bulk", plan_bulk, service, self.blog_id, op, args, on_done=_done)
+
+    def _start_bulk_run(self, op, args, targets):
+        if self.is_offline or not self.service:
+            self.last_spell_report = self._t("offline")
+            return
+        app, service = get_app(), self.service
+        self.bulk_progress = (0, len(targets))
+
+        def _progress(done, total):
+            # Runs on the API thread; Application.invalidate() is thread-safe
+            self.bulk_progress = (done, total)
+            app.invalidate()
+
+        def _done(results):
+            self.bulk_progress = None
+            if isinstance(results, Exception):
+                self.last_spell_report = self._t("bulk_error").format(error=str(results)[:30])
+            else:
+                failed = 0
+                for post, resource in results:
+                    if isinstance(resource, Exception) or resource is None:
+                        failed += 1
+                        continue
+                    self.post_store.put_summary(self.blog_id, resource)
+                    if resource['id'] == self.current_post_id:
+                        self._apply_remote_labels(resource)
+                self.last_spell_report = self._t("bulk_done").format(ok=len(results) - failed, failed=failed)
+            get_app().invalidate()
+
+        self.api.submit("bulk", run_bulk, service, self.blog_id, op, args, targets, _progress, on_done=_done)
+
+    def _apply_remote_labels(self, post):
+        # The open post was part of a bulk run: show its new labels and status
+        labels = list(post.get('labels', []))
+        self.tags_field.buffer.reset(Document(text=", ".join(labels)))
+        self.saved_fields.mark(labels=labels)
+        self.remote_status = post.get('status', self.remote_status)
+        self.post_status = self._t("status_draft") if self.remote_status == 'DRAFT' else self._t("status_live")
+
+    def maybe_autosave(self, now=None):
+        """Debounced background save of a Blogger draft once typing has paused.
+
+        Only drafts that already exist remotely qualify: autosaving a live post
+        would publish half-written edits, and a new post isn't created silently.
+        """
+        if not self.autosave_seconds or not self.current_post_id or self.remote_status != 'DRAFT':
+            return False
+        if self._last_edit is None or self.is_offline or not self.service or self.api.is_busy("save"):
+            return False
+        now = time.monotonic() if now is None else now
+        if now - self._last_edit < self.autosave_seconds:
+            return False
+        self._last_edit = None  # One autosave per pause in typing
+        return self._start_save(is_draft=True, auto=True)
 
     def _wrap_selection(self, symbol, offset_len):
         buff = self.body_field.buffer
@@ -761,21 +1312,20 @@ class BlimEditor:
         def _(event):
             self.show_spelling_errors = not self.show_spelling_errors
             if self.show_spelling_errors:
-                # Load only if it's the first time
+                # Load only if it's the first time (in the background; checks when ready)
                 if not self.dictionary_loaded:
-                    self.last_spell_report = "Loading Dictionary..."
-                    event.app.invalidate()
-                    self._reload_dictionary() 
-                self.run_spellcheck() 
+                    self.request_dictionary()
+                else:
+                    self.run_spellcheck()
             else:
                 # --- MEMORY OPTIMIZATION START ---
-                self.spell = None            # Remove the heavy object
+                self._drop_dictionary()      # Remove the heavy object
                 self.dictionary_loaded = False # Allow fresh reload later
                 current_content = self.body_field.text  # Store current text
                 self.body_field.buffer.reset(Document(text=current_content))  # Reset buffer to clear lexer cache
+                self.body_field.lexer.clear_cache()  # Drop spellchecked lines from our own line cache
 
-                import gc
-                gc.collect()                 # Force immediate cleanup
+                self.memory.release("dictionary dropped")  # Collected once idle
                 # --- MEMORY OPTIMIZATION END ---
                 self.last_spell_report = self._t("ready").format(lang=self.lang.upper())
             event.app.invalidate()
@@ -853,23 +1403,17 @@ class BlimEditor:
         
         @kb.add('up', filter=Condition(lambda: self.show_browser))
         def _(event):
-            limit = min(len(self.posts_list), 12)
-            if limit > 0:
-                self.browser_index = (self.browser_index - 1) % limit
-                self.render_browser()
-                import gc
-                gc.collect()
+            self.move_browser_selection(-1)
         
         @kb.add('down', filter=Condition(lambda: self.show_browser))
         def _(event):
-            # Dynamically wrap based on the actual number of posts shown (12)
-            limit = min(len(self.posts_list), 12)
-            if limit > 0:
-                self.browser_index = (self.browser_index + 1) % limit
-                self.render_browser()
-                # Incinerate fragments immediately during scrolling
-                import gc
-                gc.collect()
+            self.move_browser_selection(1)
+
+        @kb.add('pageup', filter=Condition(lambda: self.show_browser))
+        def _(event): self.move_browser_selection(-BROWSER_ROWS)
+
+        @kb.add('pagedown', filter=Condition(lambda: self.show_browser))
+        def _(event): self.move_browser_selection(BROWSER_ROWS)
         
         @kb.add('enter', filter=Condition(lambda: self.show_browser))
         def _(event): 
@@ -883,22 +1427,18 @@ class BlimEditor:
         def _(event):
             # focus_next() moves Title -> Tags -> Body
             event.app.layout.focus_next()
-            import gc
-            gc.collect(0)
 
         # --- 2. BACKWARD NAVIGATION (S-TAB) ---
         @kb.add('s-tab')
         def _(event):
             # focus_previous() moves Body -> Tags -> Title
             event.app.layout.focus_previous()
-            import gc
-            gc.collect(0)
 
         # --- 2. TEXT SCROLLING (Arrows/Page) ---
         @kb.add('up', filter=Condition(lambda: not self.show_browser))
         @kb.add('down', filter=Condition(lambda: not self.show_browser))
-        @kb.add('pageup')
-        @kb.add('pagedown')
+        @kb.add('pageup', filter=Condition(lambda: not self.show_browser))
+        @kb.add('pagedown', filter=Condition(lambda: not self.show_browser))
         def _(event):
             key = event.key_sequence[0].key
             
@@ -911,15 +1451,12 @@ class BlimEditor:
                 event.current_buffer.cursor_up()
             elif key == 'down': 
                 event.current_buffer.cursor_down()
-            
-            # Clean up memory fragments created by the Lexer during scroll
-            import gc
-            gc.collect(0)
+            # No gc here: scrolling is served from the lexer's line cache, not re-tokenized
 
     def start_sprint(self, mins):
         self.sprint_time_left = int(mins) * 60
         self.sprint_active = True
-        self.sprint_start_words = len(self.body_buffer.text.split())
+        self.sprint_start_words = self.word_counter.mark()
         self.last_spell_report = self._t("sprint_start").format(mins=mins)
     
     def update_sprint(self):
@@ -927,60 +1464,190 @@ class BlimEditor:
             self.sprint_time_left -= 1
             if self.sprint_time_left <= 0:
                 self.sprint_active = False
-                gain = max(0, len(self.body_buffer.text.split()) - self.sprint_start_words)
+                gain = self.word_counter.gain()
                 self.last_spell_report = self._t("sprint_done").format(gain=gain)
 
+    def _recovery_journal(self):
+        # Created lazily so recovery_path can still be pointed elsewhere (tests)
+        if self.recovery is None or self.recovery.path != self.recovery_path:
+            self.recovery = RecoveryJournal(self.recovery_path)
+        return self.recovery
+
     def auto_save_recovery(self):
-        try:
-            with open(self.recovery_path, 'w') as f: json.dump({"title": self.title_field.text, "body": self.body_buffer.text}, f)
+        # Appends only what changed since the last tick; no-op when nothing did
+        try: self._recovery_journal().record(self.title_field.text, self.body_buffer.text)
         except: pass
 
     def load_recovery(self):
         try:
-            with open(self.recovery_path, 'r') as f:
-                d = json.load(f)
-                self.title_field.text, self.body_buffer.text = d['title'], d['body']
+            d = self._recovery_journal().load()
+            if d: self.title_field.text, self.body_buffer.text = d['title'], d['body']
         except: pass
 
 def show_loading():
-    print("\033[H\033[J" + get_banner())
-    time.sleep(1.3)
+    # Stays on screen only while the editor is being built; the first frame replaces it
+    print("\033[H\033[J" + get_banner(), flush=True)
 
-async def main():
-    editor = BlimEditor()
+def build_application(editor, **kwargs):
     app = Application(
         layout=Layout(editor.container, focused_element=editor.body_field.buffer), 
         key_bindings=editor.kb, 
         full_screen=True, 
         style=blim_style, 
         editing_mode=EditingMode.EMACS,
-        mouse_support=True
+        mouse_support=True,
+        **kwargs
     )
+
+    drawn = []
+    def _first_frame(_app):
+        # Not removed from inside the event: that would skip the handler after it
+        if not drawn:
+            drawn.append(True)
+            STARTUP_MARKS.append(("first frame", time.perf_counter()))
+    app.after_render += _first_frame
+    return app
+
+def startup_report(marks=None, budget=STARTUP_BUDGET):
+    """Phase timings for --profile-startup, relative to the first line of blim.py."""
+    marks = marks or STARTUP_MARKS
+    start, prev = marks[0][1], marks[0][1]
+    lines = ["Startup profile (time since blim.py began executing):"]
+    for name, t in marks[1:]:
+        lines.append(f"  {name:<12} +{(t - prev) * 1000:7.1f} ms   {(t - start) * 1000:7.1f} ms")
+        prev = t
+    total = marks[-1][1] - start
+    verdict = "OK" if total <= budget else "OVER BUDGET"
+    lines.append(f"  time to first keystroke {total * 1000:.1f} ms (budget {budget * 1000:.0f} ms): {verdict}")
+    lines.append("  Per-module import times: python -X importtime blim.py")
+    return "\n".join(lines)
+
+async def main(record_keys=None):
+    editor = BlimEditor()
+    STARTUP_MARKS.append(("editor", time.perf_counter()))
+    app = build_application(editor)
+    if record_keys:
+        from core.replay import KeyRecorder
+        KeyRecorder(record_keys).attach(app)
+    STARTUP_MARKS.append(("application", time.perf_counter()))
     async def refresh():
         ticks = 0
+        await asyncio.sleep(0.3)  # Let the first frame draw before loading the Google client
+        editor.warm_up()
         while True:
             await asyncio.sleep(1.0) 
+            if not editor.memory.settled and not editor.api.is_busy("auth"):
+                editor.memory.settle()  # Freeze what startup built, warmed-up Google client included
             # 1. Update sprint logic if active
             if editor.sprint_active:
                 editor.update_sprint()
                 app.invalidate() # Only force redraw if the timer is visible
             
-            # 2. Only invalidate if the user has typed (to update word count/status)
-            elif editor.is_dirty():
+            # 2. Only invalidate if the user has typed (to update word count/status) or :perf is showing
+            elif editor.is_dirty() or editor.show_perf:
                 app.invalidate()
 
+            editor.maybe_autosave()
+            editor.memory.tick()  # Collects only when idle and over budget (or after a release)
+
             ticks += 1
-            # 3. Every 30 seconds, run a cleanup and auto-save
+            # 3. Every 30 seconds, auto-save and housekeeping
             if ticks >= 30:
                 editor.auto_save_recovery()
-                import gc
-                gc.collect() # Garbage collect Lexer fragments
+                editor.retry_outbox()
+                editor.keep_credentials_fresh()
                 ticks = 0
     
+    app.key_processor.after_key_press += editor.memory.touch  # Idle = no keystroke for a moment
     app.create_background_task(refresh())
-    await app.run_async()
+    try:
+        await app.run_async()
+    finally:
+        editor.memory.restore()
+        editor.api.shutdown()
+        editor.spell_worker.shutdown()
+
+def run_publish_cli(args, editor=None):
+    """python blim.py publish DIR: converts and uploads a directory of Markdown files. Returns the exit code."""
+    from core.pipeline import find_markdown_files, convert_all, write_html, publish_results, record_post_id
+
+    paths = find_markdown_files(args.directory)
+    if not paths:
+        print(f"No Markdown files in {args.directory}")
+        return 1
+    results = convert_all(paths, workers=args.workers)
+
+    if args.dry_run:
+        out_dir = args.out or os.path.join(args.directory, "html")
+        for path in write_html(results, out_dir):
+            print(f"  html  {path}")
+    else:
+        editor = editor or BlimEditor()
+        service = editor.authenticate()
+        if service is None:
+            print(editor._t("offline"))
+            return 1
+        progress = lambda done, total: print(f"\r  {done}/{total}", end="", flush=True)
+        saved = publish_results(service, editor.blog_id, results, publish=args.publish, progress=progress)
+        print()
+        for result in results:
+            post = saved.get(result["path"])
+            if post is None:
+                continue
+            if not result["post_id"]:
+                record_post_id(result["path"], post["id"])
+            print(f"  {'live ' if args.publish else 'draft'} {result['path']} -> {post['id']}")
+
+    failed = [r for r in results if r["error"]]
+    for result in failed:
+        print(f"  FAIL  {result['path']}: {result['error']}")
+    print(f"{len(results) - len(failed)} ok, {len(failed)} failed")
+    return 1 if failed else 0
+
+def run_export_cli(args, editor=None):
+    """python blim.py export DIR: archives every post as Markdown. Returns the exit code."""
+    from core.export import BlogExporter
+
+    editor = editor or BlimEditor()
+    service = editor.authenticate()
+    if service is None:
+        print(editor._t("offline"))
+        return 1
+    progress = lambda written, skipped: print(f"\r  {written} written, {skipped} unchanged", end="", flush=True)
+    exporter = BlogExporter(service, editor.blog_id, args.directory, editor.clean_html_for_editor, progress=progress)
+    try:
+        written, skipped = exporter.run(full=args.full)
+    except Exception as e:
+        print(f"\nExport interrupted ({str(e)[:80]}); run it again to resume.")
+        return 1
+    print(f"\n{written} written, {skipped} unchanged -> {args.directory}")
+    return 0
+
+def parse_cli(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="blim.py", description="Distraction-free writer for Blogger. No command opens the editor.")
+    parser.add_argument("--profile-startup", action="store_true", help="Print import/init timings and time to first keystroke on exit")
+    parser.add_argument("--record-keys", metavar="FILE", help="Append every keystroke to FILE, for benchmarks/bench_replay.py --trace")
+    commands = parser.add_subparsers(dest="command")
+    publish = commands.add_parser("publish", help="Upload a directory of Markdown files (front matter: title, labels, id)")
+    publish.add_argument("directory")
+    publish.add_argument("--publish", action="store_true", help="Publish live (default: save as drafts)")
+    publish.add_argument("--dry-run", action="store_true", help="Only convert, writing HTML locally")
+    publish.add_argument("--out", help="Dry-run output directory (default: DIRECTORY/html)")
+    publish.add_argument("--workers", type=int, default=None, help="Conversion processes (default: one per CPU)")
+    export = commands.add_parser("export", help="Archive every post (LIVE and DRAFT) as Markdown; resumable and incremental")
+    export.add_argument("directory")
+    export.add_argument("--full", action="store_true", help="Re-download everything instead of only what changed")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
+    cli_args = parse_cli(sys.argv[1:])
+    if cli_args.command == "publish":
+        sys.exit(run_publish_cli(cli_args))
+    if cli_args.command == "export":
+        sys.exit(run_export_cli(cli_args))
     show_loading()
-    try: asyncio.run(main())
-    except (KeyboardInterrupt, EOFError): pass
\ No newline at end of file
+    try: asyncio.run(main(cli_args.record_keys))
+    except (KeyboardInterrupt, EOFError): pass
+    if cli_args.profile_startup:
+        print(startup_report())
\ No newline at end of file
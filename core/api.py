@@ -0,0 +1,151 @@
+# api.py
+# Blogger API calls. Everything here blocks on the network, so the editor only
+# ever runs it through ApiWorker, never on the prompt_toolkit event loop.
+
+import time
+
+from core.background import BackgroundWorker
+
+PAGE_SIZE = 20  # Posts per posts().list page
+BATCH_SIZE = 50  # Requests per batch HTTP call
+
+
+class ApiWorker(BackgroundWorker):
+    """One thread for all Blogger traffic.
+
+    googleapiclient's httplib2 transport isn't thread-safe, so calls are
+    serialized on a single thread; the UI keeps running while they are in flight.
+    Kinds used by the editor: "auth", "refresh", "save", "load", "list", "outbox", "bulk".
+    """
+
+    def __init__(self):
+        super().__init__(name="blim-api")
+
+
+def push_post(service, blog_id, post_id, body, is_draft):
+    """Inserts a new post, or patches post_id with just the fields in body and
+    publishes it unless is_draft. Returns the saved post resource."""
+    if not post_id:
+        return service.posts().insert(blogId=blog_id, body=body, isDraft=is_draft).execute()
+    res = None
+    if body:
+        res = service.posts().patch(blogId=blog_id, postId=post_id, body=body).execute()
+    if not is_draft: res = service.posts().publish(blogId=blog_id, postId=post_id).execute()
+    return res
+
+
+def is_rate_limited(exception):
+    """True for quota errors that go away on their own (per-minute limits), not daily ones."""
+    status = getattr(getattr(exception, 'resp', None), 'status', None)
+    if status == 429:
+        return True
+    return status == 403 and b'ratelimitexceeded' in (getattr(exception, 'content', b'') or b'').lower()
+
+
+def execute_batched(service, requests, progress=None, pause=0.0, retries=0, sleep=time.sleep, partial=False):
+    """Runs [(request_id, HttpRequest)] as batch HTTP calls of BATCH_SIZE.
+
+    Returns {request_id: response}, holding the exception instead for requests
+    that failed individually. A failure of a whole batch call is raised, unless
+    partial: then the responses received so far are kept, and that exception is
+    returned for every request without one and nothing more is sent.
+    For long runs, pause spaces out the batch calls, rate-limited requests are
+    retried up to retries times with a growing backoff, and progress(done,
+    total) is called after each batch.
+    """
+    results = {}
+
+    def _collect(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    pending, total, done = list(requests), len(requests), 0
+    for attempt in range(retries + 1):
+        throttled = []
+        for start in range(0, len(pending), BATCH_SIZE):
+            if pause and (start or attempt):
+                sleep(pause)
+            chunk = pending[start:start + BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, request in chunk:
+                batch.add(request, request_id=request_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                if not partial:
+                    raise
+                for request_id, _ in pending[start:]:
+                    results.setdefault(request_id, e)
+                return results
+            for request_id, request in chunk:
+                if attempt < retries and is_rate_limited(results.get(request_id)):
+                    throttled.append((request_id, request))
+                else:
+                    done += 1
+            if progress:
+                progress(done, total)
+        if not throttled:
+            break
+        pending = throttled
+        sleep(pause + 2 ** attempt)
+    return results
+
+
+def replay_outbox(service, blog_id, entries, render):
+    """Sends queued saves (see core/outbox.py), oldest first, in batches.
+
+    Inserts and patches go out first, then the publishes of posts that need
+    one. render turns an entry's Markdown into HTML. Returns
+    [(entry, post resource or Exception)] in queue order.
+    """
+    posts = service.posts()
+    writes = []
+    for i, entry in enumerate(entries):
+        body = {}
+        if "title" in entry["fields"]: body["title"] = entry["title"]
+        if "body" in entry["fields"]: body["content"] = render(entry["body"])
+        if "labels" in entry["fields"]: body["labels"] = entry["labels"]
+        if not entry["post_id"]:
+            writes.append((str(i), posts.insert(blogId=blog_id, body=body, isDraft=entry["is_draft"])))
+        elif body:
+            writes.append((str(i), posts.patch(blogId=blog_id, postId=entry["post_id"], body=body)))
+    # partial: a failed batch call mustn't lose the inserts that already went out, or the
+    # next replay would send them again
+    results = execute_batched(service, writes, partial=True)
+
+    publishes = [(str(i), posts.publish(blogId=blog_id, postId=entry["post_id"]))
+                 for i, entry in enumerate(entries)
+                 if entry["post_id"] and not entry["is_draft"] and not isinstance(results.get(str(i)), Exception)]
+    results.update(execute_batched(service, publishes, partial=True))
+    return [(entry, results.get(str(i))) for i, entry in enumerate(entries)]
+
+
+def get_post(service, blog_id, post_id, etag=None):
+    """Fetches a post. With the cached etag it's a conditional GET: None means "not modified"."""
+    request = service.posts().get(blogId=blog_id, postId=post_id, view='AUTHOR')
+    if etag:
+        request.headers['If-None-Match'] = etag
+    try:
+        return request.execute()
+    except Exception as e:
+        if etag and getattr(getattr(e, 'resp', None), 'status', None) == 304:
+            return None
+        raise
+
+
+def list_posts(service, blog_id, page_token=None, max_results=PAGE_SIZE, fetch_bodies=False, labels=None):
+    """One page of posts (LIVE and DRAFT), newest first. Returns (items, next_page_token).
+
+    Bodies are left out by default: the browser only needs titles, and a page
+    without them comes back much faster. labels filters by a label name.
+    """
+    kwargs = dict(blogId=blog_id, maxResults=max_results, status=['LIVE', 'DRAFT'], view='AUTHOR', fetchBodies=fetch_bodies)
+    if page_token:
+        kwargs['pageToken'] = page_token
+    if labels:
+        kwargs['labels'] = labels
+    posts_data = service.posts().list(**kwargs).execute()
+    return posts_data.get('items', []), posts_data.get('nextPageToken')
+
+
+def summarize(post):
+    return {'id': post['id'], 'title': post.get('title', '(Untitled)'), 'status': post.get('status', 'DRAFT')}
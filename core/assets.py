@@ -36,6 +36,11 @@ HELP_TEXT = {
     ────────────────────────────────────────────────────────────────────
     [:sprint NN]     › Start a NN minute Word Sprint
     [:restore]       › Recover content from last crash/exit
+    [:sync]          › Send saves queued while offline (⇪ in status bar)
+    [:perf]          › Toggle the performance overlay (frames, lexer, GC, API)
+    [:perf mem]      › Also trace memory (slower while on)
+    [:perf dump F]   › Write the metrics to JSON file F (default config/)
+    [:mem]           › Memory growth and the last garbage collection decision
     [:new]           › Clear screen for a fresh start
     [:speed NN]      › Set reading speed (words per minute)
     [:add WORD]      › Add WORD to custom dictionary
@@ -43,6 +48,12 @@ HELP_TEXT = {
     [Ctrl+T]         › Toggle Ghost Mode (Hide UI while writing)
     [Ctrl+D]         › Run Spellcheck / Dictionary Check
 
+  ◆ BULK OPERATIONS  (LABEL may be * for every post)
+    ────────────────────────────────────────────────────────────────────
+    [:relabel A B]   › Rename label A to B on every post (B = - removes it)
+    [:republish L]   › Publish every draft labelled L
+    [:revert L]      › Turn every live post labelled L back into a draft
+
   ◆ PUBLISHING & SAVING
     ────────────────────────────────────────────────────────────────────
     [Ctrl+S]         › Save as DRAFT (Uploads to Blogger)
@@ -79,6 +90,11 @@ HELP_TEXT = {
     ────────────────────────────────────────────────────────────────────
     [:sprint NN]     › Iniciar Sprint de Escritura de NN minutos
     [:restore]       › Recuperar contenido tras error/salida
+    [:sync]          › Enviar guardados en cola sin conexión (⇪ en la barra)
+    [:perf]          › Panel de rendimiento (fotogramas, lexer, GC, API)
+    [:perf mem]      › Medir también la memoria (más lento mientras esté activo)
+    [:perf dump F]   › Guardar las métricas en el archivo JSON F (por defecto config/)
+    [:mem]           › Crecimiento de memoria y última decisión de recolección
     [:new]           › Limpiar pantalla (Nueva entrada)
     [:speed NN]      › Establecer velocidad de lectura (palabras por minuto)
     [:add PALABRA]   › Agregar PALABRA al diccionario personalizado
@@ -86,6 +102,12 @@ HELP_TEXT = {
     [Ctrl+T]         › Modo Fantasma (Ocultar interfaz al escribir)
     [Ctrl+D]         › Verificar Ortografía (Diccionario)
 
+  ◆ OPERACIONES MASIVAS  (ETIQUETA puede ser * para todas)
+    ────────────────────────────────────────────────────────────────────
+    [:relabel A B]   › Renombrar la etiqueta A a B en todas (B = - la quita)
+    [:republish E]   › Publicar todos los borradores con la etiqueta E
+    [:revert E]      › Volver a borrador todas las entradas publicadas con E
+
   ◆ PUBLICACIÓN Y GUARDADO
     ────────────────────────────────────────────────────────────────────
     [Ctrl+S]         › Guardar BORRADOR (Sube a Blogger)
@@ -147,6 +169,36 @@ TRANSLATIONS = {
             'addall_no_spell': "Dictionary not active. Press Ctrl+D first",
             'confirm_publish': "CONFIRM PUBLISH (y/n)",
             'publish_cancelled': "Publication cancelled",
+            'dict_loading': "Loading Dictionary...",
+            'dict_error': "Dictionary Error",
+            'spell_checking': "Checking spelling...",
+            'connecting': "Connecting to Blogger...",
+            'saving': "Saving...",
+            'save_queued': "Save queued...",
+            'loading_post': "Loading post...",
+            'loaded_cached': "Loaded from local cache",
+            'remote_newer': "Newer version on Blogger (reload to discard edits)",
+            'save_unchanged': "No changes to save",
+            'autosaved': "Draft autosaved",
+            'outbox_queued': "Offline: save queued ({count} pending, :sync to retry)",
+            'outbox_sent': "Sent {count} queued save(s)",
+            'outbox_error': "{count} queued save(s) failed, will retry",
+            'bulk_usage': "Usage: :relabel OLD NEW | :republish LABEL | :revert LABEL",
+            'bulk_planning': "Finding matching posts...",
+            'bulk_busy': "A bulk operation is already running",
+            'bulk_none': "No posts match",
+            'bulk_confirm': "{op} {count} posts? (y/n)",
+            'bulk_cancelled': "Bulk operation cancelled",
+            'bulk_done': "Bulk done: {ok} ok, {failed} failed",
+            'bulk_error': "Bulk error: {error}",
+            'perf_on': "Perf overlay on (:perf dump to save)",
+            'perf_off': "Perf overlay off",
+            'perf_mem_on': "Perf: tracing memory (slows the editor while on)",
+            'perf_mem_off': "Perf: memory tracing off",
+            'perf_mem_external': "Perf: memory is already traced outside Blim; it stays on",
+            'perf_dumped': "Perf metrics written to {path}",
+            'perf_error': "Perf dump failed: {error}",
+            'mem_summary': "Memory: {summary}",
         },
         "messages": {
             "offline": "⚠️ OFFLINE MODE: Google unreachable.",
@@ -206,6 +258,36 @@ TRANSLATIONS = {
             'addall_no_spell': "El diccionario no está activo. Presiona Ctrl+D primero.",
             'confirm_publish': "¿CONFIRMAR PUBLICACIÓN? (y/n)",
             'publish_cancelled': "Publicación cancelada",
+            'dict_loading': "Cargando diccionario...",
+            'dict_error': "Error de diccionario",
+            'spell_checking': "Revisando ortografía...",
+            'connecting': "Conectando con Blogger...",
+            'saving': "Guardando...",
+            'save_queued': "Guardado en cola...",
+            'loading_post': "Cargando entrada...",
+            'loaded_cached': "Cargada desde caché local",
+            'remote_newer': "Hay una versión más reciente en Blogger (recarga para descartar cambios)",
+            'save_unchanged': "No hay cambios que guardar",
+            'autosaved': "Borrador guardado automáticamente",
+            'outbox_queued': "Offline: guardado en cola ({count} pendientes, :sync para reintentar)",
+            'outbox_sent': "{count} guardado(s) en cola enviados",
+            'outbox_error': "Fallaron {count} guardado(s) en cola, se reintentará",
+            'bulk_usage': "Uso: :relabel VIEJA NUEVA | :republish ETIQUETA | :revert ETIQUETA",
+            'bulk_planning': "Buscando entradas...",
+            'bulk_busy': "Ya hay una operación masiva en curso",
+            'bulk_none': "Ninguna entrada coincide",
+            'bulk_confirm': "¿{op} {count} entradas? (y/n)",
+            'bulk_cancelled': "Operación masiva cancelada",
+            'bulk_done': "Operación masiva: {ok} bien, {failed} fallidas",
+            'bulk_error': "Error en operación masiva: {error}",
+            'perf_on': "Panel de rendimiento activo (:perf dump para guardar)",
+            'perf_off': "Panel de rendimiento oculto",
+            'perf_mem_on': "Perf: midiendo memoria (ralentiza el editor mientras esté activo)",
+            'perf_mem_off': "Perf: medición de memoria desactivada",
+            'perf_mem_external': "Perf: la memoria ya se mide fuera de Blim; sigue activa",
+            'perf_dumped': "Métricas de rendimiento guardadas en {path}",
+            'perf_error': "No se pudieron guardar las métricas: {error}",
+            'mem_summary': "Memoria: {summary}",
         },
         "messages": {
             "offline": "⚠️ MODO OFFLINE: Google inaccesible.",
@@ -0,0 +1,75 @@
+# auth.py
+# Google credentials and the Blogger client, built once per session.
+#
+# The client uses the discovery document bundled with googleapiclient (no
+# network fetch) and a single httplib2.Http, so every call after the first
+# reuses the same keep-alive HTTPS connection. The access token is refreshed
+# ahead of expiry from the background instead of inline on the next save.
+# Google libraries are imported inside the functions: they are slow to load
+# and are never needed before the first frame.
+
+import os
+import datetime
+
+SCOPES = ['https://www.googleapis.com/auth/blogger']
+REFRESH_MARGIN = 300  # Seconds before expiry at which the token is renewed
+HTTP_TIMEOUT = 30
+
+_token_session = None  # requests.Session for the token endpoint, kept alive across refreshes
+
+
+def _token_request():
+    global _token_session
+    import requests
+    from google.auth.transport.requests import Request
+    if _token_session is None:
+        _token_session = requests.Session()
+    return Request(session=_token_session)
+
+
+def save_credentials(creds, token_path):
+    with open(token_path, 'w') as token:
+        token.write(creds.to_json())
+
+
+def load_credentials(token_path, secrets_path, interactive=True):
+    """Stored credentials, refreshed if expired. Without usable ones, runs the
+    browser consent flow if interactive, otherwise returns None."""
+    from google.oauth2.credentials import Credentials
+    creds = None
+    if os.path.exists(token_path):
+        creds = Credentials.from_authorized_user_file(token_path)
+    if creds and creds.valid:
+        return creds
+    if creds and creds.expired and creds.refresh_token:
+        creds.refresh(_token_request())
+    elif interactive:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        flow = InstalledAppFlow.from_client_secrets_file(secrets_path, SCOPES)
+        creds = flow.run_local_server(port=0)
+    else:
+        return None
+    save_credentials(creds, token_path)
+    return creds
+
+
+def build_service(creds):
+    """Blogger v3 client over one persistent, authorized HTTP connection."""
+    import httplib2
+    import google_auth_httplib2
+    from googleapiclient.discovery import build
+    http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    return build('blogger', 'v3', http=http, static_discovery=True, cache_discovery=False)
+
+
+def needs_refresh(creds, margin=REFRESH_MARGIN, now=None):
+    if creds is None or not getattr(creds, 'refresh_token', None) or creds.expiry is None:
+        return False
+    now = now or datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)  # expiry is naive UTC
+    return creds.expiry - now <= datetime.timedelta(seconds=margin)
+
+
+def refresh_credentials(creds, token_path):
+    creds.refresh(_token_request())
+    save_credentials(creds, token_path)
+    return creds
@@ -0,0 +1,87 @@
+# background.py
+# Runs blocking work (dictionary loads, Blogger API calls) off the prompt_toolkit
+# event loop and hands the results back to it.
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundWorker:
+    """Single background thread whose results are published on the event loop.
+
+    Jobs are serialized, so two jobs of one worker never race each other.
+    Each job has a kind ("load", "save", ...); submitting a new job of the same
+    kind makes the older one stale and its result is dropped instead of published.
+    on_done receives the job's return value, or the exception it raised.
+    Callbacks run on the event loop thread. Without a running loop (tests,
+    headless use) jobs run inline.
+    """
+
+    def __init__(self, name="blim-worker"):
+        self.name = name
+        self._executor = None
+        self._tickets = {}
+        self.on_timed = None  # on_timed(kind, seconds) after every job, from the job's thread (:perf)
+
+    def is_busy(self, kind):
+        return self._tickets.get(kind, (0, False))[1]
+
+    def busy_kinds(self):
+        return [kind for kind, (_, busy) in self._tickets.items() if busy]
+
+    def submit(self, kind, func, *args, on_done=None):
+        ticket = self._tickets.get(kind, (0, False))[0] + 1
+        self._tickets[kind] = (ticket, True)
+        if self.on_timed is not None:
+            func = self._timed(kind, func, self.on_timed)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = e
+            self._finish(kind, ticket, result, on_done)
+            return None
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        future = loop.run_in_executor(self._executor, func, *args)
+
+        def _done(fut):
+            if fut.cancelled():
+                return
+            error = fut.exception()
+            self._finish(kind, ticket, error if error else fut.result(), on_done)
+
+        future.add_done_callback(_done)
+        return future
+
+    @staticmethod
+    def _timed(kind, func, report):
+        def run(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                report(kind, time.perf_counter() - start)
+        return run
+
+    def _finish(self, kind, ticket, result, on_done):
+        if self._tickets.get(kind, (0, False))[0] != ticket:
+            return  # A newer job of this kind was submitted; this result is stale
+        # Nothing of this kind is left in flight: forget it, so per-item kinds
+        # ("prefetch:<id>") don't pile up for the whole session
+        del self._tickets[kind]
+        if on_done:
+            on_done(result)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,61 @@
+# bulk.py
+# Operations over many posts at once, behind the :relabel, :republish and
+# :revert commands. Planning lists the matching posts (cheap, no bodies);
+# running sends one request per post through batch HTTP calls, paced to stay
+# under the Blogger quota.
+
+from core.api import execute_batched, list_posts
+
+BULK_PAGE = 100     # Posts per posts().list page while collecting targets
+BULK_PAUSE = 1.0    # Seconds between batch calls
+BULK_RETRIES = 3    # Extra rounds for requests that hit the per-minute rate limit
+ALL = "*"           # Label argument matching every post
+OPERATIONS = ("relabel", "republish", "revert")
+
+
+def plan_bulk(service, blog_id, op, args):
+    """Returns the posts op would touch. args: (old, new) for relabel, (label,) otherwise.
+
+    relabel takes posts labelled old (new "-" just removes it), republish takes
+    drafts and revert takes live posts carrying the label.
+    """
+    label = args[0]
+    targets, token = [], None
+    while True:
+        items, token = list_posts(service, blog_id, page_token=token, max_results=BULK_PAGE,
+                                  labels=None if label == ALL else label)
+        targets.extend(items)
+        if not token:
+            break
+    if op == "republish":
+        targets = [p for p in targets if p.get('status') == 'DRAFT']
+    elif op == "revert":
+        targets = [p for p in targets if p.get('status') == 'LIVE']
+    return targets
+
+
+def relabeled(labels, old, new):
+    result = []
+    for label in labels:
+        label = new if label == old else label
+        if label != "-" and label not in result:
+            result.append(label)
+    return result
+
+
+def run_bulk(service, blog_id, op, args, targets, progress=None, pause=BULK_PAUSE):
+    """Applies op to every planned post. Returns [(post, resource or Exception)]."""
+    posts = service.posts()
+    requests = []
+    for i, post in enumerate(targets):
+        if op == "relabel":
+            body = {'labels': relabeled(post.get('labels', []), *args)}
+            request = posts.patch(blogId=blog_id, postId=post['id'], body=body)
+        elif op == "republish":
+            request = posts.publish(blogId=blog_id, postId=post['id'])
+        else:
+            request = posts.revert(blogId=blog_id, postId=post['id'])
+        requests.append((str(i), request))
+
+    results = execute_batched(service, requests, progress=progress, pause=pause, retries=BULK_RETRIES)
+    return [(post, results.get(str(i))) for i, post in enumerate(targets)]
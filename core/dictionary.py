@@ -0,0 +1,207 @@
+# dictionary.py
+# Precompiled, memory-mapped word lists for spellchecking.
+#
+# pyspellchecker ships each language as a gzipped JSON frequency map that takes
+# a full parse (and tens of MB of dict) every time it is loaded. Blim only needs
+# membership, so each word list is compiled once into a sorted index:
+#
+#   b"BLIMDX01" | uint32 count | uint32 longest | uint32 offsets[count + 1] | utf-8 words
+#
+# All integers are little-endian. Words are sorted by their UTF-8 bytes, so a
+# lookup is a binary search straight over the mmap: opening an index is instant
+# and only the pages that get touched are ever resident.
+#
+# Build step (also done lazily the first time a language is needed):
+#   python -m core.dictionary build [--dir config/dicts] [es en ...]
+
+import os
+import re
+import sys
+import mmap
+import string
+import struct
+from array import array
+
+MAGIC = b"BLIMDX01"
+HEADER = struct.Struct("<8sII")
+INDEX_EXT = ".bdx"
+DEFAULT_LANGS = ("es", "en")
+
+
+def build_index(words, path):
+    """Writes a sorted index for words to path (atomically)."""
+    encoded = sorted({w.encode("utf-8") for w in words if w})
+    offsets = array("I", [0])
+    total = 0
+    for w in encoded:
+        total += len(w)
+        offsets.append(total)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    longest = max((len(w.decode("utf-8")) for w in encoded), default=0)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded), longest))
+        f.write(offsets.tobytes())
+        f.write(b"".join(encoded))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+def language_words(lang):
+    """Reads the word list pyspellchecker ships for lang (build time only)."""
+    import gzip, json
+    import spellchecker #<-- Only needed to compile an index, never at runtime
+    resource = os.path.join(os.path.dirname(spellchecker.__file__), "resources", f"{lang}.json.gz")
+    with gzip.open(resource, "rt", encoding="utf-8") as f:
+        return json.load(f).keys()
+
+
+def text_file_words(path):
+    # Same tokenizing pyspellchecker applies to custom dictionary files
+    with open(path, "r", encoding="utf-8") as f:
+        return re.findall(r"\w+", f.read().lower())
+
+
+class WordIndex:
+    """Read-only view over one compiled index file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._view = None
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"Not a Blim dictionary index: {path}")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.longest_word_length = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a Blim dictionary index: {path}")
+
+        table_end = HEADER.size + 4 * (self.count + 1)
+        if sys.byteorder == "little":
+            self._view = memoryview(self._mm)
+            self._offsets = self._view[HEADER.size:table_end].cast("I")
+        else:
+            self._offsets = array("I", self._mm[HEADER.size:table_end])
+            self._offsets.byteswap()
+        self._blob_start = table_end
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        key = word.encode("utf-8")
+        mm, offsets, base = self._mm, self._offsets, self._blob_start
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = mm[base + offsets[mid]:base + offsets[mid + 1]]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def close(self):
+        if self._view is not None:
+            self._offsets.release()
+            self._view.release()
+        self._mm.close()
+        self._file.close()
+
+
+def ensure_language_index(lang, index_dir):
+    path = os.path.join(index_dir, lang + INDEX_EXT)
+    if not os.path.exists(path):
+        build_index(language_words(lang), path)
+    return path
+
+
+def ensure_custom_index(custom_dict_path):
+    """Compiles custom_dictionary.txt next to itself; rebuilt whenever the text file is newer."""
+    if not custom_dict_path or not os.path.exists(custom_dict_path):
+        return None
+    path = os.path.splitext(custom_dict_path)[0] + INDEX_EXT
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(custom_dict_path):
+        build_index(text_file_words(custom_dict_path), path)
+    return path
+
+
+class CompactDictionary:
+    """Membership-only replacement for SpellChecker backed by compiled indexes.
+
+    Words added during the session (:add, :addall) live in a small in-memory set
+    until the next load picks them up from the recompiled custom index.
+    """
+
+    def __init__(self, index_paths, lang=None):
+        self.lang = lang
+        self._indexes = [WordIndex(p) for p in index_paths if p]
+        self._session_words = set()
+        self.longest_word_length = max((i.longest_word_length for i in self._indexes), default=0)
+
+    def __contains__(self, word):
+        word = word.lower()
+        if word in self._session_words:
+            return True
+        return any(word in index for index in self._indexes)
+
+    def _should_check(self, word):
+        # Mirrors SpellChecker: skip punctuation, numbers and absurdly long tokens
+        if len(word) == 1 and word in string.punctuation:
+            return False
+        if len(word) > self.longest_word_length + 3:
+            return False
+        if word == "nan":
+            return True
+        try:
+            float(word)
+            return False
+        except ValueError:
+            return True
+
+    def unknown(self, words):
+        return {w for w in {w.lower() for w in words} if self._should_check(w) and w not in self}
+
+    def known(self, words):
+        return {w for w in {w.lower() for w in words} if w in self}
+
+    def load_words(self, words):
+        self._session_words.update(w.lower() for w in words)
+
+    def close(self):
+        for index in self._indexes:
+            index.close()
+        self._indexes = []
+
+
+def open_dictionary(lang, index_dir, custom_dict_path=None):
+    """Opens (building first if needed) the indexes for lang plus the custom words."""
+    paths = [ensure_language_index(lang, index_dir), ensure_custom_index(custom_dict_path)]
+    return CompactDictionary(paths, lang=lang)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile Blim spellcheck dictionaries.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("langs", nargs="*", default=list(DEFAULT_LANGS))
+    parser.add_argument("--dir", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "dicts"))
+    parser.add_argument("--custom", default=None, help="custom_dictionary.txt to compile as well")
+    args = parser.parse_args()
+
+    for lang in args.langs:
+        path = os.path.join(args.dir, lang + INDEX_EXT)
+        count = build_index(language_words(lang), path)
+        print(f"{lang}: {count} words -> {path}")
+    if args.custom:
+        print(f"custom -> {ensure_custom_index(args.custom)}")
@@ -0,0 +1,169 @@
+# export.py
+# Local archive of the whole blog (LIVE and DRAFT):
+#
+#   python blim.py export DIR [--full]
+#
+# Every post becomes DIR/<id>-<slug>.md with front matter the publish command
+# understands (title, labels, id) plus status, published, updated and url.
+# DIR/.blim-export.json keeps track of what is on disk:
+#
+#   {"since": <newest 'updated' of the last complete run>,
+#    "run": {"since": ..., "newest": ..., "cursors": {"LIVE": <pageToken>, ...}, "done": [...]},
+#    "posts": {<id>: {"updated": ..., "file": ...}}}
+#
+# LIVE and DRAFT are paged concurrently, newest update first. Page cursors are
+# saved after every page, so an interrupted run resumes where it stopped; a
+# later run stops paging at the first post older than "since".
+
+import os
+import re
+import json
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+STATUSES = ("LIVE", "DRAFT")
+EXPORT_PAGE = 50  # Posts (with bodies) per posts().list page
+MANIFEST = ".blim-export.json"
+
+
+def default_http_factory(service):
+    """A fresh authorized transport per thread: httplib2 connections can't be shared."""
+    import httplib2
+    import google_auth_httplib2
+    return google_auth_httplib2.AuthorizedHttp(service._http.credentials, http=httplib2.Http())
+
+
+def _timestamp(value):
+    try:
+        return datetime.fromisoformat((value or "").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _slug(title):
+    return re.sub(r"[^\w]+", "-", (title or "").lower()).strip("-")[:50] or "untitled"
+
+
+class BlogExporter:
+    def __init__(self, service, blog_id, out_dir, convert, http_factory=default_http_factory, progress=None):
+        self.service, self.blog_id, self.out_dir = service, blog_id, out_dir
+        self.convert = convert            # Blogger HTML -> Markdown
+        self.http_factory = http_factory  # None: the service's own transport (single-threaded use)
+        self.progress = progress          # progress(written, skipped) after each page
+        self.manifest_path = os.path.join(out_dir, MANIFEST)
+        self.written = self.skipped = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def run(self, full=False):
+        """Exports new and changed posts (everything with full=True). Returns (written, skipped)."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.state = self._load_manifest()
+        if full:
+            self.state["since"], self.state["run"] = None, None
+        run = self.state["run"]
+        if run is None:  # Fresh run; otherwise resume the interrupted one
+            run = self.state["run"] = {"since": self.state["since"], "newest": self.state["since"],
+                                       "cursors": {}, "done": []}
+        todo = [status for status in STATUSES if status not in run["done"]]
+        with ThreadPoolExecutor(max_workers=len(STATUSES), thread_name_prefix="blim-export") as pool:
+            for future in [pool.submit(self._stream, status, full) for status in todo]:
+                future.result()  # Re-raises; the saved cursors let the next run resume
+
+        self.state["since"], self.state["run"] = run["newest"], None
+        self._save_manifest()
+        return self.written, self.skipped
+
+    def _http(self):
+        if self.http_factory is None:
+            return None
+        if not hasattr(self._local, "http"):
+            self._local.http = self.http_factory(self.service)
+        return self._local.http
+
+    def _stream(self, status, full):
+        run = self.state["run"]
+        since = None if full else _timestamp(run["since"])
+        token = run["cursors"].get(status)
+        while True:
+            kwargs = dict(blogId=self.blog_id, status=[status], view='AUTHOR', fetchBodies=True,
+                          orderBy='updated', maxResults=EXPORT_PAGE)
+            if token:
+                kwargs['pageToken'] = token
+            page = self.service.posts().list(**kwargs).execute(http=self._http())
+
+            reached_known = False
+            for post in page.get('items', []):
+                updated = _timestamp(post.get('updated'))
+                if since and updated and updated < since:
+                    reached_known = True  # Everything after this was exported by an earlier run
+                    break
+                self._write_post(post)
+
+            token = page.get('nextPageToken')
+            with self._lock:
+                run["cursors"][status] = token
+                if reached_known or not token:
+                    run["done"].append(status)
+                self._save_manifest()
+            if self.progress:
+                self.progress(self.written, self.skipped)
+            if reached_known or not token:
+                return
+
+    def _write_post(self, post):
+        known = self.state["posts"].get(post['id'])
+        if known and known["updated"] == post.get('updated') and os.path.exists(os.path.join(self.out_dir, known["file"])):
+            with self._lock:
+                self.skipped += 1
+            return
+
+        name = f"{post['id']}-{_slug(post.get('title'))}.md"
+        front = [
+            "---",
+            f"title: {post.get('title', '')}",
+            f"labels: {', '.join(post.get('labels', []))}",
+            f"id: {post['id']}",
+            f"status: {post.get('status', '')}",
+            f"published: {post.get('published', '')}",
+            f"updated: {post.get('updated', '')}",
+            f"url: {post.get('url', '')}",
+            "---",
+            "",
+        ]
+        text = "\n".join(front) + self.convert(post.get('content', '')) + "\n"
+        path = os.path.join(self.out_dir, name)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(path + ".tmp", path)
+
+        with self._lock:
+            if known and known["file"] != name:  # Retitled: drop the old file
+                try:
+                    os.remove(os.path.join(self.out_dir, known["file"]))
+                except OSError:
+                    pass
+            self.state["posts"][post['id']] = {"updated": post.get('updated'), "file": name}
+            run = self.state["run"]
+            updated, newest = _timestamp(post.get('updated')), _timestamp(run["newest"])
+            if updated and (newest is None or updated > newest):
+                run["newest"] = post.get('updated')
+            self.written += 1
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault("since", None)
+        state.setdefault("run", None)
+        state.setdefault("posts", {})
+        return state
+
+    def _save_manifest(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
@@ -0,0 +1,262 @@
+# markdown.py
+# Markdown handling shared by the editor's highlighter and the Blogger exporter.
+
+import re
+
+# --- Inline tokenizer ---
+# One compiled alternation scanned left to right. At any position the earliest
+# match wins and ties go to the first alternative, so spans never overlap
+# (a link inside bold text is part of the bold span, not a second fragment).
+# The leading lookahead lets the scanner skip plain characters cheaply.
+INLINE_TOKENS = re.compile(
+    r'(?=[`*~\[])'
+    r'(?:(?P<code>`.*?`)'
+    r'|(?P<bold>\*\*.*?\*\*)'
+    r'|(?P<strike>~~.*?~~)'
+    r'|(?P<link>\[.*?\]\(.*?\))'
+    r'|(?P<italic>(?<!\*)\*[^*].*?[^*]\*(?!\*)))'
+)
+
+INLINE_STYLES = {
+    'code': 'class:md.code',
+    'bold': 'class:md.bold',
+    'strike': 'class:md.strike',
+    'link': 'class:md.link',
+    'italic': 'class:md.italic',
+}
+
+
+def iter_inline_spans(line):
+    """Yields non-overlapping (start, end, style) spans in order, in a single pass."""
+    for m in INLINE_TOKENS.finditer(line):
+        yield m.start(), m.end(), INLINE_STYLES[m.lastgroup]
+
+
+# --- Markdown to HTML ---
+# Blogger-ready HTML in one walk over the lines. Block structure is decided per
+# line (headers, quotes, hr, list items, paragraphs, raw HTML); inline markup is
+# rendered with one compiled scanner, recursing only into matched spans.
+
+INLINE_HTML = re.compile(
+    r'(?=[*~\[])'
+    r'(?:\*\*(?P<bold>.*?)\*\*'
+    r'|~~(?P<strike>.*?)~~'
+    r'|\[(?P<text>.*?)\]\((?P<href>.*?)\)'
+    # Italic needs non-space just inside the stars, so "2 * 3 * 4" stays maths
+    r'|(?<!\*)\*(?P<italic>[^\s*](?:.*?[^\s*])?)\*(?!\*))'
+)
+
+HEADERS = (('### ', 'h3'), ('## ', 'h2'), ('# ', 'h1'))
+
+
+def render_inline(text):
+    if '*' not in text and '~' not in text and '[' not in text:
+        return text
+    out = []
+    last = 0
+    for m in INLINE_HTML.finditer(text):
+        out.append(text[last:m.start()])
+        kind = m.lastgroup
+        if kind == 'bold':
+            out.append(f"<b>{render_inline(m.group('bold'))}</b>")
+        elif kind == 'strike':
+            out.append(f"<s>{render_inline(m.group('strike'))}</s>")
+        elif kind == 'italic':
+            out.append(f"<i>{render_inline(m.group('italic'))}</i>")
+        else:
+            out.append(f"<a href=\"{m.group('href')}\">{render_inline(m.group('text'))}</a>")
+        last = m.end()
+    out.append(text[last:])
+    return "".join(out)
+
+
+def iter_html(md_text):
+    """Yields the HTML for md_text chunk by chunk, one block at a time."""
+    paragraph = []   # Lines of the paragraph being collected
+    in_list = False
+
+    def flush_paragraph():
+        text = "\n".join(paragraph).strip()
+        paragraph.clear()
+        if not text:
+            return ""
+        if text.startswith('<'):
+            # Raw HTML typed (or loaded) into the editor goes through untouched
+            return render_inline(text)
+        return "<p>" + "<br />".join(render_inline(line) for line in text.split('\n')) + "</p>"
+
+    for line in md_text.split('\n'):
+        if line.startswith('* '):
+            if paragraph: yield flush_paragraph()
+            if not in_list:
+                yield "<ul>"
+                in_list = True
+            yield f"<li>{render_inline(line[2:])}</li>"
+            continue
+
+        if in_list:
+            yield "</ul>"
+            in_list = False
+
+        if not line.strip():
+            if paragraph: yield flush_paragraph()
+            continue
+
+        block = None
+        if line.startswith('> '):
+            block = f"<blockquote>{render_inline(line[2:])}</blockquote>"
+        elif line == '---':
+            block = "<hr />"
+        elif line.startswith('#'):
+            for marker, tag in HEADERS:
+                if line.startswith(marker):
+                    block = f"<{tag}>{render_inline(line[len(marker):])}</{tag}>"
+                    break
+
+        if block is None:
+            paragraph.append(line)
+        else:
+            if paragraph: yield flush_paragraph()
+            yield block
+
+    if in_list:
+        yield "</ul>"
+    if paragraph:
+        yield flush_paragraph()
+
+
+def render_html(md_text):
+    return "".join(iter_html(md_text))
+
+
+# --- HTML to Markdown ---
+# Turns Blogger HTML (ours or the web composer's) back into editor Markdown in
+# one linear pass of html.parser. No regex spans whole tags, so large posts with
+# deeply nested markup can't trigger catastrophic backtracking.
+
+from html.parser import HTMLParser
+
+INLINE_MARKERS = {'b': '**', 'strong': '**', 'i': '*', 'em': '*', 's': '~~', 'strike': '~~', 'del': '~~', 'code': '`'}
+HEADER_MARKERS = {'h1': '# ', 'h2': '## ', 'h3': '### ', 'h4': '### ', 'h5': '### ', 'h6': '### '}
+BLOCK_TAGS = {'p', 'div', 'ul', 'ol', 'table', 'pre', 'figure'}
+SKIPPED_TAGS = {'script', 'style', 'head', 'title'}
+
+# html.parser reports the & of "AT&T" or "Q&A" as an entity reference without
+# saying whether a ; followed. Such unterminated ones are hidden from it behind a
+# private-use character and turned back into & in the finished Markdown.
+BARE_ENTITY = re.compile(r'&(?=[a-zA-Z][-.a-zA-Z0-9]*(?![-.a-zA-Z0-9;]))')
+BARE_AMP = '\ue000'
+
+
+class MarkdownWriter(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self._buffers = [[]]    # One per open blockquote; outermost is the document
+        self._links = []        # href of each open <a>, or None
+        self._skip = 0
+
+    # --- Output helpers ---
+    @property
+    def _out(self):
+        return self._buffers[-1]
+
+    def _trailing_newlines(self):
+        count = 0
+        for chunk in reversed(self._out):
+            stripped = chunk.rstrip('\n')
+            count += len(chunk) - len(stripped)
+            if stripped:
+                return count
+        return None  # Buffer is empty: nothing to separate from
+
+    def _break(self, newlines):
+        have = self._trailing_newlines()
+        if have is not None and have < newlines:
+            self._out.append('\n' * (newlines - have))
+
+    def _write(self, text):
+        if self._skip:
+            return
+        if not text.strip():
+            have = self._trailing_newlines()
+            if have is None or have > 0:
+                return  # Formatting whitespace between blocks
+        self._out.append(text)
+
+    # --- HTMLParser callbacks ---
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+        elif tag in INLINE_MARKERS:
+            self._write(INLINE_MARKERS[tag])
+        elif tag == 'a':
+            href = dict(attrs).get('href')
+            self._links.append(href)
+            if href is not None:
+                self._write('[')
+        elif tag == 'br':
+            self._out.append('\n')
+        elif tag in HEADER_MARKERS:
+            self._break(2)
+            self._write(HEADER_MARKERS[tag])
+        elif tag == 'li':
+            self._break(1)
+            self._write('* ')
+        elif tag == 'blockquote':
+            self._break(2)
+            self._buffers.append([])
+        elif tag == 'hr':
+            self._break(2)
+            self._out.append('---')
+            self._break(2)
+        elif tag == 'img':
+            # Images stay as raw HTML so they survive the next save untouched
+            self._out.append(self.get_starttag_text())
+        elif tag in BLOCK_TAGS:
+            self._break(2)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in INLINE_MARKERS:
+            self._write(INLINE_MARKERS[tag])
+        elif tag == 'a':
+            href = self._links.pop() if self._links else None
+            if href is not None:
+                self._write(f"]({href})")
+        elif tag in HEADER_MARKERS:
+            self._break(2)
+        elif tag == 'li':
+            self._break(1)
+        elif tag == 'blockquote' and len(self._buffers) > 1:
+            quoted = "".join(self._buffers.pop()).strip('\n')
+            # render_html has no blank quote line (">"): paragraphs become separate quotes
+            self._out.append("\n".join(f"> {line}" if line.strip() else "" for line in quoted.split('\n')))
+            self._break(2)
+        elif tag in BLOCK_TAGS:
+            self._break(2)
+
+    def handle_data(self, data):
+        self._write(data)
+
+    def handle_entityref(self, name):
+        self._write(f"&{name};")
+
+    def handle_charref(self, name):
+        self._write(f"&#{name};")
+
+    def markdown(self):
+        self.close()
+        while len(self._buffers) > 1:  # Unclosed blockquotes
+            self.handle_endtag('blockquote')
+        text = "".join(self._out).replace(BARE_AMP, '&')
+        return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def html_to_markdown(html):
+    writer = MarkdownWriter()
+    writer.feed(BARE_ENTITY.sub(BARE_AMP, html))
+    return writer.markdown()
@@ -0,0 +1,131 @@
+# memory.py
+# When Blim collects garbage, instead of gc.collect() on every Tab, arrow key
+# and browser move.
+#
+# Once the first frame is up and the Google client has been warmed up,
+# everything alive (modules, prompt_toolkit, the layout, the editor, the client)
+# is collected once and frozen with gc.freeze(), so later full collections no
+# longer walk it. The generation-0 threshold is raised, since
+# the lexer churns through many short-lived fragment lists while typing.
+# Explicit collections only happen from tick(), once the writer has been idle
+# for a moment, and only when one of these is true:
+#   - the process grew more than RSS_BUDGET since the last collection
+#   - more than BLOCKS_BUDGET new allocator blocks are alive
+#   - something big was dropped (release(): browser closed, post or dictionary replaced)
+# Every collection is kept in decisions (and shown by :mem and :perf) with its
+# reason, its pause and what it freed.
+
+import gc
+import os
+import sys
+import time
+from collections import deque
+
+GC_THRESHOLDS = (5000, 20, 20)  # CPython's default is (700, 10, 10)
+IDLE_AFTER = 2.0                # Seconds without a keystroke before collecting
+RSS_BUDGET = 64 * 2**20         # Growth in bytes since the last collection
+BLOCKS_BUDGET = 500_000         # sys.getallocatedblocks() growth since the last collection
+DECISIONS = 50                  # Past decisions kept for inspection
+
+
+def current_rss():
+    """Resident set size in bytes, or None where it can't be read cheaply (not Linux)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class MemoryGovernor:
+    def __init__(self, rss_budget=RSS_BUDGET, blocks_budget=BLOCKS_BUDGET, idle_after=IDLE_AFTER,
+                 thresholds=GC_THRESHOLDS, clock=time.monotonic, rss=current_rss):
+        self.rss_budget, self.blocks_budget, self.idle_after = rss_budget, blocks_budget, idle_after
+        self.thresholds = thresholds
+        self.clock, self.rss = clock, rss
+        self.decisions = deque(maxlen=DECISIONS)  # Dicts: at, action, reason, pause, freed, rss, blocks
+        self.settled = False
+        self._released = []  # Reasons waiting for the next idle tick
+        self._last_key = clock()
+        self._previous_thresholds = None
+        self._mark()
+
+    def _mark(self):
+        self._rss_mark, self._blocks_mark = self.rss(), sys.getallocatedblocks()
+
+    def settle(self):
+        """Once, after startup's warm-up: collect, freeze the survivors, raise the thresholds."""
+        if self.settled:
+            return
+        start = time.perf_counter()
+        freed = gc.collect()
+        gc.freeze()
+        self._previous_thresholds = gc.get_threshold()
+        gc.set_threshold(*self.thresholds)
+        self.settled = True
+        self._mark()
+        self._record("freeze", "startup", time.perf_counter() - start, freed,
+                     frozen=gc.get_freeze_count(), thresholds=self.thresholds)
+
+    def restore(self):
+        """Undoes settle() (thresholds and freeze), e.g. on exit or between tests."""
+        if self.settled:
+            gc.unfreeze()
+            gc.set_threshold(*self._previous_thresholds)
+            self.settled = False
+
+    def touch(self, _sender=None):
+        # Called on every key press (key processor's after_key_press)
+        self._last_key = self.clock()
+
+    def release(self, reason):
+        """Something large was just dropped: collect at the next idle moment, not now."""
+        if reason not in self._released:
+            self._released.append(reason)
+
+    def pressure(self):
+        """Why a collection is due right now, or None."""
+        if self._released:
+            return ", ".join(self._released)
+        rss = self.rss()
+        if rss is not None and self._rss_mark is not None and rss - self._rss_mark > self.rss_budget:
+            return f"rss +{(rss - self._rss_mark) / 2**20:.0f} MB"
+        blocks = sys.getallocatedblocks() - self._blocks_mark
+        if blocks > self.blocks_budget:
+            return f"{blocks} new blocks"
+        return None
+
+    def tick(self):
+        """Called about once a second from the event loop. Collects if idle and due."""
+        if self.clock() - self._last_key < self.idle_after:
+            return None
+        reason = self.pressure()
+        if reason is None:
+            return None
+        start = time.perf_counter()
+        freed = gc.collect()
+        self._released.clear()
+        self._mark()
+        return self._record("collect", reason, time.perf_counter() - start, freed)
+
+    def _record(self, action, reason, pause, freed, **extra):
+        decision = dict(at=time.time(), action=action, reason=reason, pause=pause, freed=freed,
+                        rss=self._rss_mark, blocks=self._blocks_mark, **extra)
+        self.decisions.append(decision)
+        return decision
+
+    def summary(self):
+        """One line for the status bar: growth against the budgets and the last decision."""
+        rss = self.rss()
+        growth = f"+{(rss - self._rss_mark) / 2**20:.1f}/{self.rss_budget / 2**20:.0f} MB" \
+            if rss is not None and self._rss_mark is not None else "rss n/a"
+        blocks = f"+{sys.getallocatedblocks() - self._blocks_mark}/{self.blocks_budget} blocks"
+        last = self.decisions[-1] if self.decisions else None
+        last = f"{last['action']} ({last['reason']}) {last['pause'] * 1000:.1f} ms, {last['freed']} freed" if last else "none yet"
+        pending = f", pending: {', '.join(self._released)}" if self._released else ""
+        return f"{growth}, {blocks}; last {last}{pending}"
+
+    def snapshot(self):
+        return {"settled": self.settled, "thresholds": gc.get_threshold(), "frozen": gc.get_freeze_count(),
+                "rss_budget": self.rss_budget, "blocks_budget": self.blocks_budget,
+                "pending": list(self._released), "decisions": list(self.decisions)}
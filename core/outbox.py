@@ -0,0 +1,75 @@
+# outbox.py
+# Saves made while Blogger is unreachable, kept on disk (config/outbox.json)
+# until they have been replayed. One entry per post, oldest first:
+#
+#   {"key": "123", "post_id": "123", "title": ..., "body": <markdown>,
+#    "labels": [...], "fields": ["body"], "is_draft": true, "rev": 2}
+#
+# "fields" are the ones changed since the post was last saved remotely, so a
+# replay patches just those. A new post has no post_id yet and is keyed by a
+# local id until its insert comes back.
+
+import os
+import json
+import time
+
+
+class Outbox:
+    """Queued saves; repeated saves of the same post coalesce into one entry."""
+
+    def __init__(self, path=None):
+        self.path = path  # None keeps the queue in memory only (tests)
+        self._entries = self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        return next((e for e in self._entries if e["key"] == key), None)
+
+    def put(self, key, post_id, title, body, labels, fields, is_draft):
+        entry = self.get(key)
+        if entry is None:
+            entry = {"key": key, "post_id": post_id, "fields": [], "is_draft": True, "rev": 0, "queued_at": time.time()}
+            self._entries.append(entry)
+        entry.update(title=title, body=body, labels=labels, post_id=post_id or entry["post_id"])
+        entry["fields"] = sorted(set(entry["fields"]) | set(fields))
+        entry["is_draft"] = entry["is_draft"] and is_draft  # A queued publish is never downgraded
+        entry["rev"] += 1
+        self._write()
+        return entry
+
+    def pending(self):
+        """Copies of the queued entries, safe to hand to the API worker."""
+        return [dict(e) for e in self._entries]
+
+    def done(self, sent, post_id):
+        """Drops an entry once Blogger has it, unless it was saved again in the meantime."""
+        entry = self.get(sent["key"])
+        if entry is None:
+            return
+        if entry["rev"] == sent["rev"]:
+            self._entries.remove(entry)
+        else:
+            # Still queued, but the post exists now: the next replay patches it
+            entry["key"] = entry["post_id"] = post_id
+        self._write()
+
+    def _load(self):
+        if not self.path:
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _write(self):
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,160 @@
+# perf.py
+# Live instrumentation behind the :perf overlay: frame render time, lexer time
+# and fragments per frame, GC pauses, Blogger call latencies and (with :perf mem)
+# tracemalloc current/peak. Nothing is hooked in until it is enabled, so the
+# editor pays for none of this while the overlay is off.
+
+import gc
+import json
+import math
+import time
+import tracemalloc
+from collections import deque, defaultdict
+
+SAMPLES = 500  # Frames (and calls per API kind) kept for averages and p99
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of an unsorted list (p in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered), max(1, math.ceil(p / 100 * len(ordered)))) - 1]
+
+
+def _summary(values):
+    return {"last": values[-1] if values else 0.0, "avg": sum(values) / len(values) if values else 0.0,
+            "p99": percentile(values, 99), "count": len(values)}
+
+
+class PerfMonitor:
+    def __init__(self, governor=None, samples=SAMPLES):
+        self.enabled = False
+        self.governor = governor  # MemoryGovernor whose decisions are shown alongside
+        self.frames = deque(maxlen=samples)  # (render s, lexer s, lines lexed, fragments built)
+        self.api_calls = defaultdict(lambda: deque(maxlen=samples))  # kind -> seconds per call
+        self.gc_pauses = 0
+        self.gc_time = 0.0
+        self.gc_worst = 0.0
+        self._app = self._api = None
+        self._frame_start = self._gc_start = None
+        self._lexer_time, self._lines, self._fragments = 0.0, 0, 0
+        self._own_tracemalloc = False  # Started by :perf mem, so ours to stop
+
+    # --- Switching on and off ---
+    def enable(self, app, api=None):
+        if self.enabled:
+            return
+        self.enabled, self._app, self._api = True, app, api
+        app.before_render += self._before_render
+        app.after_render += self._after_render
+        gc.callbacks.append(self._gc_callback)
+        if api is not None:
+            api.on_timed = self.record_api
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._app.before_render -= self._before_render
+        self._app.after_render -= self._after_render
+        gc.callbacks.remove(self._gc_callback)
+        if self._api is not None:
+            self._api.on_timed = None
+        self.trace_memory(False)
+        self._app = self._api = None
+
+    def trace_memory(self, on):
+        # tracemalloc makes every allocation slower, frames included: opt-in on top of :perf
+        if on and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracemalloc = True
+        elif not on and self._own_tracemalloc:
+            tracemalloc.stop()
+            self._own_tracemalloc = False
+
+    @property
+    def memory_traced(self):
+        return tracemalloc.is_tracing()
+
+    @property
+    def owns_memory_trace(self):
+        """True when :perf mem started tracemalloc; False when off or traced by someone else."""
+        return self._own_tracemalloc
+
+    # --- Hooks ---
+    def _before_render(self, _app):
+        self._frame_start = time.perf_counter()
+
+    def _after_render(self, _app):
+        if self._frame_start is not None:
+            self.frames.append((time.perf_counter() - self._frame_start, self._lexer_time, self._lines, self._fragments))
+        self._frame_start = None
+        self._lexer_time, self._lines, self._fragments = 0.0, 0, 0
+
+    def timed_lexer(self, lexer, get_line):
+        """Wraps a lex_document() line getter so its time and output count towards the frame."""
+        def get_line_timed(lineno):
+            start, built = time.perf_counter(), lexer.fragments_built
+            fragments = get_line(lineno)
+            self._lexer_time += time.perf_counter() - start
+            self._lines += 1
+            self._fragments += lexer.fragments_built - built
+            return fragments
+        return get_line_timed
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause = time.perf_counter() - self._gc_start
+            self.gc_pauses += 1
+            self.gc_time += pause
+            self.gc_worst = max(self.gc_worst, pause)
+            self._gc_start = None
+
+    def record_api(self, kind, seconds):
+        # Runs on the API thread; deque.append is atomic
+        self.api_calls[kind.split(":")[0]].append(seconds)  # prefetch:<id> -> prefetch
+
+    # --- Reporting ---
+    def snapshot(self):
+        frames = list(self.frames)
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (None, None)
+        return {
+            "render": _summary([f[0] for f in frames]),
+            "lexer": _summary([f[1] for f in frames]),
+            "lines_lexed": frames[-1][2] if frames else 0,
+            "fragments_built": frames[-1][3] if frames else 0,
+            "memory": {"current": current, "peak": peak},
+            "gc": {"pauses": self.gc_pauses, "total": self.gc_time, "worst": self.gc_worst,
+                   "counts": gc.get_count(), "thresholds": gc.get_threshold()},
+            "api": {kind: _summary(list(calls)) for kind, calls in list(self.api_calls.items())},
+            "governor": self.governor.snapshot() if self.governor else None,
+        }
+
+    def overlay_lines(self):
+        s, ms = self.snapshot(), lambda seconds: f"{seconds * 1000:.1f}"
+        render, lexer, memory, gcs = s["render"], s["lexer"], s["memory"], s["gc"]
+        lines = [
+            f" frame  last {ms(render['last'])}  avg {ms(render['avg'])}  p99 {ms(render['p99'])} ms"
+            f" | lexer {ms(lexer['last'])} ms, {s['lines_lexed']} lines, {s['fragments_built']} fragments",
+            f" gc     {gcs['pauses']} pauses, {ms(gcs['total'])} ms total, worst {ms(gcs['worst'])} ms"
+            + (f" | mem {memory['current'] / 2**20:.1f} MB, peak {memory['peak'] / 2**20:.1f} MB"
+               if memory["current"] is not None else " | mem off (:perf mem)"),
+        ]
+        api = "  ".join(f"{kind} {stats['count']}x avg {ms(stats['avg'])} p99 {ms(stats['p99'])}"
+                        for kind, stats in sorted(s["api"].items()))
+        lines.append(f" api    {api or '-'} ms")
+        if self.governor:
+            lines.append(f" gov    {self.governor.summary()}")
+        return lines
+
+    def dump(self, path):
+        """Writes the summary plus every kept frame and API sample as JSON."""
+        data = {"recorded": time.strftime("%Y-%m-%d %H:%M:%S"), "summary": self.snapshot(),
+                "frames": [dict(zip(("render", "lexer", "lines", "fragments"), f)) for f in self.frames],
+                "api_calls": {kind: list(calls) for kind, calls in list(self.api_calls.items())}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return path
@@ -0,0 +1,137 @@
+# pipeline.py
+# Headless publishing of a directory of Markdown files:
+#
+#   python blim.py publish posts/ [--publish] [--dry-run [--out html/]]
+#
+# Each file may start with front matter:
+#
+#   ---
+#   title: Road trips
+#   labels: travel, asia
+#   id: 1234567890        <-- written back after the first upload
+#   ---
+#
+# Files are converted in parallel by a process pool with the same renderer the
+# editor uses, then sent to Blogger as batched inserts/patches (+ publishes).
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from core.markdown import render_html
+from core.api import execute_batched
+from core.bulk import BULK_PAUSE, BULK_RETRIES
+
+MARKDOWN_EXTS = (".md", ".markdown", ".txt")
+FRONT_KEYS = {"title": "title", "labels": "labels", "tags": "labels", "id": "post_id", "post_id": "post_id"}
+
+
+def split_front_matter(text):
+    """Returns (meta, body). meta holds title, labels (list) and post_id when present."""
+    meta = {}
+    lines = text.split("\n")
+    if not lines or lines[0].strip() != "---":
+        return meta, text
+    for i, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return meta, "\n".join(lines[i + 1:]).lstrip("\n")
+        key, sep, value = line.partition(":")
+        key = FRONT_KEYS.get(key.strip().lower())
+        if not sep or key is None:
+            continue
+        value = value.strip().strip('"\'')
+        if key == "labels":
+            meta[key] = [l.strip().strip('"\'') for l in value.strip("[]").split(",") if l.strip()]
+        elif value:
+            meta[key] = value
+    return {}, text  # No closing ---: not front matter after all
+
+
+def find_markdown_files(directory):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.lower().endswith(MARKDOWN_EXTS) and os.path.isfile(os.path.join(directory, name)))
+
+
+def convert_file(path):
+    """Worker-process entry point. Never raises: errors come back in the result."""
+    result = {"path": path, "title": "", "labels": [], "post_id": None, "html": None, "error": None}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            meta, body = split_front_matter(f.read())
+        result.update(meta)
+        if not result["title"]:
+            result["title"] = os.path.splitext(os.path.basename(path))[0].replace("-", " ").replace("_", " ")
+        result["html"] = render_html(body)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def convert_all(paths, workers=None):
+    """Converts every file, in path order. workers=1 skips the pool (small runs, tests)."""
+    if workers == 1 or len(paths) < 2:
+        return [convert_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(convert_file, paths, chunksize=4))
+
+
+def write_html(results, out_dir):
+    """Dry run: writes each converted file to out_dir/<name>.html. Returns the paths written."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for result in results:
+        if result["error"]:
+            continue
+        name = os.path.splitext(os.path.basename(result["path"]))[0] + ".html"
+        path = os.path.join(out_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"<!-- title: {result['title']} | labels: {', '.join(result['labels'])} -->\n")
+            f.write(result["html"])
+        written.append(path)
+    return written
+
+
+def publish_results(service, blog_id, results, publish=False, progress=None):
+    """Uploads converted files: inserts new posts, patches known ids, then publishes
+    if asked. Sets result["error"] per failed file and returns {path: post resource}."""
+    posts = service.posts()
+    todo = [r for r in results if not r["error"]]
+    writes = []
+    for i, r in enumerate(todo):
+        body = {"title": r["title"], "content": r["html"], "labels": r["labels"]}
+        if r["post_id"]:
+            writes.append((str(i), posts.patch(blogId=blog_id, postId=r["post_id"], body=body)))
+        else:
+            writes.append((str(i), posts.insert(blogId=blog_id, body=body, isDraft=not publish)))
+    # partial: a failed batch call mustn't lose the ids of posts already inserted by earlier ones
+    responses = execute_batched(service, writes, progress=progress, pause=BULK_PAUSE, retries=BULK_RETRIES, partial=True)
+
+    publishes = [(str(i), posts.publish(blogId=blog_id, postId=r["post_id"])) for i, r in enumerate(todo)
+                 if publish and r["post_id"] and not isinstance(responses.get(str(i)), Exception)]
+    responses.update(execute_batched(service, publishes, pause=BULK_PAUSE, retries=BULK_RETRIES, partial=True))
+
+    saved = {}
+    for i, r in enumerate(todo):
+        response = responses.get(str(i))
+        if isinstance(response, Exception) or response is None:
+            r["error"] = f"API: {str(response)[:200]}"
+        else:
+            saved[r["path"]] = response
+    return saved
+
+
+def record_post_id(path, post_id):
+    """Writes id: post_id into the file's front matter so the next run updates instead of duplicating."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if split_front_matter(text)[0].get("post_id") == post_id:
+        return
+    lines = text.split("\n")
+    if lines[0].strip() == "---" and any(line.strip() == "---" for line in lines[1:]):
+        head, _, rest = text.partition("\n")
+        text = f"{head}\nid: {post_id}\n{rest}"
+    else:
+        text = f"---\nid: {post_id}\n---\n{text}"
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,92 @@
+# postcache.py
+# On-disk copy of the blog's posts (config/posts.db) so loads are instant and
+# work offline. Each row keeps the Blogger resource's etag, which the editor
+# sends back as If-None-Match to revalidate in the background.
+
+import json
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    blog_id    TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    title      TEXT,
+    status     TEXT,
+    labels     TEXT,
+    html       TEXT,
+    markdown   TEXT,
+    etag       TEXT,
+    updated    TEXT,
+    fetched_at REAL,
+    PRIMARY KEY (blog_id, id)
+)
+"""
+
+
+class PostStore:
+    """Small SQLite store; safe to use from the UI loop and the API worker thread."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(SCHEMA)
+
+    def put(self, blog_id, post, markdown=None):
+        """Stores a Blogger post resource. markdown=None keeps the html for lazy conversion."""
+        row = (
+            blog_id, post['id'], post.get('title', ''), post.get('status', 'DRAFT'),
+            json.dumps(post.get('labels', [])), post.get('content', ''), markdown,
+            post.get('etag'), post.get('updated'), time.time(),
+        )
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def put_summary(self, blog_id, post):
+        """Upserts list metadata (no body) without touching a cached body or its etag."""
+        row = (blog_id, post['id'], post.get('title', ''), post.get('status', 'DRAFT'),
+               json.dumps(post.get('labels', [])), post.get('updated'), time.time())
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO posts (blog_id, id, title, status, labels, updated, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (blog_id, id) DO UPDATE SET title = excluded.title, status = excluded.status, "
+                "labels = excluded.labels, updated = excluded.updated", row)
+
+    def set_markdown(self, blog_id, post_id, markdown):
+        with self._lock, self._db:
+            self._db.execute("UPDATE posts SET markdown = ? WHERE blog_id = ? AND id = ?", (markdown, blog_id, post_id))
+
+    def get(self, blog_id, post_id):
+        """Returns the post shaped like a Blogger resource plus 'markdown', or None."""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM posts WHERE blog_id = ? AND id = ?", (blog_id, str(post_id))).fetchone()
+        return self._to_post(row) if row else None
+
+    def list_posts(self, blog_id, limit=20, offset=0):
+        """Most recently updated first, without bodies (for the post browser)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, title, status, updated FROM posts WHERE blog_id = ? "
+                "ORDER BY updated DESC LIMIT ? OFFSET ?", (blog_id, limit, offset)).fetchall()
+        return [{'id': r['id'], 'title': r['title'] or '(Untitled)', 'status': r['status'] or 'DRAFT'} for r in rows]
+
+    def delete(self, blog_id, post_id):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM posts WHERE blog_id = ? AND id = ?", (blog_id, str(post_id)))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _to_post(row):
+        return {
+            'id': row['id'], 'title': row['title'], 'status': row['status'],
+            'labels': json.loads(row['labels'] or '[]'), 'content': row['html'],
+            'markdown': row['markdown'], 'etag': row['etag'], 'updated': row['updated'],
+        }
@@ -0,0 +1,78 @@
+# prefetch.py
+# Speculative loading of the posts around the browser selection, so Enter can
+# open a post without waiting for posts().get and the HTML conversion.
+
+import time
+from collections import OrderedDict
+
+PREFETCH_SIZE = 8            # Ready posts kept in memory
+PREFETCH_MAX_AGE = 120       # Seconds a prefetched post is trusted without revalidating
+
+_CANCELLED = object()
+
+
+class PostPrefetcher:
+    """Bounded cache of (post, markdown) filled in the background.
+
+    update() declares which post ids are wanted right now. Jobs for ids that are
+    no longer wanted when the worker gets to them are skipped before touching
+    the network, so a fast scroll only pays for where the selection stops.
+    """
+
+    def __init__(self, worker, size=PREFETCH_SIZE):
+        self.worker = worker
+        self.size = size
+        self._ready = OrderedDict()  # post_id -> (fetched_at, (post, markdown))
+        self._pending = set()
+        self._wanted = frozenset()
+        self._waiters = {}  # post_id -> callback of a post opened while its job was in flight
+
+    def update(self, post_ids, job_for):
+        """job_for(post_id) returns a callable that fetches (post, markdown) on the worker."""
+        self._wanted = frozenset(post_ids)
+        for post_id in post_ids:
+            if post_id in self._ready or post_id in self._pending:
+                continue
+            self._pending.add(post_id)
+            self.worker.submit(f"prefetch:{post_id}", self._run, post_id, job_for(post_id),
+                               on_done=lambda result, post_id=post_id: self._store(post_id, result))
+
+    def _run(self, post_id, job):
+        if post_id not in self._wanted and post_id not in self._waiters:
+            return _CANCELLED  # Selection moved on before we got to it
+        return job()
+
+    def _store(self, post_id, result):
+        self._pending.discard(post_id)
+        failed = result is _CANCELLED or isinstance(result, Exception)
+        waiter = self._waiters.pop(post_id, None)
+        if waiter:
+            waiter(None if failed else result)
+            return
+        if failed:
+            return
+        self._ready[post_id] = (time.monotonic(), result)
+        self._ready.move_to_end(post_id)
+        while len(self._ready) > self.size:
+            # Evict the oldest post that isn't around the selection
+            victim = next((pid for pid in self._ready if pid not in self._wanted), next(iter(self._ready)))
+            del self._ready[victim]
+
+    def take(self, post_id, max_age=PREFETCH_MAX_AGE):
+        """Pops a ready (post, markdown) for post_id if it is fresh enough."""
+        entry = self._ready.pop(post_id, None)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def is_pending(self, post_id):
+        return post_id in self._pending
+
+    def when_ready(self, post_id, callback):
+        """Hands the pending job's (post, markdown), or None if it failed, to callback
+        instead of the cache, and keeps the job from being skipped meanwhile."""
+        self._waiters[post_id] = callback
+
+    def clear(self):
+        self._wanted = frozenset()
+        self._ready.clear()
@@ -0,0 +1,125 @@
+# recovery.py
+# Crash-safe local recovery for the post being written.
+#
+# The snapshot (.blim_recovery.json) holds {"title", "body", "seq"} and is only
+# ever replaced atomically (temp file + fsync + rename). Between snapshots each
+# change is appended to a journal next to it as one JSON line per edited field:
+#
+#   {"seq": 3, "f": "body", "s": 120, "e": 124, "t": "new text"}
+#
+# meaning "in field f replace [s:e) with t", relative to snapshot seq. Replaying
+# stops at the first torn line, and lines from an older seq are ignored, so a
+# crash at any point leaves a consistent state on disk.
+
+import os
+import json
+
+from core.textdiff import changed_span
+
+COMPACT_EVERY = 200                 # Journal entries before folding them into a new snapshot
+COMPACT_BYTES = 256 * 1024          # ...or journal size, whichever comes first
+FIELDS = ("title", "body")
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class RecoveryJournal:
+    def __init__(self, path):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        # What is on disk for this session. Starts as an empty editor, so an old
+        # recovery file is left alone until the user actually writes something.
+        self._saved = {"title": "", "body": ""}
+        self._seq = None            # No snapshot written by this session yet
+        self._entries = 0
+        self._journal_bytes = 0
+
+    def record(self, title, body):
+        """Persists the current state if it changed. Returns True if anything was written."""
+        current = {"title": title, "body": body}
+        if current == self._saved:
+            return False
+        if self._seq is None or self._entries >= COMPACT_EVERY or self._journal_bytes >= COMPACT_BYTES:
+            self.snapshot(title, body)
+            return True
+
+        lines = []
+        for field in FIELDS:
+            span = changed_span(self._saved[field], current[field])
+            if span is None:
+                continue
+            start, old_end, new_end = span
+            entry = {"seq": self._seq, "f": field, "s": start, "e": old_end, "t": current[field][start:new_end]}
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        data = "".join(lines).encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._entries += len(lines)
+        self._journal_bytes += len(data)
+        self._saved = current
+        return True
+
+    def snapshot(self, title, body):
+        seq = self._read_seq() + 1 if self._seq is None else self._seq + 1
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"title": title, "body": body, "seq": seq}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_dir(self.path)
+
+        # Old entries now belong to a previous seq and would be skipped anyway;
+        # truncating just reclaims the space.
+        with open(self.journal_path, "wb") as f:
+            os.fsync(f.fileno())
+        self._seq = seq
+        self._entries = 0
+        self._journal_bytes = 0
+        self._saved = {"title": title, "body": body}
+
+    def _read_seq(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return int(json.load(f).get("seq", 0))
+        except (OSError, ValueError, AttributeError):
+            return 0
+
+    def load(self):
+        """Rebuilds {"title", "body"} from the snapshot plus journal, or None if there is nothing."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        state = {field: snapshot.get(field, "") for field in FIELDS}
+        seq = snapshot.get("seq", 0)
+
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # Torn write from a crash: everything before it is good
+                    if entry.get("seq") != seq or entry.get("f") not in state:
+                        continue
+                    text = state[entry["f"]]
+                    state[entry["f"]] = text[:entry["s"]] + entry["t"] + text[entry["e"]:]
+        except OSError:
+            pass
+        return state
@@ -0,0 +1,182 @@
+# replay.py
+# Keystroke traces replayed through the real Application, headless, to measure
+# what the writer feels: the time from a key reaching stdin to the first frame
+# drawn after it was handled.
+#
+#   steps = typing("Hello") + paste(text) + scrolling(20) + spell_toggle() + browsing(10)
+#   result = replay(lambda **io: build_application(editor, **io), steps, trace_memory=True)
+#   print(result.report())
+#
+# A step is (label, keys): the raw text a terminal would send. Sessions recorded
+# with `python blim.py --record-keys FILE` are JSON lines in the same shape, so
+# a real writing session can be replayed with load_trace(FILE).
+
+import json
+import time
+import asyncio
+import tracemalloc
+from core.perf import percentile
+
+ENTER, UP, DOWN, PAGE_UP, PAGE_DOWN = "\r", "\x1b[A", "\x1b[B", "\x1b[5~", "\x1b[6~"
+CTRL_D, CTRL_O = "\x04", "\x0f"
+PASTE_START, PASTE_END = "\x1b[200~", "\x1b[201~"
+KEYSTROKE_BUDGET = 0.050  # Median key-to-frame latency above this is felt while typing
+SPIKE_BUDGET = 0.150  # p99 bound: a single keystroke this slow is a stall (lexer/GC spike)
+STEP_TIMEOUT = 5.0  # A step with no frame after this long is a hang, not a slow frame
+ROWS, COLUMNS = 50, 120  # Headless terminal size; must fit the 85-column editor
+
+
+# --- Traces ---
+
+def typing(text, label="type"):
+    return [(label, ENTER if ch == "\n" else ch) for ch in text]
+
+
+def paste(text, label="paste"):
+    return [(label, PASTE_START + text + PASTE_END)]
+
+
+def scrolling(rows, label="scroll"):
+    """Down and back up again, a line at a time, then a page each way."""
+    return [(label, DOWN)] * rows + [(label, UP)] * rows + [(label, PAGE_DOWN), (label, PAGE_UP)]
+
+
+def spell_toggle(label="ctrl-d"):
+    """Spellcheck on, then off again (which drops the dictionary)."""
+    return [(label, CTRL_D), (label, CTRL_D)]
+
+
+def browsing(moves, label="browser"):
+    """Opens the post browser, walks down the list and closes it."""
+    return [(label, CTRL_O)] + [(label, DOWN)] * moves + [(label, CTRL_O)]
+
+
+def default_trace(paste_text):
+    """A short writing session touching every hot path once."""
+    return (typing("The quick brown fox jumps over the lazy dog.\n" * 3) + paste(paste_text)
+            + scrolling(40) + spell_toggle() + typing("teh end") + browsing(15))
+
+
+def load_trace(path):
+    with open(path, encoding="utf-8") as f:
+        return [(step["label"], step["keys"]) for step in map(json.loads, f) if step]
+
+
+class KeyRecorder:
+    """Appends every key the application reads to a JSON-lines trace."""
+    def __init__(self, path):
+        self.path = path
+
+    def attach(self, app):
+        from prompt_toolkit.keys import Keys
+        processor, feed_multiple = app.key_processor, app.key_processor.feed_multiple
+
+        def _recording(key_presses, first=False):
+            if not first:  # first=True re-queues keys that were already read
+                with open(self.path, "a", encoding="utf-8") as f:
+                    for press in key_presses:
+                        if press.key == Keys.BracketedPaste:
+                            step = {"label": "paste", "keys": PASTE_START + press.data + PASTE_END}
+                        else:
+                            label = "type" if len(press.data) == 1 and press.data.isprintable() else str(press.key)
+                            step = {"label": label, "keys": press.data}
+                        f.write(json.dumps(step, ensure_ascii=False) + "\n")
+            feed_multiple(key_presses, first=first)
+        processor.feed_multiple = _recording
+        return app
+
+
+# --- Replay ---
+
+class ReplayResult:
+    def __init__(self):
+        self.latencies = []      # (label, seconds from key sent to frame drawn), one per step
+        self.peak_memory = None  # Bytes allocated above the settled editor at the worst moment (trace_memory)
+        self.worst_step = None   # (label, bytes) of the step that allocated the most while it ran
+
+    def percentiles(self, label=None):
+        values = [s for name, s in self.latencies if label is None or name == label]
+        return {"p50": percentile(values, 50), "p90": percentile(values, 90),
+                "p99": percentile(values, 99), "max": max(values, default=0.0)}
+
+    def report(self):
+        lines = [f"  {'step':<10} {'keys':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}   (ms)"]
+        labels = list(dict.fromkeys(name for name, _ in self.latencies))
+        for label in labels + [None]:
+            count = sum(1 for name, _ in self.latencies if label is None or name == label)
+            stats = self.percentiles(label)
+            lines.append(f"  {label or 'all':<10} {count:>6} " + " ".join(f"{stats[k] * 1000:9.2f}" for k in ("p50", "p90", "p99", "max")))
+        if self.peak_memory is not None:
+            lines.append(f"  peak memory +{self.peak_memory / 2**20:.1f} MB; worst step "
+                         f"{self.worst_step[0]} +{self.worst_step[1] / 2**20:.1f} MB")
+        return "\n".join(lines)
+
+
+def headless_output(rows=ROWS, columns=COLUMNS):
+    """An output that draws nowhere. Plain DummyOutput is 80 columns wide, too narrow
+    for the editor: prompt_toolkit would render "Window too small" instead of it."""
+    from prompt_toolkit.data_structures import Size
+    from prompt_toolkit.output import DummyOutput
+
+    class HeadlessOutput(DummyOutput):
+        def get_size(self):
+            return Size(rows=rows, columns=columns)
+    return HeadlessOutput()
+
+
+def replay(make_app, steps, trace_memory=False, timeout=STEP_TIMEOUT):
+    """Runs make_app(input=, output=) headless and feeds it steps one at a time,
+    each only after the previous one's frame. Returns a ReplayResult."""
+    from prompt_toolkit.input import create_pipe_input
+
+    result = ReplayResult()
+    with create_pipe_input() as pipe:
+        app = make_app(input=pipe, output=headless_output())
+        asyncio.run(_drive(app, pipe, steps, result, trace_memory, timeout))
+    return result
+
+
+async def _drive(app, pipe, steps, result, trace_memory, timeout):
+    handled, framed, drawn_at = asyncio.Event(), asyncio.Event(), [0.0]
+
+    def _handled(_processor):
+        handled.set()
+
+    def _rendered(_app):
+        # Frames that land before the key was handled (a timer, a background
+        # job finishing) don't show its effect yet, so they don't count
+        if handled.is_set() and not framed.is_set():
+            drawn_at[0] = time.perf_counter()
+            framed.set()
+
+    app.key_processor.after_key_press += _handled
+    app.after_render += _rendered
+    running = asyncio.ensure_future(app.run_async())
+    try:
+        handled.set()
+        await asyncio.wait_for(framed.wait(), timeout)  # The first frame
+        if trace_memory:
+            tracemalloc.start()
+        for label, keys in steps:
+            handled.clear(); framed.clear()
+            if trace_memory:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            sent_at = time.perf_counter()
+            pipe.send_text(keys)
+            try:
+                await asyncio.wait_for(framed.wait(), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"no frame within {timeout}s of step {label!r} ({keys[:20]!r})") from None
+            result.latencies.append((label, drawn_at[0] - sent_at))
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                result.peak_memory = max(result.peak_memory or 0, peak)
+                if result.worst_step is None or peak - before > result.worst_step[1]:
+                    result.worst_step = (label, peak - before)
+    finally:
+        if trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        if not app.future.done():
+            app.exit()
+        await running
@@ -0,0 +1,73 @@
+# spelling.py
+# Spellcheck work that must never run on the prompt_toolkit event loop.
+
+import re
+
+from core.background import BackgroundWorker
+
+
+def load_dictionary(lang, index_dir, custom_dict_path=None):
+    """Opens the compiled dictionary for lang plus the user's custom words.
+
+    Near-instant once the indexes exist; the first use of a language compiles
+    its index, so it still belongs in the worker.
+    """
+    from core.dictionary import open_dictionary
+    return open_dictionary(lang, index_dir, custom_dict_path)
+
+
+def find_misspelled(spell, text):
+    return spell.unknown(re.findall(r'\w+', text.lower()))
+
+
+class SpellWorker(BackgroundWorker):
+    """Dictionary loads ("load"), document-wide checks ("check") and closing a
+    replaced dictionary's indexes ("unload").
+
+    Sharing one thread means a language switch and a check never race.
+    """
+
+    def __init__(self):
+        super().__init__(name="blim-spell")
+
+
+class VerdictCache:
+    """known/unknown verdict per lowercase word for the active dictionary.
+
+    Verdicts belong to one dictionary object: installing a new one (language
+    switch, reload) drops them all, while :add/:addall only flip the words they
+    add. Lookups for a whole screen are resolved with one unknown() call.
+    """
+
+    def __init__(self):
+        self._spell = None
+        self._unknown = {}  # word -> True if the dictionary doesn't know it
+
+    def _bind(self, spell):
+        if spell is not self._spell:
+            self._spell = spell
+            self._unknown = {}
+
+    def resolve(self, spell, words):
+        self._bind(spell)
+        missing = {w.lower() for w in words} - self._unknown.keys()
+        if missing:
+            unknown = spell.unknown(missing)
+            for word in missing:
+                self._unknown[word] = word in unknown
+
+    def is_unknown(self, spell, word):
+        self._bind(spell)
+        word = word.lower()
+        verdict = self._unknown.get(word)
+        if verdict is None:
+            self.resolve(spell, (word,))
+            verdict = self._unknown[word]
+        return verdict
+
+    def mark_known(self, words):
+        for word in words:
+            self._unknown[word.lower()] = False
+
+    def __len__(self):
+        return len(self._unknown)
@@ -0,0 +1,57 @@
+# textdiff.py
+# Helpers to find what changed between two versions of a buffer's text
+# without splitting or copying the whole document into Python objects.
+
+
+def changed_span(old, new):
+    """Returns (start, old_end, new_end) of the region that differs, or None.
+
+    old[:start] == new[:start] and old[old_end:] == new[new_end:].
+    Prefix and suffix are found by binary search over slice comparisons,
+    so the work is a handful of memcmp calls instead of a char-by-char loop.
+    """
+    if old == new:
+        return None
+    len_old, len_new = len(old), len(new)
+    limit = min(len_old, len_new)
+
+    # Common prefix
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[lo:mid] == new[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    start = lo
+
+    # Common suffix (never overlapping the prefix)
+    lo, hi = 0, limit - start
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[len_old - mid:len_old - lo] == new[len_new - mid:len_new - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    return start, len_old - lo, len_new - lo
+
+
+def word_count_delta(old, new):
+    """How many words (str.split() semantics) new has compared to old.
+
+    Only the edited region, widened to the surrounding whitespace, is split.
+    """
+    span = changed_span(old, new)
+    if span is None:
+        return 0
+    start, old_end, new_end = span
+
+    # Widen to whitespace so no word straddles the region's edges
+    while start > 0 and not old[start - 1].isspace():
+        start -= 1
+    grow = 0
+    while old_end + grow < len(old) and not old[old_end + grow].isspace():
+        grow += 1
+
+    return len(new[start:new_end + grow].split()) - len(old[start:old_end + grow].split())
@@ -0,0 +1,116 @@
+# tracking.py
+# Lightweight document statistics that follow a prompt_toolkit Buffer.
+
+from core.textdiff import word_count_delta
+
+
+class WordCounter:
+    """Running word count for a Buffer, updated from each edit's region only.
+
+    Subscribes to buffer.on_text_changed. Buffer.reset() doesn't fire that event,
+    so reads also compare the buffer's text object by identity and resync if needed.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self._text = buffer.text
+        self._count = len(self._text.split())
+        self._mark = self._count
+        buffer.on_text_changed += self._on_text_changed
+
+    def _on_text_changed(self, _buffer=None):
+        self._sync(self.buffer.text)
+
+    def _sync(self, text):
+        if text is self._text:
+            return
+        self._count += word_count_delta(self._text, text)
+        self._text = text
+
+    @property
+    def count(self):
+        self._sync(self.buffer.text)
+        return self._count
+
+    def reading_minutes(self, words_per_minute):
+        return max(1, round(self.count / words_per_minute))
+
+    # --- Sprint support ---
+    def mark(self):
+        """Remembers the current count as the start of a sprint."""
+        self._mark = self.count
+        return self._mark
+
+    def gain(self):
+        return max(0, self.count - self._mark)
+
+
+class DirtyTracker:
+    """Answers "unsaved changes?" without comparing whole documents on every frame.
+
+    Every edit bumps a generation counter. The verdict is computed at most once
+    per generation, by comparing a hash of the (stripped) text with the hash of
+    the last saved content, and then served from cache until the next edit.
+    The hash is over the whole text: at 100k words it costs about as much as
+    the keystroke's own text copy (~0.25 ms, bench_suite keystroke vs is_dirty),
+    so a per-block hash kept up to date from changed_span() isn't worth it.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.generation = 0
+        self._text = buffer.text
+        self._saved_hash = _content_hash("")
+        self._verdict = (None, False)  # (generation, dirty)
+        buffer.on_text_changed += self._on_text_changed
+
+    def _on_text_changed(self, _buffer=None):
+        self.generation += 1
+
+    def mark_saved(self, content):
+        self._saved_hash = _content_hash(content)
+        self._verdict = (None, False)
+
+    def is_dirty(self):
+        text = self.buffer.text
+        if text is not self._text:  # Buffer.reset() swaps the text without an event
+            self._text = text
+            self.generation += 1
+        generation, dirty = self._verdict
+        if generation != self.generation:
+            dirty = _content_hash(text) != self._saved_hash
+            self._verdict = (self.generation, dirty)
+        return dirty
+
+
+class SavedFields:
+    """Hashes of the title, body and labels as last saved to (or loaded from) Blogger.
+
+    changed() names the fields that differ, so a save can patch just those or
+    be skipped entirely. Nothing marked yet means every field counts as changed.
+    """
+
+    def __init__(self):
+        self._hashes = {}
+
+    def mark(self, **fields):
+        self._hashes.update((name, _field_hash(value)) for name, value in fields.items())
+
+    def changed(self, **fields):
+        return [name for name, value in fields.items() if self._hashes.get(name) != _field_hash(value)]
+
+    def clear(self):
+        self._hashes = {}
+
+
+def _field_hash(value):
+    if isinstance(value, list):
+        return hash(tuple(value))
+    return _content_hash(value)
+
+
+def _content_hash(text):
+    # Surrounding whitespace never makes a post dirty; only copy when there is some
+    if text[:1].isspace() or text[-1:].isspace():
+        text = text.strip()
+    return hash(text)
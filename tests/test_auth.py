@@ -0,0 +1,92 @@
+import asyncio
+import datetime
+import time
+import pytest
+from unittest.mock import MagicMock
+from blim import BlimEditor
+from core.auth import needs_refresh
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+def test_token_is_renewed_ahead_of_expiry():
+    """Scenario: A token with a minute left is refreshed now, not on the next save."""
+    now = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    creds = MagicMock(refresh_token="r", expiry=now + datetime.timedelta(seconds=60))
+    assert needs_refresh(creds, now=now)
+    creds.expiry = now + datetime.timedelta(hours=1)
+    assert not needs_refresh(creds, now=now)
+    assert not needs_refresh(MagicMock(refresh_token=None, expiry=now), now=now)
+    assert not needs_refresh(None)
+
+def test_save_during_warm_up_waits_for_the_same_client(robot, tmp_path):
+    """Scenario: Ctrl+S while the startup warm-up is still connecting builds the client once, then saves."""
+    service = MagicMock()
+    service.posts.return_value.insert.return_value.execute.return_value = {'id': '9'}
+    builds = []
+
+    def slow_authenticate(interactive=True):
+        time.sleep(0.2)
+        builds.append(interactive)
+        return service
+
+    robot.test_mode = False  # warm_up() skips test mode
+    robot.token_path = str(tmp_path / "token.json")
+    (tmp_path / "token.json").write_text("{}")
+    robot.authenticate = slow_authenticate
+    robot.title_field.text, robot.body_field.text = "Warm", "Body"
+
+    async def session():
+        robot.warm_up()
+        robot.save_post()  # Arrives while the warm-up is in flight
+        while robot.api.busy_kinds() or not service.posts.return_value.insert.called:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(session(), 5))
+    robot.api.shutdown()
+
+    assert builds == [False]
+    assert robot.current_post_id == '9'
+
+def test_two_saves_during_a_slow_connect_insert_once(robot):
+    """Scenario: Ctrl+S twice before the first connection lands creates one post, not two."""
+    service = MagicMock()
+    inserts = []
+
+    def insert(**kwargs):
+        inserts.append(kwargs["body"]["title"])
+        return MagicMock(**{"execute.return_value": {'id': str(len(inserts)), 'status': 'DRAFT'}})
+    service.posts.return_value.insert.side_effect = insert
+
+    def slow_authenticate(interactive=True):
+        time.sleep(0.3)
+        return service
+
+    robot.authenticate = slow_authenticate
+    robot.title_field.text, robot.body_field.text = "T", "Body"
+
+    async def session():
+        robot.save_post()
+        robot.save_post()  # Still connecting: queued behind the first
+        assert robot.last_spell_report == robot._t("save_queued")
+        while robot.api.busy_kinds() or not inserts:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(session(), 5))
+    robot.api.shutdown()
+
+    assert inserts == ['T']
+    assert robot.current_post_id == '1' and robot._queued_save is None
+
+def test_keep_credentials_fresh_refreshes_in_background(robot, monkeypatch):
+    """Scenario: The 30 s tick renews an expiring token through the API worker."""
+    refreshed = []
+    monkeypatch.setattr("blim.refresh_credentials", lambda creds, path: refreshed.append(creds))
+    robot.service = MagicMock()
+    robot.credentials = MagicMock(refresh_token="r", expiry=datetime.datetime(2000, 1, 1))
+
+    robot.keep_credentials_fresh()
+
+    assert refreshed == [robot.credentials]
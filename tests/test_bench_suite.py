@@ -0,0 +1,26 @@
+import os
+import pytest
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+
+@pytest.fixture
+def bench_suite(monkeypatch):
+    """Imports benchmarks/bench_suite.py the way it runs: as a script beside bench_markdown.py."""
+    monkeypatch.syspath_prepend(BENCHMARKS)
+    import bench_suite
+    return bench_suite
+
+BASELINE = {"default_threshold": 1.25, "thresholds": {"is_dirty": 1.5},
+            "results": {"lex_document/en/1000": 1.0, "is_dirty/en/1000": 1.0, "parse_markdown/en/1000": 1.0}}
+
+def test_compare_flags_cases_over_their_own_threshold(bench_suite):
+    """Scenario: A lexer 1.3x slower regresses; is_dirty 1.3x slower is within its looser 1.5x."""
+    results = {"lex_document/en/1000": 1.3, "is_dirty/en/1000": 1.3, "parse_markdown/en/1000": 1.0,
+               "run_spellcheck/en/1000": 9.0}  # Not in the baseline: skipped
+    assert bench_suite.compare(results, BASELINE) == [("lex_document/en/1000", 1.3, 1.25)]
+
+def test_threshold_override_applies_to_every_case(bench_suite):
+    """Scenario: On a noisy machine --threshold 2 loosens the per-case thresholds too, never tightens them."""
+    results = {"lex_document/en/1000": 1.9, "is_dirty/en/1000": 1.9, "parse_markdown/en/1000": 2.1}
+    assert bench_suite.compare(results, BASELINE, threshold=2) == [("parse_markdown/en/1000", 2.1, 2)]
+    assert bench_suite.compare({"is_dirty/en/1000": 1.4}, BASELINE, threshold=1.1) == []
@@ -0,0 +1,197 @@
+import pytest
+from unittest.mock import MagicMock
+from blim import BlimEditor, BROWSER_ROWS
+
+def _page(start, count):
+    return [{'id': str(i), 'title': f"Post {i}", 'status': 'LIVE'} for i in range(start, start + count)]
+
+class QueueWorker:
+    """Holds submitted jobs until the test runs them, like a busy API thread."""
+    def __init__(self): self.jobs, self.kinds = [], []
+    def submit(self, kind, func, *args, on_done=None): self.jobs.append((func, args, on_done)); self.kinds.append(kind)
+    def is_busy(self, kind): return kind in self.kinds
+
+@pytest.fixture
+def robot():
+    """Builds a Robot User with a fake blog of 50 posts, 20 per page."""
+    editor = BlimEditor(test_mode=True)
+    editor.blog_id = "123"
+    editor.is_offline = False
+    editor.service = MagicMock()
+    pages = {None: (_page(0, 20), "p2"), "p2": (_page(20, 20), "p3"), "p3": (_page(40, 10), None)}
+    editor.requested_pages = []
+
+    def fake_list(**kwargs):
+        token = kwargs.get('pageToken')
+        editor.requested_pages.append(token)
+        items, next_token = pages[token]
+        request = MagicMock()
+        request.execute.return_value = {'items': items, 'nextPageToken': next_token} if next_token else {'items': items}
+        return request
+
+    editor.service.posts.return_value.list.side_effect = fake_list
+    editor.show_browser = True
+    return editor
+
+def test_first_page_is_lazy_and_bodiless(robot):
+    """Scenario: Opening the browser asks for one page of titles only."""
+    robot.fetch_recent_posts()
+
+    assert robot.requested_pages == [None]
+    kwargs = robot.service.posts.return_value.list.call_args.kwargs
+    assert kwargs['fetchBodies'] is False
+    assert len(robot.posts_list) == 20 and robot.browser_has_more
+
+def test_scrolling_prefetches_and_windows(robot):
+    """Scenario: Scrolling past post 12 moves the window and loads later pages ahead of time."""
+    robot.fetch_recent_posts()
+
+    for _ in range(17):
+        robot.move_browser_selection(1)
+
+    assert robot.requested_pages == [None, "p2"]
+    assert robot.browser_index == 17
+    assert robot.browser_offset == 17 - BROWSER_ROWS + 1
+    assert "Post 17" in robot.browser_field.text and "Post 0 " not in robot.browser_field.text
+
+    robot.move_browser_selection(BROWSER_ROWS * 3)
+    assert robot.requested_pages == [None, "p2", "p3"]
+    robot.move_browser_selection(BROWSER_ROWS * 3)
+    assert robot.browser_index == 49 and not robot.browser_has_more
+
+    # Everything is loaded now, so single steps wrap around like before
+    robot.move_browser_selection(1)
+    assert robot.browser_index == 0 and robot.browser_offset == 0
+
+def test_cached_titles_paint_before_the_network(robot):
+    robot.post_store.put_summary("123", {'id': '99', 'title': 'From cache', 'status': 'DRAFT'})
+    robot.is_offline = True
+
+    robot.fetch_recent_posts()
+
+    assert robot.posts_list == [{'id': '99', 'title': 'From cache', 'status': 'DRAFT'}]
+    assert robot.post_store.get("123", "99")['content'] is None
+
+def test_list_error_after_closing_leaves_the_pane_unbuilt(robot):
+    """Scenario: The first page fails after Ctrl+O closed the browser; the dropped pane stays dropped."""
+    from unittest.mock import patch
+    robot.api = QueueWorker()
+    robot.service.posts.return_value.list.side_effect = OSError("offline")
+    robot.fetch_recent_posts()
+
+    with patch('blim.get_app'):
+        robot.toggle_browser()  # Open -> closed, drops the pane
+    for func, args, on_done in robot.api.jobs:
+        try:
+            result = func(*args)
+        except Exception as e:
+            result = e
+        on_done(result)
+
+    assert not robot.show_browser and robot._browser_field is None
+
+def test_highlighted_post_opens_from_prefetch(robot):
+    """Scenario: Moving onto a post prefetches it, so Enter opens it with no new request."""
+    def fake_get(**kwargs):
+        request = MagicMock()
+        request.headers = {}
+        request.execute.return_value = {'id': kwargs['postId'], 'title': f"Post {kwargs['postId']}",
+                                        'content': '<p>Body <b>bold</b></p>', 'etag': '"e"'}
+        return request
+    get = robot.service.posts.return_value.get
+    get.side_effect = fake_get
+    robot.fetch_recent_posts()
+    robot.move_browser_selection(1)
+
+    prefetched = sorted(call.kwargs['postId'] for call in get.call_args_list)
+    assert prefetched == ['0', '1', '2']
+    assert not robot.api._tickets  # Finished "prefetch:<id>" jobs leave nothing behind
+
+    get.reset_mock()
+    robot.fetch_and_load('1')
+
+    assert not get.called
+    assert robot.title_field.text == "Post 1"
+    assert robot.body_field.text == "Body **bold**"
+
+def test_post_opened_mid_prefetch_waits_for_that_request(robot):
+    """Scenario: Enter on a post whose prefetch is still queued opens it from that GET, not a second one."""
+    from core.prefetch import PostPrefetcher
+
+    def fake_get(**kwargs):
+        request = MagicMock()
+        request.headers = {}
+        request.execute.return_value = {'id': kwargs['postId'], 'title': f"Post {kwargs['postId']}",
+                                        'content': '<p>Body</p>', 'etag': '"e"'}
+        return request
+    get = robot.service.posts.return_value.get
+    get.side_effect = fake_get
+    worker = QueueWorker()
+    robot.prefetcher = PostPrefetcher(worker)
+    robot.fetch_recent_posts()
+    robot.move_browser_selection(1)
+
+    robot.fetch_and_load('1')
+    for func, args, on_done in worker.jobs:
+        on_done(func(*args))
+
+    assert sorted(call.kwargs['postId'] for call in get.call_args_list) == ['0', '1', '2']
+    assert robot.title_field.text == "Post 1"
+    assert robot.body_field.text == "Body"
+
+def _slow_load_of_post_1(robot):
+    def fake_get(**kwargs):
+        request = MagicMock()
+        request.headers = {}
+        request.execute.return_value = {'id': '1', 'title': "Post 1", 'content': '<p>One</p>', 'etag': '"e"'}
+        return request
+    robot.service.posts.return_value.get.side_effect = fake_get
+    robot.api = QueueWorker()
+    robot.fetch_and_load('1')  # Not cached: waits for the network
+    return robot.api.jobs
+
+def test_slow_load_never_replaces_a_post_opened_from_prefetch(robot):
+    """Scenario: Post 2 opens from its prefetch while post 1 is still loading; typing in post 2 survives post 1 landing."""
+    jobs = _slow_load_of_post_1(robot)
+    post = {'id': '2', 'title': "Post 2", 'content': '<p>Two</p>', 'etag': '"e"'}
+    robot.prefetcher.update(['2'], lambda pid: (lambda: (post, "Two")))
+
+    robot.fetch_and_load('2')
+    robot.body_field.text = "Two, edited"
+    for func, args, on_done in jobs:
+        on_done(func(*args))
+
+    assert robot.current_post_id == '2'
+    assert robot.body_field.text == "Two, edited"
+
+def test_slow_load_never_replaces_a_new_post(robot):
+    """Scenario: :new while a post is still loading keeps the fresh page blank."""
+    from unittest.mock import patch
+    jobs = _slow_load_of_post_1(robot)
+
+    with patch('blim.get_app'):
+        robot.start_new_post()
+    robot.body_field.text = "Fresh start"
+    for func, args, on_done in jobs:
+        on_done(func(*args))
+
+    assert robot.current_post_id is None
+    assert robot.body_field.text == "Fresh start"
+
+def test_prefetch_skips_posts_the_selection_left():
+    """Scenario: Jobs queued for posts scrolled past never hit the network."""
+    from core.prefetch import PostPrefetcher
+
+    worker = QueueWorker()
+    prefetcher = PostPrefetcher(worker, size=2)
+    fetched = []
+    job_for = lambda pid: (lambda: fetched.append(pid) or ({'id': pid}, pid))
+
+    prefetcher.update(['a', 'b'], job_for)
+    prefetcher.update(['c'], job_for)
+    for func, args, on_done in worker.jobs:
+        on_done(func(*args))
+
+    assert fetched == ['c']
+    assert prefetcher.take('c') == ({'id': 'c'}, 'c')
+    assert prefetcher.take('a') is None
@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from blim import BlimEditor
+from core.api import execute_batched
+from core.bulk import relabeled
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+class RateLimited(Exception):
+    def __init__(self):
+        super().__init__("429")
+        self.resp = MagicMock(status=429)
+
+class FakeBatch:
+    def __init__(self, callback, log):
+        self.callback, self.log, self.requests = callback, log, []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.log.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+def _batching_service(log):
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback, log)
+    return service
+
+def test_relabeled_renames_removes_and_dedupes():
+    """Scenario: Label maintenance never leaves duplicates or the old name behind."""
+    assert relabeled(["Viajes", "Asia"], "Viajes", "Travel") == ["Travel", "Asia"]
+    assert relabeled(["Travel", "Viajes"], "Viajes", "Travel") == ["Travel"]
+    assert relabeled(["Viajes", "Asia"], "Viajes", "-") == ["Asia"]
+
+def test_batches_are_paced_and_rate_limits_retried():
+    """Scenario: 120 requests go out in 3 batches, and the throttled one is retried after a backoff."""
+    log, sleeps, progress = [], [], []
+    service = _batching_service(log)
+    requests = []
+    for i in range(120):
+        request = MagicMock()
+        request.execute.return_value = {'id': str(i)}
+        requests.append((str(i), request))
+    requests[7][1].execute.side_effect = [RateLimited(), {'id': '7'}]
+
+    results = execute_batched(service, requests, progress=lambda done, total: progress.append(done),
+                              pause=1.0, retries=2, sleep=sleeps.append)
+
+    assert log == [50, 50, 20, 1]
+    assert results['7'] == {'id': '7'}
+    assert progress == [49, 99, 119, 120]
+    assert sleeps == [1.0, 1.0, 2.0, 1.0]  # Pacing, pacing, backoff, pacing
+
+def test_relabel_command_plans_confirms_and_runs(robot):
+    """Scenario: :relabel across a paged blog asks first, then patches every match in batches."""
+    log = []
+    service = _batching_service(log)
+    posts = service.posts.return_value
+    pages = [
+        {'items': [{'id': '1', 'status': 'LIVE', 'labels': ['Viajes']}], 'nextPageToken': 'p2'},
+        {'items': [{'id': '2', 'status': 'DRAFT', 'labels': ['Viajes', 'Asia']}]},
+    ]
+    posts.list.return_value.execute.side_effect = pages
+    posts.patch.side_effect = lambda **kw: MagicMock(execute=MagicMock(return_value={'id': kw['postId'], 'status': 'LIVE', 'labels': kw['body']['labels']}))
+    robot.is_offline, robot.service = False, service
+    robot.current_post_id = '2'
+
+    with patch('blim.get_app'):
+        robot.handle_normal_input(MagicMock(text=':relabel Viajes "Road trips"'))
+        assert robot.pending_bulk is not None
+        assert robot.last_spell_report == robot._t("bulk_confirm").format(op="relabel", count=2)
+        assert posts.list.call_args.kwargs['labels'] == 'Viajes'
+
+        robot.handle_normal_input(MagicMock(text='y'))
+
+    assert log == [2]
+    assert robot.last_spell_report == robot._t("bulk_done").format(ok=2, failed=0)
+    assert robot.tags_field.text == "Road trips, Asia"
+    assert robot.bulk_progress is None
+
+def test_bulk_needs_confirmation(robot):
+    """Scenario: Anything but 'y' at the prompt sends nothing."""
+    robot.service = MagicMock()
+    robot.pending_bulk = ("revert", ["*"], [{'id': '1'}])
+
+    with patch('blim.get_app'):
+        robot.handle_normal_input(MagicMock(text='n'))
+
+    assert not robot.service.new_batch_http_request.called
+    assert robot.last_spell_report == robot._t("bulk_cancelled")
+
+def test_second_bulk_command_says_one_is_running(robot):
+    """Scenario: :republish while a relabel is still running is refused out loud, not silently."""
+    robot.is_offline, robot.service = False, MagicMock()
+    robot.api.is_busy = lambda kind: kind == "bulk"
+
+    with patch('blim.get_app'):
+        robot.handle_normal_input(MagicMock(text=':republish Viajes'))
+
+    assert not robot.service.posts.return_value.list.called
+    assert robot.last_spell_report == robot._t("bulk_busy")
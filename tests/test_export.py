@@ -0,0 +1,81 @@
+import os
+import json
+import pytest
+from core.export import BlogExporter, MANIFEST
+from core.markdown import html_to_markdown
+from core.pipeline import split_front_matter
+
+class FakeBlog:
+    """posts().list() over an in-memory blog, newest update first, two posts per page."""
+    def __init__(self, posts):
+        self.items = posts
+        self.calls = []
+        self.fail_at = None  # (status, pageToken) that raises once
+
+    def posts(self):
+        return self
+
+    def list(self, **kwargs):
+        status, token = kwargs['status'][0], kwargs.get('pageToken')
+        self.calls.append((status, token))
+
+        class Request:
+            def execute(_, http=None):
+                if self.fail_at == (status, token):
+                    self.fail_at = None
+                    raise ConnectionError("network down")
+                matching = sorted((p for p in self.items if p['status'] == status), key=lambda p: p['updated'], reverse=True)
+                start = int(token or 0)
+                page = {'items': matching[start:start + 2]}
+                if start + 2 < len(matching):
+                    page['nextPageToken'] = str(start + 2)
+                return page
+        return Request()
+
+def _post(i, status, day):
+    return {'id': str(i), 'status': status, 'title': f"Post {i}", 'labels': ['x'],
+            'content': f"<p>Body <b>{i}</b></p>", 'updated': f"2024-01-{day:02d}T10:00:00-08:00"}
+
+@pytest.fixture
+def blog():
+    return FakeBlog([_post(1, 'LIVE', 1), _post(2, 'LIVE', 2), _post(3, 'LIVE', 3), _post(4, 'DRAFT', 4), _post(5, 'DRAFT', 5)])
+
+def _export(blog, out_dir, full=False):
+    return BlogExporter(blog, "b", str(out_dir), html_to_markdown, http_factory=None).run(full=full)
+
+def test_full_export_writes_every_post_with_front_matter(blog, tmp_path):
+    """Scenario: A first export pages through LIVE and DRAFT and leaves one Markdown file per post."""
+    assert _export(blog, tmp_path) == (5, 0)
+
+    meta, body = split_front_matter((tmp_path / "3-post-3.md").read_text(encoding="utf-8"))
+    assert meta == {"title": "Post 3", "labels": ["x"], "post_id": "3"}
+    assert body.strip() == "Body **3**"
+    manifest = json.loads((tmp_path / MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["since"] == "2024-01-05T10:00:00-08:00"
+    assert manifest["run"] is None
+
+def test_interrupted_export_resumes_from_saved_cursor(blog, tmp_path):
+    """Scenario: The network drops on the second LIVE page; the rerun continues from that page."""
+    blog.fail_at = ('LIVE', '2')
+    with pytest.raises(ConnectionError):
+        _export(blog, tmp_path)
+    blog.calls.clear()
+
+    written, _ = _export(blog, tmp_path)
+
+    assert blog.calls == [('LIVE', '2')]  # DRAFT had finished; LIVE picks up at page 2
+    assert written == 1
+    assert len([n for n in os.listdir(tmp_path) if n.endswith(".md")]) == 5
+
+def test_later_runs_only_fetch_what_changed(blog, tmp_path):
+    """Scenario: After one post is edited, the next export rewrites just that post and stops paging early."""
+    _export(blog, tmp_path)
+    blog.items[0].update(title="Post 1 retitled", updated="2024-02-01T10:00:00-08:00")
+    blog.calls.clear()
+
+    written, skipped = _export(blog, tmp_path)
+
+    assert written == 1
+    assert ('LIVE', '2') not in blog.calls
+    assert (tmp_path / "1-post-1-retitled.md").exists()
+    assert not (tmp_path / "1-post-1.md").exists()
@@ -62,4 +62,138 @@ def test_save_post_failure(mock_build):
     # We check for "Save Error" because we EXPECTED a failure here
     expected_error_template = editor._t("save_error")
     prefix = expected_error_template.split("{error}")[0]  # Get the part before the error message   
-    assert prefix in editor.last_spell_report
\ No newline at end of file
+    assert prefix in editor.last_spell_report
+
+def test_save_runs_off_the_loop_and_serializes():
+    """Scenario: Ctrl+S twice on a slow link keeps the UI loop free and saves twice, in order."""
+    import asyncio
+    import time
+
+    editor = BlimEditor(test_mode=True)
+    editor.is_offline = False
+    service = MagicMock()
+    calls = []
+
+    def slow_insert(**kwargs):
+        request = MagicMock()
+        request.execute.side_effect = lambda: (time.sleep(0.2), calls.append(("insert", kwargs["body"]["title"])), {'id': '42'})[2]
+        return request
+
+    def slow_patch(**kwargs):
+        request = MagicMock()
+        request.execute.side_effect = lambda: (time.sleep(0.2), calls.append(("patch", kwargs["postId"], sorted(kwargs["body"]))), {'id': '42'})[2]
+        return request
+
+    service.posts.return_value.insert.side_effect = slow_insert
+    service.posts.return_value.patch.side_effect = slow_patch
+    editor.service = service
+    editor.title_field.text = "Slow"
+    editor.body_field.text = "Body"
+
+    async def session():
+        editor.save_post()
+        editor.save_post()  # Arrives while the first is still in flight
+        assert editor.last_spell_report == editor._t("save_queued")
+        editor.body_field.text = "Body, edited"
+        ticks = 0
+        while editor.api.busy_kinds() or len(calls) < 2:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return ticks
+
+    ticks = asyncio.run(session())
+    editor.api.shutdown()
+
+    assert ticks > 10
+    # The queued save runs after the insert, so it patches the new post instead of inserting twice
+    assert calls == [("insert", "Slow"), ("patch", "42", ["content"])]
+    assert editor.last_spell_report == editor._t("saved")
+
+def _loaded_draft_editor():
+    editor = BlimEditor(test_mode=True)
+    editor.is_offline = False
+    editor.service = MagicMock()
+    editor.service.posts.return_value.patch.return_value.execute.return_value = {'id': '7', 'status': 'DRAFT'}
+    post = {'id': '7', 'title': 'Draft', 'status': 'DRAFT', 'labels': ['a', 'b'], 'content': '<p>Hello</p>'}
+    editor._apply_loaded_post((post, "Hello"))
+    return editor
+
+def test_save_patches_only_changed_fields():
+    """Scenario: Editing only the tags sends just the labels, and an untouched post isn't sent at all."""
+    editor = _loaded_draft_editor()
+    posts = editor.service.posts.return_value
+
+    editor.save_post()
+    assert not posts.patch.called
+    assert editor.last_spell_report == editor._t("save_unchanged")
+
+    editor.tags_field.text = "a, b, c"
+    editor.save_post()
+    assert posts.patch.call_args.kwargs["body"] == {"labels": ["a", "b", "c"]}
+    assert not posts.update.called and not posts.publish.called
+
+    posts.patch.reset_mock()
+    editor.save_post()  # Saved state moved forward with the last save
+    assert not posts.patch.called
+
+def test_draft_autosaves_after_typing_pauses():
+    """Scenario: A Blogger draft saves itself in the background once the writer stops typing."""
+    import time
+    editor = _loaded_draft_editor()
+    posts = editor.service.posts.return_value
+
+    editor.body_field.text = "Hello again"
+    assert not editor.maybe_autosave(now=time.monotonic())  # Still typing
+    assert editor.maybe_autosave(now=time.monotonic() + editor.autosave_seconds)
+    assert posts.patch.call_args.kwargs["body"] == {"content": editor._parse_markdown("Hello again")}
+    assert editor.last_spell_report == editor._t("autosaved")
+
+    assert not editor.maybe_autosave(now=time.monotonic() + 2 * editor.autosave_seconds)  # One save per pause
+
+    editor.remote_status = 'LIVE'
+    editor.body_field.text = "Half-written"
+    assert not editor.maybe_autosave(now=time.monotonic() + editor.autosave_seconds)  # Never touches live posts
+
+def _hold_saves(editor):
+    # Keeps submitted saves in flight until the test lands them
+    held = []
+    submit = editor.api.submit
+    editor.api.submit = lambda kind, func, *args, on_done=None: (
+        held.append(lambda: on_done(func(*args))) if kind == "save" else submit(kind, func, *args, on_done=on_done))
+    return held
+
+def test_save_landing_after_new_leaves_the_new_post_alone():
+    """Scenario: Ctrl+S on a post, then :new before the save lands; the next save inserts, never patches the old post."""
+    editor = _loaded_draft_editor()
+    posts = editor.service.posts.return_value
+    posts.insert.return_value.execute.return_value = {'id': '8', 'status': 'DRAFT'}
+    held = _hold_saves(editor)
+
+    editor.body_field.text = "Hello, edited"
+    editor.save_post()
+    with patch('blim.get_app'):
+        editor.start_new_post()
+    held.pop()()
+
+    assert editor.current_post_id is None
+    editor.title_field.text, editor.body_field.text = "Fresh", "New post"
+    editor.save_post()
+    held.pop()()
+    assert posts.patch.call_count == 1 and posts.insert.call_args.kwargs["body"]["title"] == "Fresh"
+    assert editor.current_post_id == '8'
+
+def test_save_landing_after_opening_another_post_keeps_it_dirty():
+    """Scenario: A save lands after another post was opened; that post keeps its id and its unsaved edits."""
+    editor = _loaded_draft_editor()
+    held = _hold_saves(editor)
+
+    editor.body_field.text = "Hello, edited"
+    editor.save_post()
+    other = {'id': '9', 'title': 'Other', 'status': 'DRAFT', 'labels': [], 'content': '<p>Other</p>'}
+    editor._apply_loaded_post((other, "Other"))
+    editor.body_field.text = "Other, edited"
+    held.pop()()
+
+    assert editor.current_post_id == '9'
+    assert editor.is_dirty()
+    assert editor.saved_fields.changed(title="Other", body="Other, edited", labels=[]) == ["body"]
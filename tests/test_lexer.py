@@ -0,0 +1,49 @@
+import pytest
+from prompt_toolkit.document import Document
+from blim import BlimEditor, BlimLexer
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+def test_unchanged_lines_are_served_from_cache(robot):
+    """Scenario: Redrawing the same text must not re-tokenize its lines."""
+    lexer = BlimLexer(robot)
+    doc = Document("Some **bold** text\nplain line")
+
+    first = lexer.lex_document(doc)(0)
+    second = lexer.lex_document(Document(doc.text + "\nmore"))(0)
+
+    assert first is second
+    assert ('class:md.bold', '**bold**') in first
+
+def test_cache_is_bounded(robot):
+    """Scenario: Scrolling a huge post never grows the cache past its limit."""
+    lexer = BlimLexer(robot, cache_size=10)
+    doc = Document("\n".join(f"line *{i}*" for i in range(100)))
+    get_line = lexer.lex_document(doc)
+
+    for i in range(100):
+        get_line(i)
+
+    assert len(lexer._line_cache) == 10
+
+def test_dictionary_change_invalidates_spellchecked_lines(robot):
+    """Scenario: Adding a word re-lexes lines instead of showing stale errors."""
+    class FakeSpell(set):
+        def unknown(self, words):
+            return {w for w in words if w not in self}
+
+    robot.spell = FakeSpell({"hello"})
+    robot.show_spelling_errors = True
+    lexer = BlimLexer(robot)
+    doc = Document("cursor line\nhello blimpy", cursor_position=0)
+
+    assert ('class:spell-error', 'blimpy') in lexer.lex_document(doc)(1)
+
+    robot.spell.add("blimpy")
+    robot.spell_verdicts.mark_known(["blimpy"])
+    robot.dictionary_generation += 1
+
+    assert ('class:spell-error', 'blimpy') not in lexer.lex_document(doc)(1)
@@ -0,0 +1,86 @@
+import pytest
+from core.markdown import iter_inline_spans
+
+def test_inline_spans_never_overlap():
+    """Scenario: A link inside bold text yields a single bold span."""
+    line = "A **bold [link](https://x.com) inside** and *more*"
+    spans = list(iter_inline_spans(line))
+
+    assert [s[2] for s in spans] == ['class:md.bold', 'class:md.italic']
+    for (_, end, _), (start, _, _) in zip(spans, spans[1:]):
+        assert end <= start
+
+def test_inline_spans_cover_all_styles():
+    line = "`code` **b** ~~s~~ [l](u) *it*"
+    styles = [line[s:e] for s, e, _ in iter_inline_spans(line)]
+
+    assert styles == ["`code`", "**b**", "~~s~~", "[l](u)", "*it*"]
+
+def _legacy(md_text):
+    from benchmarks.bench_markdown import legacy_parse_markdown
+    import re
+    # The old chain sometimes left a newline between adjacent block tags
+    return re.sub(r'>\n<', '><', legacy_parse_markdown(md_text))
+
+@pytest.mark.parametrize("md_text", [
+    "# Title\n\n## Sub\n\n### Small",
+    "> a quote with **bold**\n\n---\n\nAfter the rule",
+    "* one\n* *two* here\n* [three](https://x.com)",
+    "First line\nsecond line with **bold** and *italic*\n\nNext [link](http://a.b) para",
+    "<img src=\"pic.jpg\" />\n\nCaption text",
+    "A **[bold link](u)** and [**x**](v) end",
+])
+def test_compiler_matches_legacy_output(md_text):
+    """Scenario: Supported syntax renders exactly as the old regex chain did."""
+    from core.markdown import render_html
+    assert render_html(md_text) == _legacy(md_text)
+
+def test_compiler_fixes_legacy_mangling():
+    from core.markdown import render_html
+    # Maths and stray stars are no longer italicised
+    assert render_html("2 * 3 * 4") == "<p>2 * 3 * 4</p>"
+    # Paragraphs starting with bold still get their <p>
+    assert render_html("**Bold** start") == "<p><b>Bold</b> start</p>"
+    # Bold inside italic, strike, and a list followed by text
+    assert render_html("*a **b** c* ~~old~~") == "<p><i>a <b>b</b> c</i> <s>old</s></p>"
+    assert render_html("* a\ntext") == "<ul><li>a</li></ul><p>text</p>"
+    assert render_html("* a\n\ntext") == "<ul><li>a</li></ul><p>text</p>"
+
+def test_html_round_trips_through_the_editor():
+    """Scenario: A post saved by Blim loads back as the Markdown it was written in."""
+    from core.markdown import render_html, html_to_markdown
+    md_text = ("# Title\n\nFirst line\nsecond **bold** *it*\n\n* one\n* [two](https://x.com)\n\n"
+               "> quoted ~~old~~\n\n---\n\n<img src=\"pic.jpg\" />")
+
+    assert html_to_markdown(render_html(md_text)) == md_text
+
+def test_bare_ampersands_survive_a_round_trip():
+    """Scenario: "AT&T" and "Q&A:" load back as typed; real entities keep their semicolon."""
+    from core.markdown import render_html, html_to_markdown
+    md_text = ("AT&T rocks\nQ&A: Tom &amp; Jerry &T;\n[R&D](https://x.com/?a=1&b=2)\n\n"
+               "<img src=\"pic.jpg?w=1&h=2\" />")
+
+    assert html_to_markdown(render_html(md_text)) == md_text
+
+def test_blogger_composer_html_is_cleaned():
+    """Scenario: Legacy posts from the web composer keep their structure."""
+    from core.markdown import html_to_markdown
+    html = ('<div dir="ltr">\n<h2>Intro</h2>\n<span style="font-size: large;">Tom &amp; Jerry</span><br />'
+            'next<ol>\n<li>a</li>\n<li><strong>b</strong></li>\n</ol><blockquote>x<br>y</blockquote>'
+            '<script>track()</script><strike>gone</strike></div>')
+
+    assert html_to_markdown(html) == "## Intro\n\nTom &amp; Jerry\nnext\n\n* a\n* **b**\n\n> x\n> y\n\n~~gone~~"
+
+def test_multi_paragraph_quote_saves_without_stray_markers():
+    """Scenario: A Blogger quote of two paragraphs loads, saves and loads again unchanged."""
+    from core.markdown import render_html, html_to_markdown
+    md_text = html_to_markdown("<blockquote><p>q1</p><p>q2</p></blockquote><p>after</p>")
+
+    assert md_text == "> q1\n\n> q2\n\nafter"
+    assert render_html(md_text) == "<blockquote>q1</blockquote><blockquote>q2</blockquote><p>after</p>"
+    assert html_to_markdown(render_html(md_text)) == md_text
+
+def test_deeply_nested_html_is_linear():
+    from core.markdown import html_to_markdown
+    html = "<div>" * 5000 + "<b>deep</b>" + "</div>" * 5000
+    assert html_to_markdown(html) == "**deep**"
@@ -0,0 +1,75 @@
+import gc
+import pytest
+from unittest.mock import MagicMock, patch
+from blim import BlimEditor
+from core.memory import MemoryGovernor
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def governor(clock):
+    """A governor with a fake clock and a fake RSS reading (in MB)."""
+    rss_mb = [100]
+    governor = MemoryGovernor(rss_budget=10 * 2**20, idle_after=2.0, clock=clock, rss=lambda: rss_mb[0] * 2**20)
+    governor.rss_mb = rss_mb
+    yield governor
+    governor.restore()
+
+def test_settle_freezes_startup_objects_and_raises_thresholds(governor):
+    """Scenario: After the first frame everything alive is frozen and gen 0 collects less often."""
+    before = gc.get_threshold()
+    governor.settle()
+
+    assert gc.get_freeze_count() > 0
+    assert gc.get_threshold() == governor.thresholds
+    assert governor.decisions[-1]["action"] == "freeze"
+
+    governor.restore()
+    assert gc.get_freeze_count() == 0 and gc.get_threshold() == before
+
+def test_release_waits_for_idle(governor, clock):
+    """Scenario: A dropped browser is collected only once the writer stops typing for a moment."""
+    governor.release("browser closed")
+    governor.touch()
+    clock.now += 1.0
+    assert governor.tick() is None  # Still typing
+
+    clock.now += 1.5
+    decision = governor.tick()
+
+    assert decision["action"] == "collect" and decision["reason"] == "browser closed"
+    assert governor.pressure() is None
+    assert governor.tick() is None  # Nothing new to do
+
+def test_collects_only_over_the_rss_budget(governor, clock):
+    """Scenario: Growth under the budget is left alone; past it, the next idle tick collects."""
+    clock.now += 5
+    governor.rss_mb[0] = 105
+    assert governor.tick() is None
+
+    governor.rss_mb[0] = 115
+    assert governor.tick()["reason"] == "rss +15 MB"
+    assert governor.pressure() is None  # The new reading is the new baseline
+
+def test_editor_defers_collection_to_the_governor():
+    """Scenario: Closing the browser doesn't pause the keystroke with a gc.collect(); :mem shows it pending."""
+    robot = BlimEditor(test_mode=True)
+    robot.show_browser = True
+
+    with patch('blim.get_app'), patch('gc.collect') as collect:
+        robot.toggle_browser()
+        robot.handle_normal_input(MagicMock(text=":mem"))
+
+    collect.assert_not_called()
+    assert robot.memory.pressure() == "browser closed"
+    assert robot.last_spell_report.startswith(robot._t("mem_summary").split("{")[0])
+    assert robot.last_spell_report.endswith("pending: browser closed")
@@ -0,0 +1,112 @@
+import pytest
+from unittest.mock import MagicMock
+from blim import BlimEditor
+from core.outbox import Outbox
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+class FakeBatch:
+    """Runs each added request in order, like BatchHttpRequest does for us."""
+    def __init__(self, callback, log):
+        self.callback, self.log, self.requests = callback, log, []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.log.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+def test_outbox_coalesces_and_survives_restart(tmp_path):
+    """Scenario: Saving the same post three times offline leaves one entry on disk."""
+    path = str(tmp_path / "outbox.json")
+    outbox = Outbox(path)
+    outbox.put("7", "7", "T", "one", [], ["body"], True)
+    outbox.put("7", "7", "T", "two", ["x"], ["labels"], False)
+    outbox.put("7", "7", "T", "three", ["x"], ["body"], True)
+
+    entry = Outbox(path).get("7")
+    assert len(Outbox(path)) == 1
+    assert entry["body"] == "three"
+    assert entry["fields"] == ["body", "labels"]
+    assert entry["is_draft"] is False  # The publish asked for in between still happens
+
+def test_outbox_keeps_entries_saved_during_replay():
+    """Scenario: A post edited while its queued insert was in flight stays queued as a patch."""
+    outbox = Outbox()
+    sent = outbox.put("local-1", None, "T", "one", [], ["title", "body", "labels"], True)
+    in_flight = dict(sent)
+    outbox.put("local-1", None, "T", "two", [], ["title", "body", "labels"], True)
+
+    outbox.done(in_flight, "99")
+
+    assert outbox.get("99")["post_id"] == "99"
+    assert outbox.get("99")["body"] == "two"
+
+def test_offline_saves_queue_then_replay_in_one_batch(robot):
+    """Scenario: Writing on a plane, saving twice, then landing sends one insert in one batch call."""
+    robot.title_field.text = "Plane post"
+    robot.body_field.text = "Draft one"
+    robot.save_post()
+    robot.body_field.text = "Draft two"
+    robot.save_post()
+
+    assert robot.is_offline
+    assert len(robot.outbox) == 1
+    assert ('class:status-warn', " ⇪1") in robot.get_status_text()
+
+    batches = []
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback, batches)
+    service.posts.return_value.insert.return_value.execute.return_value = {'id': '501', 'status': 'DRAFT'}
+    robot.is_offline, robot.service = False, service
+
+    robot.retry_outbox()
+
+    body = service.posts.return_value.insert.call_args.kwargs["body"]
+    assert body["content"] == robot._parse_markdown("Draft two")
+    assert batches == [1]
+    assert len(robot.outbox) == 0
+    assert robot.current_post_id == '501'
+    assert not robot.is_dirty()
+
+def test_failed_publish_batch_keeps_the_insert_that_went_out(robot):
+    """Scenario: The publish batch call fails after the insert batch; only the publish stays queued."""
+    robot.outbox.put("local-1", None, "New", "Body", [], ["title", "body", "labels"], True)
+    robot.outbox.put("5", "5", "Old", "Body", [], [], False)
+
+    batches = []
+    def new_batch(callback):
+        batch = FakeBatch(callback, batches)
+        if batches:  # The second call: the publishes
+            batch.execute = MagicMock(side_effect=OSError("connection reset"))
+        return batch
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = new_batch
+    service.posts.return_value.insert.return_value.execute.return_value = {'id': '501', 'status': 'DRAFT'}
+    robot.is_offline, robot.service = False, service
+
+    robot.retry_outbox()
+
+    assert service.posts.return_value.insert.call_count == 1
+    assert [entry["key"] for entry in robot.outbox.pending()] == ["5"]
+    assert robot.last_spell_report == robot._t("outbox_error").format(count=1)
+
+def test_unattended_retry_never_opens_the_consent_flow(robot, tmp_path, monkeypatch):
+    """Scenario: The periodic retry after a reconnect only refreshes the stored token, even if it is gone."""
+    robot.title_field.text, robot.body_field.text = "Queued", "Body"
+    robot.save_post()
+    robot.test_mode = False  # authenticate() skips test mode
+    robot.token_path = str(tmp_path / "token.json")
+    (tmp_path / "token.json").write_text("{}")
+    load_credentials = MagicMock(return_value=None)  # Token no longer usable
+    monkeypatch.setattr("blim.load_credentials", load_credentials)
+
+    robot.retry_outbox()
+
+    load_credentials.assert_called_once_with(robot.token_path, robot.secrets_path, interactive=False)
+    assert len(robot.outbox) == 1
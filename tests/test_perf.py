@@ -0,0 +1,85 @@
+import gc
+import json
+import tracemalloc
+import pytest
+from unittest.mock import MagicMock
+from blim import BlimEditor, build_application
+from core.perf import percentile
+from core.replay import replay, typing
+
+@pytest.fixture
+def robot():
+    """Builds a Robot User in test mode."""
+    editor = BlimEditor(test_mode=True)
+    yield editor
+    editor.perf.disable()
+
+def test_perf_command_hooks_in_and_out(robot):
+    """Scenario: :perf shows the overlay and starts measuring; a second :perf removes every hook."""
+    robot.handle_normal_input(MagicMock(text=":perf"))
+    assert robot.show_perf and robot.perf.enabled
+    assert robot.api.on_timed is not None
+    assert "frame" in "\n".join(robot.perf.overlay_lines())
+
+    robot.handle_normal_input(MagicMock(text=":perf"))
+    assert not robot.show_perf and not robot.perf.enabled
+    assert robot.api.on_timed is None
+    assert robot.perf._gc_callback not in gc.callbacks
+
+def test_frames_record_render_and_lexer_cost(robot):
+    """Scenario: While typing with the overlay on, every frame logs its render and lexer time."""
+    robot.body_field.text = "\n".join(f"Line {i} with **bold** text" for i in range(50))
+    robot.show_perf = True
+
+    def make_app(**io):
+        app = build_application(robot, **io)
+        robot.perf.enable(app, robot.api)
+        return app
+    replay(make_app, typing("abc"))
+
+    render, lexer, lines, fragments = robot.perf.frames[0]  # The first frame lexes every visible line
+    assert render > lexer > 0
+    assert lines > 0 and fragments >= lines
+    assert robot.perf.snapshot()["render"]["count"] == len(robot.perf.frames) >= 4
+
+def test_gc_pauses_and_api_calls_are_counted(robot):
+    """Scenario: A collection and a Blogger job both show up in the metrics."""
+    robot.handle_normal_input(MagicMock(text=":perf"))
+    gc.collect()
+    robot.api.submit("prefetch:42", lambda: None)  # No loop here: runs inline
+
+    snapshot = robot.perf.snapshot()
+    assert snapshot["gc"]["pauses"] >= 1 and snapshot["gc"]["total"] > 0
+    assert snapshot["api"]["prefetch"]["count"] == 1
+
+def test_perf_dump_writes_json(robot, tmp_path):
+    """Scenario: :perf dump FILE keeps the path's case and writes summary, frames and API samples."""
+    path = tmp_path / "Perf.json"
+    robot.handle_normal_input(MagicMock(text=":perf"))
+    robot.handle_normal_input(MagicMock(text=":perf mem"))
+    assert robot.perf.memory_traced
+
+    robot.handle_normal_input(MagicMock(text=f":perf dump {path}"))
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert set(data) == {"recorded", "summary", "frames", "api_calls"}
+    assert data["summary"]["memory"]["current"] > 0
+    assert robot.last_spell_report == robot._t("perf_dumped").format(path=path)
+
+def test_perf_mem_leaves_outside_tracing_alone(robot):
+    """Scenario: With tracemalloc already started elsewhere, :perf mem says so and never stops it."""
+    tracemalloc.start()
+    try:
+        robot.handle_normal_input(MagicMock(text=":perf mem"))
+        assert robot.last_spell_report == robot._t("perf_mem_external")
+        robot.handle_normal_input(MagicMock(text=":perf"))  # Overlay off
+        assert tracemalloc.is_tracing() and not robot.perf.owns_memory_trace
+    finally:
+        tracemalloc.stop()
+
+def test_percentiles_use_nearest_rank():
+    """Scenario: p50/p90 of ten samples are the 5th and 9th smallest."""
+    values = [i / 100 for i in range(10, 0, -1)]
+    assert percentile(values, 50) == 0.05
+    assert percentile(values, 90) == 0.09
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import MagicMock
+from blim import BlimEditor, parse_cli, run_publish_cli
+from core.markdown import render_html
+from core.pipeline import split_front_matter
+
+@pytest.fixture
+def posts_dir(tmp_path):
+    (tmp_path / "road-trips.md").write_text("---\ntitle: Road trips\nlabels: [travel, asia]\n---\n\nSome **bold** miles.\n", encoding="utf-8")
+    (tmp_path / "known.md").write_text("---\ntitle: Known\nid: 77\n---\nAlready on Blogger.\n", encoding="utf-8")
+    (tmp_path / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+    (tmp_path / "notes.json").write_text("{}", encoding="utf-8")
+    return tmp_path
+
+class FakeBatch:
+    def __init__(self, callback):
+        self.callback, self.requests = callback, []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+def test_front_matter_is_parsed_and_stripped():
+    """Scenario: Title, labels and id come from the header; the body starts after it."""
+    meta, body = split_front_matter("---\ntitle: \"Hi\"\ntags: a, b\nid: 9\n---\n\nText")
+    assert meta == {"title": "Hi", "labels": ["a", "b"], "post_id": "9"}
+    assert body == "Text"
+    assert split_front_matter("--- not a header\ntext") == ({}, "--- not a header\ntext")
+
+def test_dry_run_writes_html_and_reports_failures(posts_dir, capsys):
+    """Scenario: A dry run converts every file in a process pool and names the one it couldn't read."""
+    code = run_publish_cli(parse_cli(["publish", str(posts_dir), "--dry-run", "--workers", "2"]))
+
+    html = (posts_dir / "html" / "road-trips.html").read_text(encoding="utf-8")
+    assert render_html("Some **bold** miles.") in html
+    assert "labels: travel, asia" in html
+    assert not (posts_dir / "html" / "notes.html").exists()
+    assert code == 1
+    assert any(line.startswith("  FAIL") and "broken.md" in line for line in capsys.readouterr().out.splitlines())
+
+def test_publish_inserts_new_files_and_records_their_ids(posts_dir):
+    """Scenario: New files become drafts and get their id written back; known ids are patched."""
+    (posts_dir / "broken.md").unlink()
+    editor = BlimEditor(test_mode=True)
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+    posts = service.posts.return_value
+    posts.insert.return_value.execute.return_value = {'id': '501'}
+    posts.patch.return_value.execute.return_value = {'id': '77'}
+    editor.authenticate = lambda: service
+
+    code = run_publish_cli(parse_cli(["publish", str(posts_dir), "--workers", "1"]), editor=editor)
+
+    assert code == 0
+    assert posts.insert.call_args.kwargs["isDraft"] is True
+    assert posts.patch.call_args.kwargs["postId"] == "77"
+    assert split_front_matter((posts_dir / "road-trips.md").read_text(encoding="utf-8"))[0]["post_id"] == "501"
+
+def test_failed_batch_keeps_the_ids_of_posts_already_inserted(tmp_path, capsys):
+    """Scenario: The second batch call of a 60-file run fails; the first 50 files still get their ids."""
+    from unittest.mock import patch
+    for n in range(60):
+        (tmp_path / f"post-{n:02}.md").write_text(f"Post {n}", encoding="utf-8")
+    editor = BlimEditor(test_mode=True)
+    service = MagicMock()
+    calls = []
+
+    def new_batch(callback):
+        batch = FakeBatch(callback)
+        calls.append(batch)
+        if len(calls) == 2:
+            batch.execute = MagicMock(side_effect=OSError("connection reset"))
+        return batch
+    service.new_batch_http_request.side_effect = new_batch
+    service.posts.return_value.insert.side_effect = lambda **kwargs: MagicMock(
+        **{"execute.return_value": {'id': f"id-{kwargs['body']['title']}"}})
+    editor.authenticate = lambda: service
+
+    with patch('core.pipeline.BULK_PAUSE', 0):
+        code = run_publish_cli(parse_cli(["publish", str(tmp_path), "--workers", "1"]), editor=editor)
+
+    assert code == 1
+    ids = [split_front_matter((tmp_path / f"post-{n:02}.md").read_text(encoding="utf-8"))[0].get("post_id")
+           for n in range(60)]
+    assert ids[:50] == [f"id-post {n:02}" for n in range(50)]
+    assert ids[50:] == [None] * 10
+    out = capsys.readouterr().out
+    assert out.count("  FAIL") == 10 and "connection reset" in out
+    assert "50 ok, 10 failed" in out
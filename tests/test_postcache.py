@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import MagicMock
+from core.postcache import PostStore
+from blim import BlimEditor
+
+POST = {'id': '7', 'title': 'Cached', 'status': 'LIVE', 'labels': ['a', 'b'],
+        'content': '<p>Hello <b>there</b></p>', 'etag': '"v1"', 'updated': '2026-01-01T00:00:00Z'}
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode (in-memory post store)."""
+    editor = BlimEditor(test_mode=True)
+    editor.blog_id = "123"
+    return editor
+
+def test_store_round_trip(tmp_path):
+    store = PostStore(str(tmp_path / "posts.db"))
+    store.put("123", POST)
+    store.set_markdown("123", "7", "Hello **there**")
+    store.close()
+
+    store = PostStore(str(tmp_path / "posts.db"))
+    post = store.get("123", "7")
+    assert post['labels'] == ['a', 'b'] and post['etag'] == '"v1"'
+    assert post['markdown'] == "Hello **there**"
+    assert store.list_posts("123") == [{'id': '7', 'title': 'Cached', 'status': 'LIVE'}]
+    assert store.get("other-blog", "7") is None
+
+def test_cached_post_opens_offline(robot):
+    """Scenario: A post edited yesterday opens with no network at all."""
+    robot.post_store.put("123", POST)
+    robot.is_offline = True
+
+    robot.fetch_and_load("7")
+
+    assert robot.title_field.text == "Cached"
+    assert robot.body_field.text == "Hello **there**"
+    assert robot.tags_field.text == "a, b"
+    assert not robot.is_dirty()
+
+def test_revalidation_sends_etag_and_keeps_cache_on_304(robot):
+    robot.post_store.put("123", POST, "Hello **there**")
+    robot.is_offline = False
+    robot.service = MagicMock()
+    request = robot.service.posts.return_value.get.return_value
+    request.headers = {}
+    not_modified = Exception("Not Modified")
+    not_modified.resp = MagicMock(status=304)
+    request.execute.side_effect = not_modified
+
+    robot.fetch_and_load("7")
+
+    assert request.headers['If-None-Match'] == '"v1"'
+    assert robot.body_field.text == "Hello **there**"
+    assert robot.last_spell_report == robot._t("loaded_cached")
+
+def test_revalidation_applies_newer_post(robot):
+    robot.post_store.put("123", POST, "Hello **there**")
+    robot.is_offline = False
+    robot.service = MagicMock()
+    request = robot.service.posts.return_value.get.return_value
+    request.headers = {}
+    request.execute.return_value = dict(POST, content='<p>Updated</p>', etag='"v2"')
+
+    robot.fetch_and_load("7")
+
+    assert robot.body_field.text == "Updated"
+    assert robot.post_store.get("123", "7")['etag'] == '"v2"'
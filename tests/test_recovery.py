@@ -0,0 +1,66 @@
+import json
+import pytest
+from core.recovery import RecoveryJournal
+from blim import BlimEditor
+
+@pytest.fixture
+def robot(tmp_path):
+    """Builds a fresh Robot User in test mode with its recovery files in tmp."""
+    editor = BlimEditor(test_mode=True)
+    editor.recovery_path = str(tmp_path / "recovery.json")
+    return editor
+
+def test_unchanged_buffer_writes_nothing(robot, tmp_path):
+    """Scenario: The 30s tick on an idle editor never touches the disk."""
+    robot.auto_save_recovery()
+    assert not (tmp_path / "recovery.json").exists()
+
+    robot.body_field.text = "Hello"
+    robot.auto_save_recovery()
+    before = (tmp_path / "recovery.json").stat().st_mtime_ns
+    robot.auto_save_recovery()
+    assert (tmp_path / "recovery.json").stat().st_mtime_ns == before
+
+def test_edits_are_appended_and_replayed(robot, tmp_path):
+    """Scenario: After the first snapshot only deltas hit the disk, and :restore replays them."""
+    robot.title_field.text = "Draft"
+    robot.body_field.text = "A long post. " * 100
+    robot.auto_save_recovery()
+    snapshot = (tmp_path / "recovery.json").read_text()
+
+    robot.body_field.text = robot.body_field.text + "One more line."
+    robot.auto_save_recovery()
+    robot.title_field.text = "Draft v2"
+    robot.auto_save_recovery()
+
+    assert (tmp_path / "recovery.json").read_text() == snapshot
+    entries = (tmp_path / "recovery.journal").read_text().splitlines()
+    assert [json.loads(e)["t"] for e in entries] == ["One more line.", " v2"]
+
+    fresh = BlimEditor(test_mode=True)
+    fresh.recovery_path = robot.recovery_path
+    fresh.load_recovery()
+    assert fresh.title_field.text == "Draft v2"
+    assert fresh.body_field.text == robot.body_field.text
+
+def test_torn_journal_write_is_ignored(tmp_path):
+    """Scenario: A crash mid-append loses only the torn entry."""
+    journal = RecoveryJournal(str(tmp_path / "recovery.json"))
+    journal.record("T", "abc")
+    journal.record("T", "abcdef")
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 1, "f": "body", "s": 0, "e"')
+
+    assert journal.load() == {"title": "T", "body": "abcdef"}
+
+def test_compaction_starts_a_new_snapshot(tmp_path, monkeypatch):
+    import core.recovery
+    monkeypatch.setattr(core.recovery, "COMPACT_EVERY", 3)
+    journal = RecoveryJournal(str(tmp_path / "recovery.json"))
+    for i in range(6):
+        journal.record("", "x" * (i + 1))
+
+    data = json.loads((tmp_path / "recovery.json").read_text())
+    assert data["body"] == "xxxxx" and data["seq"] == 2
+    assert journal.load()["body"] == "xxxxxx"
+    assert not (tmp_path / "recovery.json.tmp").exists()
@@ -0,0 +1,57 @@
+import os
+import pytest
+from blim import BlimEditor, build_application
+from core.replay import (KEYSTROKE_BUDGET, SPIKE_BUDGET, KeyRecorder, browsing, load_trace, paste, replay,
+                         scrolling, spell_toggle, typing)
+
+BODY = "\n".join(f"Line {i} with some **bold** words and a [link](https://example.com)." for i in range(300))
+
+@pytest.fixture
+def robot():
+    """Builds a Robot User in test mode, editing a 300-line post with a few cached posts to browse."""
+    editor = BlimEditor(test_mode=True)
+    editor.blog_id = "123"
+    for i in range(5):
+        editor.post_store.put_summary("123", {'id': str(i), 'title': f"Post {i}", 'status': 'LIVE'})
+    editor.body_field.text = BODY
+    yield editor
+    editor.api.shutdown()
+    editor.spell_worker.shutdown()
+
+def _app(editor, recorder=None):
+    def make_app(**io):
+        app = build_application(editor, **io)
+        return recorder.attach(app) if recorder else app
+    return make_app
+
+def test_every_step_is_timed_to_its_frame(robot):
+    """Scenario: A session of typing, paste, scrolling, Ctrl+D and browsing gets one latency per step."""
+    steps = typing("Hi\n") + paste("pasted *words*") + scrolling(3) + spell_toggle() + browsing(2)
+
+    result = replay(_app(robot), steps, trace_memory=True)
+
+    assert [label for label, _ in result.latencies] == [label for label, _ in steps]
+    assert robot.body_field.text.startswith("Hi\npasted *words*Line 0")  # Typed at the cursor, top of the post
+    assert not robot.show_browser and not robot.show_spelling_errors
+    assert result.peak_memory > 0 and result.worst_step[0] in {"type", "paste", "scroll", "ctrl-d", "browser"}
+    assert "browser" in result.report() and "peak memory" in result.report()
+
+def test_typing_has_no_gross_latency_regression(robot):
+    """Scenario: Typing a sentence into a 300-line post times every key, and none is wildly over budget."""
+    sentence = "The quick brown fox jumps over the lazy dog."
+    result = replay(_app(robot), typing(sentence))
+    stats = result.percentiles("type")
+    assert len(result.latencies) == len(sentence) and stats["p50"] <= stats["p99"]
+    # Only catches gross regressions; the real budget is held by benchmarks/bench_replay.py
+    slack = float(os.environ.get("BLIM_LATENCY_SLACK", "10"))
+    assert stats["p50"] < KEYSTROKE_BUDGET * slack
+    assert stats["p99"] < SPIKE_BUDGET * slack
+
+def test_recorded_session_replays_the_same_keys(robot, tmp_path):
+    """Scenario: --record-keys writes a trace that load_trace turns back into the same steps."""
+    path = tmp_path / "session.jsonl"
+    steps = typing("ab") + paste("two\nlines")
+
+    replay(_app(robot, KeyRecorder(str(path))), steps)
+
+    assert load_trace(path) == steps
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+import pytest
+from core.spelling import SpellWorker, find_misspelled
+from blim import BlimEditor
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+def test_worker_runs_jobs_off_the_event_loop():
+    """Scenario: A slow dictionary load doesn't block the loop."""
+    worker = SpellWorker()
+    results = []
+
+    def slow_load():
+        time.sleep(0.2)
+        return threading.current_thread().name
+
+    async def session():
+        worker.submit("load", slow_load, on_done=results.append)
+        ticks = 0
+        while not results:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return ticks
+
+    ticks = asyncio.run(session())
+    worker.shutdown()
+
+    assert ticks > 5  # The loop kept running while the job was in flight
+    assert results[0].startswith("blim-spell")
+
+def test_worker_drops_stale_results():
+    """Scenario: Switching :spa then :eng only publishes the latest load."""
+    worker = SpellWorker()
+    results = []
+
+    async def session():
+        worker.submit("load", lambda: (time.sleep(0.1), "es")[1], on_done=results.append)
+        worker.submit("load", lambda: "en", on_done=results.append)
+        while worker.is_busy("load"):
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.15)
+
+    asyncio.run(session())
+    worker.shutdown()
+
+    assert results == ["en"]
+
+def test_spellcheck_report_is_published(robot):
+    robot.spell = type("FakeSpell", (set,), {"unknown": lambda self, w: set(w) - self})({"hello"})
+    robot.body_field.text = "hello wrld"
+
+    robot.run_spellcheck()
+
+    assert "wrld" in robot.last_spell_report
+
+def test_find_misspelled_lowercases_words():
+    spell = type("FakeSpell", (set,), {"unknown": lambda self, w: set(w) - self})({"hello"})
+    assert find_misspelled(spell, "Hello Wrld") == {"wrld"}
+
+def test_compiled_index_lookup(tmp_path):
+    """Scenario: A compiled index answers membership straight from the mmap."""
+    from core.dictionary import build_index, WordIndex
+    path = str(tmp_path / "words.bdx")
+    build_index(["hola", "corazón", "árbol", "zeta", "hola"], path)
+
+    index = WordIndex(path)
+    try:
+        assert len(index) == 4
+        assert "corazón" in index and "zeta" in index and "árbol" in index
+        assert "corazon" not in index and "" not in index
+    finally:
+        index.close()
+
+def test_custom_words_are_compiled_and_refreshed(tmp_path):
+    """Scenario: Words from custom_dictionary.txt and :add are recognised."""
+    import os
+    from core.dictionary import build_index, CompactDictionary, ensure_custom_index
+    custom = tmp_path / "custom_dictionary.txt"
+    custom.write_text("blimpy\n", encoding="utf-8")
+    lang_index = str(tmp_path / "xx.bdx")
+    build_index(["the", "cat"], lang_index)
+
+    spell = CompactDictionary([lang_index, ensure_custom_index(str(custom))])
+    assert spell.unknown(["The", "cat", "blimpy", "nomagev", "42"]) == {"nomagev"}
+
+    spell.load_words(["Nomagev"])
+    assert "nomagev" in spell
+    spell.close()
+
+    # Appending to the text file makes the next open recompile the custom index
+    with open(custom, "a", encoding="utf-8") as f:
+        f.write("prompt\n")
+    index_path = ensure_custom_index(str(custom))
+    os.utime(index_path, (0, 0))
+    spell = CompactDictionary([lang_index, ensure_custom_index(str(custom))])
+    assert "prompt" in spell
+    spell.close()
+
+def test_replaced_dictionary_is_unmapped(robot, tmp_path):
+    """Scenario: Switching dictionaries, then turning Ctrl+D off, closes each index that was mapped."""
+    from core.dictionary import build_index, CompactDictionary
+    path = str(tmp_path / "xx.bdx")
+    build_index(["the", "cat"], path)
+    first, second = CompactDictionary([path]), CompactDictionary([path])
+    first_maps, second_maps = [i._mm for i in first._indexes], [i._mm for i in second._indexes]
+
+    robot._install_dictionary(first)
+    robot._install_dictionary(second)  # No event loop here: the worker closes it inline
+    assert all(mm.closed for mm in first_maps) and not any(mm.closed for mm in second_maps)
+
+    robot._drop_dictionary()
+    assert robot.spell is None and all(mm.closed for mm in second_maps)
+
+def test_verdicts_resolve_in_one_batch_and_follow_the_dictionary():
+    """Scenario: Common words are looked up once; :add and new dictionaries refresh verdicts."""
+    from core.spelling import VerdictCache
+    calls = []
+
+    class FakeSpell(set):
+        def unknown(self, words):
+            calls.append(set(words))
+            return {w for w in words if w not in self}
+
+    spell = FakeSpell({"the", "cat"})
+    verdicts = VerdictCache()
+    verdicts.resolve(spell, ["The", "cat", "blimpy", "the"])
+
+    assert calls == [{"the", "cat", "blimpy"}]
+    assert verdicts.is_unknown(spell, "blimpy") and not verdicts.is_unknown(spell, "THE")
+    assert len(calls) == 1
+
+    verdicts.mark_known(["blimpy"])
+    assert not verdicts.is_unknown(spell, "blimpy")
+
+    other = FakeSpell({"el", "gato"})
+    assert verdicts.is_unknown(other, "cat")
+    assert len(verdicts) == 1
@@ -0,0 +1,45 @@
+import os
+import time
+import pytest
+from prompt_toolkit.input import create_pipe_input
+from blim import BlimEditor, STARTUP_BUDGET, STARTUP_MARKS, build_application, startup_report
+from core.assets import HELP_TEXT
+from core.replay import headless_output
+
+@pytest.fixture
+def robot():
+    """Builds a fresh Robot User in test mode."""
+    return BlimEditor(test_mode=True)
+
+def test_rare_panes_are_built_on_first_use(robot):
+    """Scenario: Opening the editor builds neither help, browser nor warning prompt."""
+    assert robot._help_field is None and robot._browser_field is None and robot._warning_field is None
+
+    robot.apply_language('en')
+    assert robot._help_field is None
+    assert robot.help_field.text == HELP_TEXT['en'].strip()  # Built in the current language
+
+def test_first_frame_is_marked_after_every_phase():
+    """Scenario: Drawing the first frame records it after the imports, and --profile-startup lists both in order."""
+    with create_pipe_input() as pipe:
+        start = time.perf_counter()
+        editor = BlimEditor(test_mode=True)
+        app = build_application(editor, input=pipe, output=headless_output())  # Big enough to draw the whole editor
+        app.after_render += lambda _app: app.future.done() or app.exit()  # Quit once drawn
+        app.run()
+        elapsed = time.perf_counter() - start
+
+    names, times = [name for name, _ in STARTUP_MARKS], [t for _, t in STARTUP_MARKS]
+    assert names[:2] == ["start", "imports"] and names[-1] == "first frame"
+    assert times == sorted(times) and times[-1] >= start
+    report = startup_report(budget=STARTUP_BUDGET)
+    assert report.index("imports") < report.index("first frame") < report.index("time to first keystroke")
+    # Only catches gross regressions; the real budget is held by benchmarks/bench_startup.py
+    assert elapsed < STARTUP_BUDGET * float(os.environ.get("BLIM_STARTUP_SLACK", "10"))
+
+def test_startup_report_flags_a_slow_start():
+    """Scenario: --profile-startup shows each phase and says when the budget was blown."""
+    marks = [("start", 0.0), ("imports", 0.2), ("editor", 0.25), ("first frame", 0.9)]
+    report = startup_report(marks, budget=0.5)
+    assert "imports" in report and "+  200.0 ms" in report
+    assert "900.0 ms (budget 500 ms): OVER BUDGET" in report
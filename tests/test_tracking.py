@@ -0,0 +1,76 @@
+import random
+import pytest
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.document import Document
+from core.textdiff import changed_span, word_count_delta
+from core.tracking import WordCounter
+
+def test_changed_span_finds_edited_region():
+    assert changed_span("hello world", "hello world") is None
+    assert changed_span("hello world", "hello big world") == (6, 6, 10)
+    assert changed_span("aaaa", "aa") == (2, 4, 2)
+
+def test_word_count_delta_matches_full_split():
+    """Scenario: Random edits never drift from len(text.split())."""
+    rng = random.Random(7)
+    text = "one two  three\nfour five"
+    for _ in range(500):
+        pos = rng.randint(0, len(text))
+        cut = rng.randint(0, 3)
+        new = text[:pos] + rng.choice(["", " ", "x", "ab c", "\n", "  z"]) + text[pos + cut:]
+        assert len(text.split()) + word_count_delta(text, new) == len(new.split())
+        text = new
+
+def test_word_counter_follows_buffer_edits():
+    """Scenario: Typing, deleting and reset() all keep the count exact."""
+    buff = Buffer()
+    counter = WordCounter(buff)
+    assert counter.count == 0
+
+    buff.insert_text("Hello wor")
+    buff.insert_text("ld and more")
+    assert counter.count == len(buff.text.split())
+
+    buff.delete_before_cursor(count=9)
+    assert counter.count == len(buff.text.split())
+
+    buff.reset(Document(text="a b c d"))
+    assert counter.count == 4
+
+def test_word_counter_sprint_gain():
+    buff = Buffer(document=Document("already here"))
+    counter = WordCounter(buff)
+    counter.mark()
+    buff.insert_text(" three more words")
+    assert counter.gain() == 3
+    assert counter.reading_minutes(225) == 1
+
+def test_dirty_tracker_caches_verdict_per_generation():
+    """Scenario: Idle frames don't re-hash the document; edits and saves do."""
+    from core.tracking import DirtyTracker
+    buff = Buffer()
+    tracker = DirtyTracker(buff)
+    assert not tracker.is_dirty()
+
+    buff.insert_text("Draft text")
+    assert tracker.is_dirty()
+    generation = tracker.generation
+    assert tracker.is_dirty() and tracker.generation == generation
+
+    tracker.mark_saved("Draft text  \n")
+    assert not tracker.is_dirty()
+
+    buff.insert_text("!")
+    assert tracker.is_dirty()
+    buff.delete_before_cursor()
+    assert not tracker.is_dirty()
+
+def test_dirty_tracker_sees_buffer_reset():
+    from core.tracking import DirtyTracker
+    buff = Buffer()
+    tracker = DirtyTracker(buff)
+    tracker.mark_saved("loaded post")
+    buff.reset(Document(text="loaded post"))
+    assert not tracker.is_dirty()
+    buff.reset(Document(text="other post"))
+    assert tracker.is_dirty()